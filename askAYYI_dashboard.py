@@ -1,11 +1,14 @@
 import streamlit as st
 import json
 import os
+import tempfile
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 from io import BytesIO
 from datetime import datetime
 import random
+import secrets
 import math  # For ceiling
 
 # ======================================
@@ -180,12 +183,262 @@ CURRENCY_SYMBOLS = {
 
 SUPPORTED_CURRENCIES = ["ZAR", "EUR", "USD", "AED"]
 
+# Overhead applied to non-ZAR amounts (30% overhead + 15% extra)
+INTERNATIONAL_FACTOR = 1.3 * 1.15
+
 MIN_PLAN_DURATION = {
     "Basic": 3,
     "Advanced": 3,
     "Enterprise": 3
 }
 
+# Plans limited to a single AI Agent
+SINGLE_AGENT_PLANS = frozenset(("Basic", "Advanced"))
+
+# Float-valued plan fields edited in the Admin tab, with their fallbacks
+PLAN_FLOAT_DEFAULTS = {
+    "base_msg_cost": 0.05,
+    "msg_markup": 2.0,
+    "base_min_cost": 0.40,
+    "min_markup": 2.0,
+    "contingency_percent": 2.5,
+}
+
+# Plan Assignment messages (bound str.format, reused every run)
+PLAN_TMPL = "**Recommended Plan:** {}".format
+USAGE_TMPL = "**Estimated Monthly Usage**: ~{:,} messages, ~{:,} minutes.".format
+REF_TMPL = "Your configuration has been saved! **Reference:** {}".format
+
+# Quotation HTML (unindented, no blank lines, so one st.markdown keeps it raw HTML)
+QUOTE_GREETING_HTML = """<div class="steve-jobs-style">
+<p>Hello <span class="highlight">Client</span>,</p>
+<p>We appreciate your interest in askAYYI. Below is a simple breakdown of your monthly and once-off costs.</p>
+</div>"""
+QUOTE_MONTHLY_TMPL = """<div class="card">
+<h4>Monthly Cost</h4>
+<p style="font-size:1.2em;">
+{sym}{cost:,}
+<br/><span style="font-size:0.85em;">
+(Includes messages, minutes, and {hours} monthly maintenance hrs)
+</span>
+</p>
+</div>""".format
+QUOTE_SETUP_TMPL = """<div class="card">
+<h4>One-Time Setup</h4>
+<p style="font-size:1.2em;">
+{sym}{cost:,}
+<br/><span style="font-size:0.85em;">
+(Covers necessary setup & on-boarding)
+</span>
+</p>
+</div>""".format
+QUOTE_ADDON_TMPL = """<div class="card">
+<h4>Additional Assistant(s)</h4>
+<p style="font-size:1.2em;">
+{agents} total<br/>
++{msgs} msgs & +{mins} mins<br/>
+{fee_line}</p>
+</div>""".format
+QUOTE_ADDON_FEE_TMPL = "<strong>Monthly Add-On: {sym}{cost:,}</strong>".format
+QUOTE_OVERAGES_TMPL = """<div class="card">
+<h4>Possible Overage Charges</h4>
+<p style="font-size:1.1em;">
+{lines}</p>
+</div>""".format
+QUOTE_EXTRA_MSGS_TMPL = "- Extra Messages: {used:,} => {sym}{cost:,}<br/>".format
+QUOTE_EXTRA_MINS_TMPL = "- Extra Minutes: {used:,} => {sym}{cost:,}".format
+QUOTE_TOTAL_TMPL = """<div class="card">
+<h4>Total Commitment</h4>
+<p style="font-size:1.2em;">
+{sym}{cost:,} <br/>
+Over {months} months + Setup
+</p>
+</div>""".format
+QUOTE_INCLUDED_TMPL = """<div class="steve-jobs-style">
+<p>Each month, you'll have ~<span class="highlight">{msgs:,}</span> messages 
+and <span class="highlight">{mins:,}</span> minutes included.</p>
+</div>""".format
+
+# ======================================
+# CALL CENTRE QUICK-SET DEFAULTS
+# ======================================
+# Keyed by quick-set choice, then by the session_state key each value lands in,
+# so a quick-set button is a single st.session_state.update(...).
+
+# A. PERSONNEL DEFAULTS
+PERSONNEL_BY_CHOICE = {
+    "avg": {
+        "callcentre_staff_count": 10,
+        "callcentre_salary_per_agent": 8823,
+        "callcentre_pension_percent": 7,
+        "callcentre_medical_aid_per_agent": 2000,
+        "callcentre_bonus_per_agent": 1500,  # annual
+        "callcentre_benefits_per_agent": 500,
+        "callcentre_recruitment_per_agent": 3000,
+        "callcentre_training_per_agent": 1000,
+        "callcentre_trainer_salary": 25000
+    },
+    "low": {
+        "callcentre_staff_count": 10,
+        "callcentre_salary_per_agent": 6572,
+        "callcentre_pension_percent": 7,
+        "callcentre_medical_aid_per_agent": 1000,
+        "callcentre_bonus_per_agent": 1000,
+        "callcentre_benefits_per_agent": 300,
+        "callcentre_recruitment_per_agent": 2000,
+        "callcentre_training_per_agent": 800,
+        "callcentre_trainer_salary": 20000
+    },
+    "high": {
+        "callcentre_staff_count": 10,
+        "callcentre_salary_per_agent": 12920,
+        "callcentre_pension_percent": 7,
+        "callcentre_medical_aid_per_agent": 3000,
+        "callcentre_bonus_per_agent": 2000,
+        "callcentre_benefits_per_agent": 700,
+        "callcentre_recruitment_per_agent": 4000,
+        "callcentre_training_per_agent": 1200,
+        "callcentre_trainer_salary": 30000
+    },
+    "zero": {
+        "callcentre_staff_count": 0,
+        "callcentre_salary_per_agent": 0,
+        "callcentre_pension_percent": 0,  # "0" means no pension
+        "callcentre_medical_aid_per_agent": 0,
+        "callcentre_bonus_per_agent": 0,
+        "callcentre_benefits_per_agent": 0,
+        "callcentre_recruitment_per_agent": 0,
+        "callcentre_training_per_agent": 0,
+        "callcentre_trainer_salary": 0
+    }
+}
+
+# B. TECHNOLOGY DEFAULTS
+TECH_BY_CHOICE = {
+    "avg": {
+        "callcentre_callcenter_software": 5000,
+        "callcentre_licensing_per_user": 500,
+        "callcentre_crm_sub_per_user": 1500,
+        "callcentre_hardware_cost_station": 15000,
+        "callcentre_depreciation_years": 3,
+        "callcentre_repair_per_device": 800,
+        "callcentre_phone_bill_per_agent": 1000,
+        "callcentre_call_cost_per_minute": 0.75,
+        "callcentre_internet_services": 8000
+    },
+    "low": {
+        "callcentre_callcenter_software": 3500,
+        "callcentre_licensing_per_user": 400,
+        "callcentre_crm_sub_per_user": 1200,
+        "callcentre_hardware_cost_station": 12000,
+        "callcentre_depreciation_years": 3,
+        "callcentre_repair_per_device": 600,
+        "callcentre_phone_bill_per_agent": 800,
+        "callcentre_call_cost_per_minute": 0.60,
+        "callcentre_internet_services": 6000
+    },
+    "high": {
+        "callcentre_callcenter_software": 6500,
+        "callcentre_licensing_per_user": 600,
+        "callcentre_crm_sub_per_user": 1800,
+        "callcentre_hardware_cost_station": 18000,
+        "callcentre_depreciation_years": 3,
+        "callcentre_repair_per_device": 1000,
+        "callcentre_phone_bill_per_agent": 1200,
+        "callcentre_call_cost_per_minute": 0.90,
+        "callcentre_internet_services": 10000
+    },
+    "zero": {
+        "callcentre_callcenter_software": 0,
+        "callcentre_licensing_per_user": 0,
+        "callcentre_crm_sub_per_user": 0,
+        "callcentre_hardware_cost_station": 0,
+        "callcentre_depreciation_years": 1,  # can't do zero years
+        "callcentre_repair_per_device": 0,
+        "callcentre_phone_bill_per_agent": 0,
+        "callcentre_call_cost_per_minute": 0.0,
+        "callcentre_internet_services": 0
+    }
+}
+
+# C. FACILITY DEFAULTS
+FACILITY_BY_CHOICE = {
+    "avg": {
+        "callcentre_office_rent_month": 7500,
+        "callcentre_electricity_cost_month": 6000,
+        "callcentre_water_cost_month": 2000
+    },
+    "low": {
+        "callcentre_office_rent_month": 5000,
+        "callcentre_electricity_cost_month": 4500,
+        "callcentre_water_cost_month": 2000
+    },
+    "high": {
+        "callcentre_office_rent_month": 10900,  # e.g. 218*50=10900 for high
+        "callcentre_electricity_cost_month": 7500,
+        "callcentre_water_cost_month": 2000
+    },
+    "zero": {
+        "callcentre_office_rent_month": 0,
+        "callcentre_electricity_cost_month": 0,
+        "callcentre_water_cost_month": 0
+    }
+}
+
+# Fallback values for every Call Centre input, keyed by session_state name
+CC_DEFAULTS = {
+    "callcentre_staff_count": 10,
+    "callcentre_salary_per_agent": 8000,
+    "callcentre_medical_aid_per_agent": 2000,
+    "callcentre_pension_percent": 7,
+    "callcentre_bonus_per_agent": 1500,
+    "callcentre_benefits_per_agent": 500,
+    "callcentre_recruitment_per_agent": 3000,
+    "callcentre_training_per_agent": 1000,
+    "callcentre_trainer_salary": 25000,
+    "callcentre_callcenter_software": 5000,
+    "callcentre_licensing_per_user": 500,
+    "callcentre_crm_sub_per_user": 1500,
+    "callcentre_hardware_cost_station": 15000,
+    "callcentre_depreciation_years": 3,
+    "callcentre_repair_per_device": 800,
+    "callcentre_phone_bill_per_agent": 1000,
+    "callcentre_call_cost_per_minute": 0.75,
+    "callcentre_internet_services": 8000,
+    "callcentre_office_rent_month": 7500,
+    "callcentre_electricity_cost_month": 6000,
+    "callcentre_water_cost_month": 2000,
+    "callcentre_hvac_cost_month": 3000,
+    "callcentre_stationery_month": 1000,
+    "callcentre_cleaning_services_month": 3000,
+    "callcentre_office_repairs_annual": 8000,
+    "callcentre_marketing_annual": 20000,
+    "callcentre_retention_campaigns_annual": 15000,
+    "callcentre_engagement_events_annual": 10000,
+    "callcentre_liability_insurance_annual": 30000,
+    "callcentre_equipment_insurance_percent": 5
+}
+
+# Placeholders for the Admin LLM & Voice cost configuration (USD)
+LLM_VOICE_DEFAULTS = {
+    "llm_cost_input_per_million": 0.0,
+    "llm_cost_output_per_million": 0.0,
+    "llm_avg_tokens_per_message": 750.0,
+    "llm_models_used": {
+        "perplexity": False,
+        "gpt4o-mini": False,
+        "gpt4o": False,
+        "llama": False,
+        "other": False
+    },
+    "voice_cost_twilio": 0.0,
+    "voice_cost_fixed": 0.0,
+    "voice_cost_transcriber": 0.0,
+    "voice_cost_model": 0.0,
+    "voice_cost_elevenlabs": 0.0,
+    "voice_cost_other": 0.0
+}
+
 # ======================================
 # HELPER FUNCTIONS
 # ======================================
@@ -203,6 +456,73 @@ def safe_float(value, default=0.0):
     except (TypeError, ValueError):
         return default
 
+def ceil_pos(value):
+    """Ceiling for non-negative amounts without the math.ceil call."""
+    whole = int(value)
+    return whole + (value > whole)
+
+def apply_quick_set(snapshot, values):
+    """Push quick-set values into session_state and the current run's input snapshot."""
+    st.session_state.update(values)
+    snapshot.update(values)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def currency_factor(selected_currency):
+    """
+    Single multiplier converting a ZAR amount into the selected currency
+    (exchange rate + international overhead). Cleared when exchange rates are saved.
+    """
+    if selected_currency == "ZAR":
+        return 1.0
+    return INTERNATIONAL_FACTOR / exchange_rates.get(selected_currency, 1.0)
+
+def compute_callcentre_totals(cc):
+    """
+    Simple monthly approximation of an in-house call centre, in ZAR.
+    `cc` holds the Call Centre inputs keyed like CC_DEFAULTS.
+    Returns (monthly_total_zar, once_off_zar).
+
+    Costs are grouped into per-agent monthly amounts (scaled by staff count)
+    and fixed monthly amounts, each summed in a single NumPy reduction.
+    """
+    staff_count = cc["callcentre_staff_count"]
+    hardware_per_station = cc["callcentre_hardware_cost_station"]
+
+    per_agent_monthly = np.array([
+        cc["callcentre_salary_per_agent"] * (1 + cc["callcentre_pension_percent"] / 100),
+        cc["callcentre_medical_aid_per_agent"],
+        cc["callcentre_bonus_per_agent"] / 12.0,  # bonus is annual
+        cc["callcentre_benefits_per_agent"],
+        cc["callcentre_licensing_per_user"],
+        cc["callcentre_crm_sub_per_user"],
+        hardware_per_station / (cc["callcentre_depreciation_years"] * 12),
+        cc["callcentre_repair_per_device"] / 12,
+        cc["callcentre_phone_bill_per_agent"],
+        hardware_per_station * (cc["callcentre_equipment_insurance_percent"] / 100) / 12,
+    ], dtype=np.float64)
+
+    fixed_monthly = np.array([
+        cc["callcentre_trainer_salary"],
+        cc["callcentre_callcenter_software"],
+        cc["callcentre_internet_services"],
+        cc["callcentre_office_rent_month"],
+        cc["callcentre_electricity_cost_month"],
+        cc["callcentre_water_cost_month"],
+        cc["callcentre_hvac_cost_month"],
+        cc["callcentre_stationery_month"],
+        cc["callcentre_cleaning_services_month"],
+        cc["callcentre_office_repairs_annual"] / 12,
+        cc["callcentre_marketing_annual"] / 12,
+        cc["callcentre_retention_campaigns_annual"] / 12,
+        cc["callcentre_engagement_events_annual"] / 12,
+        cc["callcentre_liability_insurance_annual"] / 12,
+    ], dtype=np.float64)
+
+    monthly_total_zar = float(staff_count * per_agent_monthly.sum() + fixed_monthly.sum())
+    # Recruitment & training are once-off per agent
+    once_off_zar = staff_count * (cc["callcentre_recruitment_per_agent"] + cc["callcentre_training_per_agent"])
+    return monthly_total_zar, once_off_zar
+
 def initialize_configs():
     """
     Ensures JSON config files exist or are updated if missing keys.
@@ -309,13 +629,56 @@ def load_config(file_path):
         st.error(f"Error reading {file_path}: {e}")
         return None
 
+@st.cache_resource(show_spinner=False)
+def get_pricing():
+    """
+    Shared pricing dict. Admin edits mutate it in place and save_config()
+    writes it through to disk, so it is never re-read on a rerun.
+    """
+    return load_config(PRICING_FILE) or DEFAULT_PRICING
+
+@st.cache_resource(show_spinner=False)
+def get_plan_names():
+    """
+    Plan names from get_pricing(), materialized once for selectboxes and lookups.
+    """
+    return tuple(get_pricing()["plans"])
+
+@st.cache_resource(show_spinner=False)
+def get_exchange_rates():
+    """
+    Shared exchange-rates dict, kept in sync the same way as get_pricing().
+    """
+    return load_config(EXCHANGE_RATES_FILE) or DEFAULT_EXCHANGE_RATES
+
+def write_json_atomic(file_path, data):
+    """
+    Write JSON to a temp file and rename it over the target, so readers
+    never see a half-written file. Each write gets its own temp file in the
+    target directory, so concurrent saves of the same file cannot collide.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
 def save_config(file_path, data):
     """
     Saves a dictionary to JSON, catching IO errors if they occur.
+    Any saved config change invalidates the last Client Calculator result
+    and the Admin profit figures.
     """
+    st.session_state.pop("_last_calc_sig", None)
+    st.session_state["_profit_dirty"] = True
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        write_json_atomic(file_path, data)
     except IOError as e:
         st.error(f"Error saving config to {file_path}: {e}")
 
@@ -328,6 +691,16 @@ def load_client_configs():
     with open(CLIENT_CONFIGS_FILE, 'r') as f:
         return json.load(f)
 
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_client_configs():
+    """
+    Cached load_client_configs() for the Saved Configurations tab.
+    Returns (configs, references) where references is a tuple of the keys.
+    Cleared by save_client_config() so new references show up immediately.
+    """
+    configs = load_client_configs()
+    return configs, tuple(configs)
+
 def save_client_config(ref_id, config_data):
     """
     Save or update a single client's data in the client_configs file, keyed by reference ID.
@@ -335,10 +708,10 @@ def save_client_config(ref_id, config_data):
     all_configs = load_client_configs()
     all_configs[ref_id] = config_data
     try:
-        with open(CLIENT_CONFIGS_FILE, 'w') as f:
-            json.dump(all_configs, f, indent=4)
+        write_json_atomic(CLIENT_CONFIGS_FILE, all_configs)
     except IOError as e:
         st.error(f"Error saving client config: {e}")
+    cached_client_configs.clear()
 
 def apply_custom_css():
     """
@@ -474,7 +847,11 @@ def authenticate_admin():
     """
     Simple password check to restrict access to admin pages (and saved configs).
     Password is: RCS_18112@
+    A successful check is remembered in st.session_state["_admin_ok"] until logout.
     """
+    if st.session_state.get("_admin_ok"):
+        return True
+
     def check_password():
         def password_entered():
             if st.session_state.get("password", "") == "RCS_18112@":
@@ -503,7 +880,10 @@ def authenticate_admin():
         else:
             return True
 
-    return check_password()
+    if check_password():
+        st.session_state["_admin_ok"] = True
+        return True
+    return False
 
 def rerun_script():
     """
@@ -529,7 +909,7 @@ def compute_llm_overhead_per_msg():
          (You may split them if you want separate overhead for messages vs. minutes.)
     """
     # Defaults
-    exchange_rates = load_config(EXCHANGE_RATES_FILE) or DEFAULT_EXCHANGE_RATES
+    exchange_rates = get_exchange_rates()
     selected_currency = st.session_state.get("selected_currency", "ZAR")
     ex_rate = exchange_rates.get(selected_currency, 1.0)
 
@@ -833,9 +1213,10 @@ def assign_plan_based_on_inputs(messages_needed, minutes_needed, wants_own_crm,
         else:
             return "Basic"
 
+@st.fragment
 def show_footer():
     """
-    Minimal footer.  
+    Minimal footer, rendered as a fragment so it is isolated from widget reruns.  
     *Displays 'Excluding VAT' if currency is ZAR, else 'Including VAT' if international.*  
     """
     currency = st.session_state.get("selected_currency", "ZAR")
@@ -854,9 +1235,11 @@ def show_footer():
 # INIT
 # ======================================
 initialize_configs()
-pricing = load_config(PRICING_FILE) or DEFAULT_PRICING
+pricing = get_pricing()
 usage_limits = load_config(USAGE_LIMITS_FILE) or DEFAULT_USAGE_LIMITS
-exchange_rates = load_config(EXCHANGE_RATES_FILE) or DEFAULT_EXCHANGE_RATES
+exchange_rates = get_exchange_rates()
+plan_names = get_plan_names()
+valid_plans = frozenset(plan_names)
 
 # Streamlit Settings
 st.set_page_config(page_title="askAYYI Cost Calculator", layout="wide")
@@ -915,7 +1298,9 @@ with tabs[0]:
         plan_assign_btn = st.form_submit_button("Recommend My Plan")
 
     if plan_assign_btn:
-        total_minutes_needed = calls_per_month * avg_call_duration
+        # Duration is entered in 0.5-min steps, so keep the maths in whole half-minutes
+        duration_halves = int(round(avg_call_duration * 2))
+        total_minutes_needed = (calls_per_month * duration_halves) // 2
         total_messages_needed = msg_conversations_per_month * avg_msgs_per_convo
         wants_own_crm = (crm_choice == "Your Own CRM")
 
@@ -926,26 +1311,28 @@ with tabs[0]:
             desired_agents
         )
 
-        st.session_state["client_assigned_plan"] = assigned_plan
-        st.session_state["estimated_messages"] = total_messages_needed
-        st.session_state["estimated_minutes"] = total_minutes_needed
-        st.session_state["client_desired_agents"] = desired_agents
-        st.session_state["client_crm_choice"] = crm_choice
-        st.session_state["client_communication_type"] = communication_type
+        st.session_state.update({
+            "client_assigned_plan": assigned_plan,
+            "estimated_messages": total_messages_needed,
+            "estimated_minutes": total_minutes_needed,
+            "client_desired_agents": desired_agents,
+            "client_crm_choice": crm_choice,
+            "client_communication_type": communication_type,
+        })
 
         # Adjust if assigned plan is Basic or Advanced but user wants >1 agent
-        if assigned_plan in ["Basic", "Advanced"] and desired_agents > 1:
+        if assigned_plan in SINGLE_AGENT_PLANS and desired_agents > 1:
             st.session_state["client_desired_agents"] = 1
             st.warning(f"'{assigned_plan}' supports only 1 AI Agent. Agents reset to 1 automatically.")
 
         if assigned_plan == "Basic" and wants_own_crm:
             st.warning("Basic plan cannot accommodate 'Your Own CRM'. Please confirm if this is acceptable.")
 
-        st.success(f"**Recommended Plan:** {assigned_plan}")
-        st.info(f"**Estimated Monthly Usage**: ~{int(total_messages_needed):,} messages, ~{int(total_minutes_needed):,} minutes.")
+        st.success(PLAN_TMPL(assigned_plan))
+        st.info(USAGE_TMPL(total_messages_needed, total_minutes_needed))
 
         # Generate and save config by random reference
-        reference_id = "REF" + str(random.randint(100000, 999999))
+        reference_id = f"REF{secrets.randbits(24):06X}"
         st.session_state["client_reference_id"] = reference_id
 
         # Build config data (excluding personal details)
@@ -959,7 +1346,7 @@ with tabs[0]:
         }
         save_client_config(reference_id, config_data)
 
-        st.success(f"Your configuration has been saved! **Reference:** {reference_id}")
+        st.success(REF_TMPL(reference_id))
 
     show_footer()
 
@@ -973,11 +1360,14 @@ with tabs[1]:
     ccol1, ccol2 = st.columns([1,3])
     with ccol1:
         if st.button("Refresh from Plan Assignment"):
-            # Overwrite the usage fields from Plan Assignment
-            st.session_state["temp_messages"] = st.session_state.get("estimated_messages", 0)
-            st.session_state["temp_minutes"] = st.session_state.get("estimated_minutes", 0)
-            # Force a page reload
-            rerun_script()
+            new_messages = int(st.session_state.get("estimated_messages", 0))
+            new_minutes = int(st.session_state.get("estimated_minutes", 0))
+            # Only overwrite + reload if the usage fields actually differ
+            if (st.session_state.get("temp_messages") != new_messages
+                    or st.session_state.get("temp_minutes") != new_minutes):
+                st.session_state["temp_messages"] = new_messages
+                st.session_state["temp_minutes"] = new_minutes
+                rerun_script()
 
     # Let the user pick currency (or remove ZAR if 'international_mode' is True)
     currency_options = SUPPORTED_CURRENCIES.copy()
@@ -1003,8 +1393,9 @@ with tabs[1]:
     comm_type = st.session_state.get("client_communication_type", "Both Messages & Voice")
     st.info(f"**Current Plan:** {assigned_plan} | **Communication:** {comm_type}")
 
-    st.session_state.setdefault("temp_messages", st.session_state.get("estimated_messages", 4000))
-    st.session_state.setdefault("temp_minutes", st.session_state.get("estimated_minutes", 200))
+    # These keys back the calculator widgets directly, so they must be ints for the "%d" inputs
+    st.session_state.setdefault("temp_messages", int(st.session_state.get("estimated_messages", 4000)))
+    st.session_state.setdefault("temp_minutes", int(st.session_state.get("estimated_minutes", 200)))
     st.session_state.setdefault("temp_addons_whitelabel", False)
     st.session_state.setdefault("temp_addons_cv_enabled", False)
     st.session_state.setdefault("temp_addons_cv_qty", 0)
@@ -1019,16 +1410,16 @@ with tabs[1]:
         used_messages = st.number_input(
             "Total Monthly Messages",
             min_value=0,
-            value=int(st.session_state["temp_messages"]),
             step=500,
-            format="%d"
+            format="%d",
+            key="temp_messages"
         )
         used_minutes = st.number_input(
             "Total Monthly Voice Minutes",
             min_value=0,
-            value=int(st.session_state["temp_minutes"]),
             step=50,
-            format="%d"
+            format="%d",
+            key="temp_minutes"
         )
         chosen_crm = st.session_state.get("client_crm_choice", "askAYYI CRM")
         st.write(f"**CRM Chosen**: {chosen_crm}")
@@ -1036,34 +1427,34 @@ with tabs[1]:
         st.subheader("Optional Add-Ons")
         white_labeling = st.checkbox(
             "White Labeling?",
-            value=st.session_state["temp_addons_whitelabel"]
+            key="temp_addons_whitelabel"
         )
         custom_voices = st.checkbox(
             "Custom Voices?",
-            value=st.session_state["temp_addons_cv_enabled"]
+            key="temp_addons_cv_enabled"
         )
         num_custom_voices = 0
         if custom_voices:
             num_custom_voices = st.number_input(
                 "Quantity of Custom Voices",
                 min_value=0,
-                value=st.session_state["temp_addons_cv_qty"],
                 step=1,
-                format="%d"
+                format="%d",
+                key="temp_addons_cv_qty"
             )
 
         additional_languages = st.checkbox(
             "Additional Languages?",
-            value=st.session_state["temp_addons_lang_enabled"]
+            key="temp_addons_lang_enabled"
         )
         num_additional_languages = 0
         if additional_languages:
             num_additional_languages = st.number_input(
                 "Quantity of Additional Languages",
                 min_value=0,
-                value=st.session_state["temp_addons_lang_qty"],
                 step=1,
-                format="%d"
+                format="%d",
+                key="temp_addons_lang_qty"
             )
 
         payment_option = st.radio(
@@ -1074,40 +1465,53 @@ with tabs[1]:
 
         calc_btn = st.form_submit_button("Recalculate Costs")
 
-    if calc_btn:
-        st.session_state["client_desired_agents"] = default_agents
-        st.session_state["client_whitelabeling"] = white_labeling
-        st.session_state["client_custom_voices_enabled"] = custom_voices
-        st.session_state["client_num_custom_voices"] = num_custom_voices
-        st.session_state["client_additional_languages_enabled"] = additional_languages
-        st.session_state["client_num_additional_languages"] = num_additional_languages
-        st.session_state["client_payment_option"] = payment_option
-        st.session_state["estimated_messages"] = used_messages
-        st.session_state["estimated_minutes"] = used_minutes
+    # Inputs that feed calculate_plan_cost; an identical resubmit is a no-op
+    calc_sig = (
+        used_messages, used_minutes, white_labeling, custom_voices, num_custom_voices,
+        additional_languages, num_additional_languages, payment_option, currency,
+        assigned_plan, default_agents, comm_type
+    )
+    if calc_btn and st.session_state.get("_last_calc_sig") == calc_sig:
+        st.info("Inputs unchanged since the last calculation. Cost details are already up to date.")
+    elif calc_btn:
+        st.session_state.update({
+            "client_desired_agents": default_agents,
+            "client_whitelabeling": white_labeling,
+            "client_custom_voices_enabled": custom_voices,
+            "client_num_custom_voices": num_custom_voices,
+            "client_additional_languages_enabled": additional_languages,
+            "client_num_additional_languages": num_additional_languages,
+            "client_payment_option": payment_option,
+            "estimated_messages": used_messages,
+            "estimated_minutes": used_minutes,
+        })
 
         usage = {
             "used_messages": used_messages,
             "used_minutes": used_minutes
         }
 
-        try:
-            plan_data = pricing["plans"][assigned_plan]
-        except KeyError:
+        if assigned_plan not in valid_plans:
             st.error(f"Plan '{assigned_plan}' not found in pricing configuration.")
             show_footer()
             st.stop()
+        plan_data = pricing["plans"][assigned_plan]
+
+        opt_addons = plan_data["optional_addons"]
+        cv_cost = opt_addons["custom_voices"].get("cost_per_voice", 0)
+        la_cost = opt_addons["additional_languages"].get("cost_per_language", 0)
 
         addons = {
             "white_labeling": white_labeling,
             "custom_voices": {
                 "enabled": custom_voices,
                 "quantity": num_custom_voices,
-                "cost_per_voice": plan_data["optional_addons"]["custom_voices"].get("cost_per_voice", 0)
+                "cost_per_voice": cv_cost
             },
             "additional_languages": {
                 "enabled": additional_languages,
                 "quantity": num_additional_languages,
-                "cost_per_language": plan_data["optional_addons"]["additional_languages"].get("cost_per_language", 0)
+                "cost_per_language": la_cost
             }
         }
 
@@ -1125,6 +1529,7 @@ with tabs[1]:
 
         st.session_state["client_cost_details"] = cost_details
         st.session_state["client_selected_plan"] = assigned_plan
+        st.session_state["_last_calc_sig"] = calc_sig
 
         st.success("Recalculation done. Cost details updated. Visit 'Main Dashboard' or 'Quotation' to see the final breakdown.")
 
@@ -1136,317 +1541,182 @@ with tabs[1]:
 with tabs[2]:
     st.title("Call Centre Cost Calculation")
     st.write("Enter your existing call centre costs to compare them with an AI-based approach.")
-    
-    # ---------------------------------------
-    # QUICK-SET DEFAULTS FOR EACH SECTION A/B/C
-    # We store your provided defaults in dictionaries for easy referencing.
-    # ---------------------------------------
-    # A. PERSONNEL DEFAULTS
-    personnel_defaults = {
-        "agents": {"avg": 10, "low": 10, "high": 10, "zero": 0},  # # of Agents is typically the same
-        "salary": {"avg": 8823, "low": 6572, "high": 12920, "zero": 0},
-        "pension_pct": {"avg": 7, "low": 7, "high": 7, "zero": 0},  # The % is the same, but to mimic "0" means no pension
-        "medical": {"avg": 2000, "low": 1000, "high": 3000, "zero": 0},
-        "bonus": {"avg": 1500, "low": 1000, "high": 2000, "zero": 0},  # annual
-        "benefits": {"avg": 500, "low": 300, "high": 700, "zero": 0},
-        "recruitment": {"avg": 3000, "low": 2000, "high": 4000, "zero": 0},
-        "training": {"avg": 1000, "low": 800, "high": 1200, "zero": 0},
-        "trainer_salary": {"avg": 25000, "low": 20000, "high": 30000, "zero": 0}
-    }
-    # B. TECHNOLOGY DEFAULTS
-    tech_defaults = {
-        "software": {"avg": 5000, "low": 3500, "high": 6500, "zero": 0},
-        "licensing": {"avg": 500, "low": 400, "high": 600, "zero": 0},
-        "crm_sub": {"avg": 1500, "low": 1200, "high": 1800, "zero": 0},
-        "hardware_station": {"avg": 15000, "low": 12000, "high": 18000, "zero": 0},
-        "depreciation_yrs": {"avg": 3, "low": 3, "high": 3, "zero": 1},  # can't do zero years
-        "repair_device": {"avg": 800, "low": 600, "high": 1000, "zero": 0},
-        "telco_bill": {"avg": 1000, "low": 800, "high": 1200, "zero": 0},
-        "call_cost_min": {"avg": 0.75, "low": 0.60, "high": 0.90, "zero": 0},
-        "internet": {"avg": 8000, "low": 6000, "high": 10000, "zero": 0}
-    }
-    # C. FACILITY DEFAULTS
-    facility_defaults = {
-        "office_rent": {"avg": 7500, "low": 5000, "high": 10900, "zero": 0},  # e.g. 218*50=10900 for high
-        "electricity": {"avg": 6000, "low": 4500, "high": 7500, "zero": 0},
-        "water": {"avg": 2000, "low": 2000, "high": 2000, "zero": 0}  # only one stated default
-    }
-
-    # Helper function to quickly set values
-    def set_personnel_defaults(choice):
-        st.session_state["callcentre_staff_count"] = personnel_defaults["agents"][choice]
-        st.session_state["callcentre_salary_per_agent"] = personnel_defaults["salary"][choice]
-        st.session_state["callcentre_pension_percent"] = personnel_defaults["pension_pct"][choice]
-        st.session_state["callcentre_medical_aid_per_agent"] = personnel_defaults["medical"][choice]
-        st.session_state["callcentre_bonus_per_agent"] = personnel_defaults["bonus"][choice]
-        st.session_state["callcentre_benefits_per_agent"] = personnel_defaults["benefits"][choice]
-        st.session_state["callcentre_recruitment_per_agent"] = personnel_defaults["recruitment"][choice]
-        st.session_state["callcentre_training_per_agent"] = personnel_defaults["training"][choice]
-        st.session_state["callcentre_trainer_salary"] = personnel_defaults["trainer_salary"][choice]
-
-    def set_tech_defaults(choice):
-        st.session_state["callcentre_callcenter_software"] = tech_defaults["software"][choice]
-        st.session_state["callcentre_licensing_per_user"] = tech_defaults["licensing"][choice]
-        st.session_state["callcentre_crm_sub_per_user"] = tech_defaults["crm_sub"][choice]
-        st.session_state["callcentre_hardware_cost_station"] = tech_defaults["hardware_station"][choice]
-        st.session_state["callcentre_depreciation_years"] = tech_defaults["depreciation_yrs"][choice]
-        st.session_state["callcentre_repair_per_device"] = tech_defaults["repair_device"][choice]
-        st.session_state["callcentre_phone_bill_per_agent"] = tech_defaults["telco_bill"][choice]
-        st.session_state["callcentre_call_cost_per_minute"] = tech_defaults["call_cost_min"][choice]
-        st.session_state["callcentre_internet_services"] = tech_defaults["internet"][choice]
-
-    def set_facility_defaults(choice):
-        st.session_state["callcentre_office_rent_month"] = facility_defaults["office_rent"][choice]
-        st.session_state["callcentre_electricity_cost_month"] = facility_defaults["electricity"][choice]
-        st.session_state["callcentre_water_cost_month"] = facility_defaults["water"][choice]
 
+    # One pass over session_state for all input defaults
+    cc_snap = {**CC_DEFAULTS, **{k: st.session_state[k] for k in CC_DEFAULTS if k in st.session_state}}
+    
     # -----------
-    # SECTION A
+    # QUICK-SET DEFAULTS (outside the form, they need an immediate rerun)
     # -----------
-    st.markdown("### A. Personnel Costs")
-    # Add quick-set buttons
+    st.markdown("### Quick-Set Defaults")
+    st.caption("A. Personnel")
     bcol1, bcol2, bcol3, bcol4 = st.columns(4)
     if bcol1.button("Set to 0 (A)"):
-        set_personnel_defaults("zero")
+        apply_quick_set(cc_snap, PERSONNEL_BY_CHOICE["zero"])
         rerun_script()
     if bcol2.button("Low Cost (A)"):
-        set_personnel_defaults("low")
+        apply_quick_set(cc_snap, PERSONNEL_BY_CHOICE["low"])
         rerun_script()
     if bcol3.button("High Cost (A)"):
-        set_personnel_defaults("high")
+        apply_quick_set(cc_snap, PERSONNEL_BY_CHOICE["high"])
         rerun_script()
     if bcol4.button("Average Cost (A)"):
-        set_personnel_defaults("avg")
+        apply_quick_set(cc_snap, PERSONNEL_BY_CHOICE["avg"])
         rerun_script()
 
-    c1, c2, c3 = st.columns(3)
-    default_staff_count = st.session_state.get("callcentre_staff_count", 10)
-    default_salary_per_agent = st.session_state.get("callcentre_salary_per_agent", 8000)
-    default_medical_aid_per_agent = st.session_state.get("callcentre_medical_aid_per_agent", 2000)
-    default_pension_percent = st.session_state.get("callcentre_pension_percent", 7)
-    default_bonus_per_agent = st.session_state.get("callcentre_bonus_per_agent", 1500)
-    default_benefits_per_agent = st.session_state.get("callcentre_benefits_per_agent", 500)
-    default_recruitment_per_agent = st.session_state.get("callcentre_recruitment_per_agent", 3000)
-    default_training_per_agent = st.session_state.get("callcentre_training_per_agent", 1000)
-    default_trainer_salary = st.session_state.get("callcentre_trainer_salary", 25000)
-
-    with c1:
-        staff_count = st.number_input("Number of Agents", min_value=0, value=default_staff_count, step=1, format="%d")
-        salary_per_agent = st.number_input("Salary/Agent (ZAR)", min_value=0, value=default_salary_per_agent, step=500)
-        pension_percent = st.number_input("Pension (%)", min_value=0, max_value=100, value=default_pension_percent, step=1)
-    with c2:
-        medical_aid_per_agent = st.number_input("Medical Aid/Agent (ZAR)", min_value=0, value=default_medical_aid_per_agent, step=500)
-        bonus_incentive_per_agent = st.number_input("Bonus/Agent (ZAR Ann.)", min_value=0, value=default_bonus_per_agent, step=500)
-        monthly_benefits_per_agent = st.number_input("Other Benefits/Agent (ZAR)", min_value=0, value=default_benefits_per_agent, step=100)
-    with c3:
-        recruitment_cost_per_agent = st.number_input("Recruitment/Agent (ZAR)", min_value=0, value=default_recruitment_per_agent, step=500)
-        training_cost_per_agent = st.number_input("Training/Agent (ZAR)", min_value=0, value=default_training_per_agent, step=500)
-        trainer_salary = st.number_input("Trainer Salary (ZAR/mo)", min_value=0, value=default_trainer_salary, step=500)
-
-    # -----------
-    # SECTION B
-    # -----------
-    st.markdown("### B. Technology Costs")
-    # Add quick-set buttons
+    st.caption("B. Technology")
     tbcol1, tbcol2, tbcol3, tbcol4 = st.columns(4)
     if tbcol1.button("Set to 0 (B)"):
-        set_tech_defaults("zero")
+        apply_quick_set(cc_snap, TECH_BY_CHOICE["zero"])
         rerun_script()
     if tbcol2.button("Low Cost (B)"):
-        set_tech_defaults("low")
+        apply_quick_set(cc_snap, TECH_BY_CHOICE["low"])
         rerun_script()
     if tbcol3.button("High Cost (B)"):
-        set_tech_defaults("high")
+        apply_quick_set(cc_snap, TECH_BY_CHOICE["high"])
         rerun_script()
     if tbcol4.button("Average Cost (B)"):
-        set_tech_defaults("avg")
+        apply_quick_set(cc_snap, TECH_BY_CHOICE["avg"])
         rerun_script()
 
-    tc1, tc2, tc3 = st.columns(3)
-
-    default_callcenter_software = st.session_state.get("callcentre_callcenter_software", 5000)
-    default_licensing_per_user = st.session_state.get("callcentre_licensing_per_user", 500)
-    default_crm_sub_per_user = st.session_state.get("callcentre_crm_sub_per_user", 1500)
-    default_hardware_cost_station = st.session_state.get("callcentre_hardware_cost_station", 15000)
-    default_depreciation_years = st.session_state.get("callcentre_depreciation_years", 3)
-    default_repair_per_device = st.session_state.get("callcentre_repair_per_device", 800)
-    default_phone_bill_per_agent = st.session_state.get("callcentre_phone_bill_per_agent", 1000)
-    default_call_cost_per_minute = st.session_state.get("callcentre_call_cost_per_minute", 0.75)
-    default_internet_services = st.session_state.get("callcentre_internet_services", 8000)
-
-    with tc1:
-        call_center_software = st.number_input("Call Centre Software (ZAR/mo)", min_value=0, value=default_callcenter_software, step=500)
-        licensing_per_user = st.number_input("Licensing/Agent (ZAR/mo)", min_value=0, value=default_licensing_per_user, step=50)
-        crm_subscription_per_user = st.number_input("CRM/Agent (ZAR/mo)", min_value=0, value=default_crm_sub_per_user, step=100)
-    with tc2:
-        hardware_cost_per_station = st.number_input("Hardware/Station (ZAR)", min_value=0, value=default_hardware_cost_station, step=1000)
-        depreciation_years = st.number_input("Hardware Depreciation (yrs)", min_value=1, value=default_depreciation_years, step=1)
-        repair_maintenance_per_device = st.number_input("Repair/Device (ZAR/yr)", min_value=0, value=default_repair_per_device, step=100)
-    with tc3:
-        monthly_phone_bill_per_agent = st.number_input("Telco Bill/Agent (ZAR/mo)", min_value=0, value=default_phone_bill_per_agent, step=100)
-        call_cost_per_minute = st.number_input("Cost/call minute (ZAR)", min_value=0.0, value=default_call_cost_per_minute, step=0.05)
-        internet_services = st.number_input("Internet (ZAR/mo)", min_value=0, value=default_internet_services, step=500)
-
-    # -----------
-    # SECTION C
-    # -----------
-    st.markdown("### C. Facility Costs")
+    st.caption("C. Facility")
     fc_b1, fc_b2, fc_b3, fc_b4 = st.columns(4)
     if fc_b1.button("Set to 0 (C)"):
-        set_facility_defaults("zero")
+        apply_quick_set(cc_snap, FACILITY_BY_CHOICE["zero"])
         rerun_script()
     if fc_b2.button("Low Cost (C)"):
-        set_facility_defaults("low")
+        apply_quick_set(cc_snap, FACILITY_BY_CHOICE["low"])
         rerun_script()
     if fc_b3.button("High Cost (C)"):
-        set_facility_defaults("high")
+        apply_quick_set(cc_snap, FACILITY_BY_CHOICE["high"])
         rerun_script()
     if fc_b4.button("Average Cost (C)"):
-        set_facility_defaults("avg")
+        apply_quick_set(cc_snap, FACILITY_BY_CHOICE["avg"])
         rerun_script()
 
-    fc1, fc2, fc3 = st.columns(3)
-
-    default_office_rent_month = st.session_state.get("callcentre_office_rent_month", 7500)
-    default_electricity_cost_month = st.session_state.get("callcentre_electricity_cost_month", 6000)
-    default_water_cost_month = st.session_state.get("callcentre_water_cost_month", 2000)
-
-    with fc1:
-        office_rent_month = st.number_input("Office Rent (ZAR/mo)", min_value=0, value=default_office_rent_month, step=1000)
-        electricity_cost_month = st.number_input("Electricity (ZAR/mo)", min_value=0, value=default_electricity_cost_month, step=500)
-        water_cost_month = st.number_input("Water (ZAR/mo)", min_value=0, value=default_water_cost_month, step=500)
-
-    # Additional fields not specified in your default list:
-    fc2, fc3 = st.columns(2)
-    default_hvac_cost_month = st.session_state.get("callcentre_hvac_cost_month", 3000)
-    default_stationery_month = st.session_state.get("callcentre_stationery_month", 1000)
-    default_cleaning_services_month = st.session_state.get("callcentre_cleaning_services_month", 3000)
-    default_office_repairs_annual = st.session_state.get("callcentre_office_repairs_annual", 8000)
-
-    with fc2:
-        hvac_cost_month = st.number_input("HVAC (ZAR/mo)", min_value=0, value=default_hvac_cost_month, step=500)
-        stationery_month = st.number_input("Stationery (ZAR/mo)", min_value=0, value=default_stationery_month, step=100)
-        cleaning_services_month = st.number_input("Cleaning (ZAR/mo)", min_value=0, value=default_cleaning_services_month, step=500)
-    with fc3:
-        office_repairs_annual = st.number_input("Office Repairs (ZAR/yr)", min_value=0, value=default_office_repairs_annual, step=1000)
-
-    st.markdown("### D. Miscellaneous Costs")
-    mc1, mc2 = st.columns(2)
-
-    default_marketing_annual = st.session_state.get("callcentre_marketing_annual", 20000)
-    default_retention_campaigns_annual = st.session_state.get("callcentre_retention_campaigns_annual", 15000)
-    default_engagement_events_annual = st.session_state.get("callcentre_engagement_events_annual", 10000)
-    default_liability_insurance_annual = st.session_state.get("callcentre_liability_insurance_annual", 30000)
-    default_equipment_insurance_percent = st.session_state.get("callcentre_equipment_insurance_percent", 5)
-
-    with mc1:
-        marketing_annual = st.number_input("Marketing (ZAR/yr)", min_value=0, value=default_marketing_annual, step=2000)
-        retention_campaigns_annual = st.number_input("Retention (ZAR/yr)", min_value=0, value=default_retention_campaigns_annual, step=1000)
-        engagement_events_annual = st.number_input("Engagement Events (ZAR/yr)", min_value=0, value=default_engagement_events_annual, step=1000)
-    with mc2:
-        liability_insurance_annual = st.number_input("Liability Insurance (ZAR/yr)", min_value=0, value=default_liability_insurance_annual, step=2000)
-        equipment_insurance_percent = st.number_input("Equipment Insurance (%)", min_value=0, max_value=100, value=default_equipment_insurance_percent, step=1)
-
-    callcentre_calc_btn = st.button("Calculate Internal Call Centre Costs")
+    # Inputs only rerun the script on submit
+    with st.form("callcentre_form"):
+        # -----------
+        # SECTION A
+        # -----------
+        st.markdown("### A. Personnel Costs")
+
+        c1, c2, c3 = st.columns(3)
+
+        with c1:
+            staff_count = st.number_input("Number of Agents", min_value=0, value=cc_snap["callcentre_staff_count"], step=1, format="%d")
+            salary_per_agent = st.number_input("Salary/Agent (ZAR)", min_value=0, value=cc_snap["callcentre_salary_per_agent"], step=500)
+            pension_percent = st.number_input("Pension (%)", min_value=0, max_value=100, value=cc_snap["callcentre_pension_percent"], step=1)
+        with c2:
+            medical_aid_per_agent = st.number_input("Medical Aid/Agent (ZAR)", min_value=0, value=cc_snap["callcentre_medical_aid_per_agent"], step=500)
+            bonus_incentive_per_agent = st.number_input("Bonus/Agent (ZAR Ann.)", min_value=0, value=cc_snap["callcentre_bonus_per_agent"], step=500)
+            monthly_benefits_per_agent = st.number_input("Other Benefits/Agent (ZAR)", min_value=0, value=cc_snap["callcentre_benefits_per_agent"], step=100)
+        with c3:
+            recruitment_cost_per_agent = st.number_input("Recruitment/Agent (ZAR)", min_value=0, value=cc_snap["callcentre_recruitment_per_agent"], step=500)
+            training_cost_per_agent = st.number_input("Training/Agent (ZAR)", min_value=0, value=cc_snap["callcentre_training_per_agent"], step=500)
+            trainer_salary = st.number_input("Trainer Salary (ZAR/mo)", min_value=0, value=cc_snap["callcentre_trainer_salary"], step=500)
+
+        # -----------
+        # SECTION B
+        # -----------
+        st.markdown("### B. Technology Costs")
+
+        tc1, tc2, tc3 = st.columns(3)
+
+        with tc1:
+            call_center_software = st.number_input("Call Centre Software (ZAR/mo)", min_value=0, value=cc_snap["callcentre_callcenter_software"], step=500)
+            licensing_per_user = st.number_input("Licensing/Agent (ZAR/mo)", min_value=0, value=cc_snap["callcentre_licensing_per_user"], step=50)
+            crm_subscription_per_user = st.number_input("CRM/Agent (ZAR/mo)", min_value=0, value=cc_snap["callcentre_crm_sub_per_user"], step=100)
+        with tc2:
+            hardware_cost_per_station = st.number_input("Hardware/Station (ZAR)", min_value=0, value=cc_snap["callcentre_hardware_cost_station"], step=1000)
+            depreciation_years = st.number_input("Hardware Depreciation (yrs)", min_value=1, value=cc_snap["callcentre_depreciation_years"], step=1)
+            repair_maintenance_per_device = st.number_input("Repair/Device (ZAR/yr)", min_value=0, value=cc_snap["callcentre_repair_per_device"], step=100)
+        with tc3:
+            monthly_phone_bill_per_agent = st.number_input("Telco Bill/Agent (ZAR/mo)", min_value=0, value=cc_snap["callcentre_phone_bill_per_agent"], step=100)
+            call_cost_per_minute = st.number_input("Cost/call minute (ZAR)", min_value=0.0, value=cc_snap["callcentre_call_cost_per_minute"], step=0.05)
+            internet_services = st.number_input("Internet (ZAR/mo)", min_value=0, value=cc_snap["callcentre_internet_services"], step=500)
+
+        # -----------
+        # SECTION C
+        # -----------
+        st.markdown("### C. Facility Costs")
+
+        fc1, fc2, fc3 = st.columns(3)
+
+        with fc1:
+            office_rent_month = st.number_input("Office Rent (ZAR/mo)", min_value=0, value=cc_snap["callcentre_office_rent_month"], step=1000)
+            electricity_cost_month = st.number_input("Electricity (ZAR/mo)", min_value=0, value=cc_snap["callcentre_electricity_cost_month"], step=500)
+            water_cost_month = st.number_input("Water (ZAR/mo)", min_value=0, value=cc_snap["callcentre_water_cost_month"], step=500)
+
+        # Additional fields not specified in your default list:
+        fc2, fc3 = st.columns(2)
+
+        with fc2:
+            hvac_cost_month = st.number_input("HVAC (ZAR/mo)", min_value=0, value=cc_snap["callcentre_hvac_cost_month"], step=500)
+            stationery_month = st.number_input("Stationery (ZAR/mo)", min_value=0, value=cc_snap["callcentre_stationery_month"], step=100)
+            cleaning_services_month = st.number_input("Cleaning (ZAR/mo)", min_value=0, value=cc_snap["callcentre_cleaning_services_month"], step=500)
+        with fc3:
+            office_repairs_annual = st.number_input("Office Repairs (ZAR/yr)", min_value=0, value=cc_snap["callcentre_office_repairs_annual"], step=1000)
+
+        st.markdown("### D. Miscellaneous Costs")
+        mc1, mc2 = st.columns(2)
+
+        with mc1:
+            marketing_annual = st.number_input("Marketing (ZAR/yr)", min_value=0, value=cc_snap["callcentre_marketing_annual"], step=2000)
+            retention_campaigns_annual = st.number_input("Retention (ZAR/yr)", min_value=0, value=cc_snap["callcentre_retention_campaigns_annual"], step=1000)
+            engagement_events_annual = st.number_input("Engagement Events (ZAR/yr)", min_value=0, value=cc_snap["callcentre_engagement_events_annual"], step=1000)
+        with mc2:
+            liability_insurance_annual = st.number_input("Liability Insurance (ZAR/yr)", min_value=0, value=cc_snap["callcentre_liability_insurance_annual"], step=2000)
+            equipment_insurance_percent = st.number_input("Equipment Insurance (%)", min_value=0, max_value=100, value=cc_snap["callcentre_equipment_insurance_percent"], step=1)
+
+        callcentre_calc_btn = st.form_submit_button("Calculate Internal Call Centre Costs")
 
     if callcentre_calc_btn:
+        cc_inputs = {
+            "callcentre_staff_count": staff_count,
+            "callcentre_salary_per_agent": salary_per_agent,
+            "callcentre_medical_aid_per_agent": medical_aid_per_agent,
+            "callcentre_pension_percent": pension_percent,
+            "callcentre_bonus_per_agent": bonus_incentive_per_agent,
+            "callcentre_benefits_per_agent": monthly_benefits_per_agent,
+            "callcentre_recruitment_per_agent": recruitment_cost_per_agent,
+            "callcentre_training_per_agent": training_cost_per_agent,
+            "callcentre_trainer_salary": trainer_salary,
+            "callcentre_callcenter_software": call_center_software,
+            "callcentre_licensing_per_user": licensing_per_user,
+            "callcentre_crm_sub_per_user": crm_subscription_per_user,
+            "callcentre_hardware_cost_station": hardware_cost_per_station,
+            "callcentre_depreciation_years": depreciation_years,
+            "callcentre_repair_per_device": repair_maintenance_per_device,
+            "callcentre_phone_bill_per_agent": monthly_phone_bill_per_agent,
+            "callcentre_call_cost_per_minute": call_cost_per_minute,
+            "callcentre_internet_services": internet_services,
+            "callcentre_office_rent_month": office_rent_month,
+            "callcentre_electricity_cost_month": electricity_cost_month,
+            "callcentre_water_cost_month": water_cost_month,
+            "callcentre_hvac_cost_month": hvac_cost_month,
+            "callcentre_stationery_month": stationery_month,
+            "callcentre_cleaning_services_month": cleaning_services_month,
+            "callcentre_office_repairs_annual": office_repairs_annual,
+            "callcentre_marketing_annual": marketing_annual,
+            "callcentre_retention_campaigns_annual": retention_campaigns_annual,
+            "callcentre_engagement_events_annual": engagement_events_annual,
+            "callcentre_liability_insurance_annual": liability_insurance_annual,
+            "callcentre_equipment_insurance_percent": equipment_insurance_percent,
+        }
         # Store these in session_state so we can compare in the Main Dashboard
-        st.session_state["callcentre_staff_count"] = staff_count
-        st.session_state["callcentre_salary_per_agent"] = salary_per_agent
-        st.session_state["callcentre_medical_aid_per_agent"] = medical_aid_per_agent
-        st.session_state["callcentre_pension_percent"] = pension_percent
-        st.session_state["callcentre_bonus_per_agent"] = bonus_incentive_per_agent
-        st.session_state["callcentre_benefits_per_agent"] = monthly_benefits_per_agent
-        st.session_state["callcentre_recruitment_per_agent"] = recruitment_cost_per_agent
-        st.session_state["callcentre_training_per_agent"] = training_cost_per_agent
-        st.session_state["callcentre_trainer_salary"] = trainer_salary
-
-        st.session_state["callcentre_callcenter_software"] = call_center_software
-        st.session_state["callcentre_licensing_per_user"] = licensing_per_user
-        st.session_state["callcentre_crm_sub_per_user"] = crm_subscription_per_user
-        st.session_state["callcentre_hardware_cost_station"] = hardware_cost_per_station
-        st.session_state["callcentre_depreciation_years"] = depreciation_years
-        st.session_state["callcentre_repair_per_device"] = repair_maintenance_per_device
-        st.session_state["callcentre_phone_bill_per_agent"] = monthly_phone_bill_per_agent
-        st.session_state["callcentre_call_cost_per_minute"] = call_cost_per_minute
-        st.session_state["callcentre_internet_services"] = internet_services
-
-        st.session_state["callcentre_office_rent_month"] = office_rent_month
-        st.session_state["callcentre_electricity_cost_month"] = electricity_cost_month
-        st.session_state["callcentre_water_cost_month"] = water_cost_month
-        st.session_state["callcentre_hvac_cost_month"] = hvac_cost_month
-        st.session_state["callcentre_stationery_month"] = stationery_month
-        st.session_state["callcentre_cleaning_services_month"] = cleaning_services_month
-        st.session_state["callcentre_office_repairs_annual"] = office_repairs_annual
-
-        st.session_state["callcentre_marketing_annual"] = marketing_annual
-        st.session_state["callcentre_retention_campaigns_annual"] = retention_campaigns_annual
-        st.session_state["callcentre_engagement_events_annual"] = engagement_events_annual
-        st.session_state["callcentre_liability_insurance_annual"] = liability_insurance_annual
-        st.session_state["callcentre_equipment_insurance_percent"] = equipment_insurance_percent
-
-        # Simple monthly approximation in ZAR
-        monthly_salary_total = staff_count * salary_per_agent
-        monthly_pension_total = monthly_salary_total * (pension_percent / 100)
-        monthly_medical_total = staff_count * medical_aid_per_agent
-
-        # Bonus is annual, so monthly portion:
-        monthly_bonus_total = (staff_count * bonus_incentive_per_agent) / 12.0
-        monthly_benefits_total = staff_count * monthly_benefits_per_agent
-
-        total_recruitment = staff_count * recruitment_cost_per_agent  # once-off
-        total_training = staff_count * training_cost_per_agent        # once-off
-
-        monthly_personnel = (
-            monthly_salary_total
-            + monthly_pension_total
-            + monthly_medical_total
-            + monthly_bonus_total
-            + monthly_benefits_total
-            + trainer_salary
-        )
+        st.session_state.update(cc_inputs)
 
-        monthly_software = (
-            call_center_software
-            + (licensing_per_user * staff_count)
-            + (crm_subscription_per_user * staff_count)
-        )
-        monthly_hardware_amort = (hardware_cost_per_station * staff_count) / (depreciation_years * 12)
-        monthly_repair_maint = (repair_maintenance_per_device * staff_count) / 12
-        monthly_telco = (monthly_phone_bill_per_agent * staff_count) + internet_services
-        monthly_technology = monthly_software + monthly_hardware_amort + monthly_repair_maint + monthly_telco
-
-        monthly_facility = (
-            office_rent_month
-            + electricity_cost_month
-            + water_cost_month
-            + hvac_cost_month
-            + stationery_month
-            + cleaning_services_month
-            + (office_repairs_annual / 12)
-        )
-        monthly_marketing = (marketing_annual / 12) + (retention_campaigns_annual / 12)
-        monthly_engagement = engagement_events_annual / 12
-        monthly_liability_insur = liability_insurance_annual / 12
-        total_hardware_value = hardware_cost_per_station * staff_count
-        monthly_equip_insur = (total_hardware_value * (equipment_insurance_percent / 100)) / 12
-        monthly_misc = monthly_marketing + monthly_engagement + monthly_liability_insur + monthly_equip_insur
-
-        monthly_total_callcentre_zar = monthly_personnel + monthly_technology + monthly_facility + monthly_misc
-        once_off_costs_callcentre_zar = total_recruitment + total_training
+        monthly_total_callcentre_zar, once_off_costs_callcentre_zar = compute_callcentre_totals(cc_inputs)
 
         # Convert to selected currency
         selected_currency = st.session_state.get("selected_currency", "ZAR")
-        ex_rate = exchange_rates.get(selected_currency, 1.0)
-        if selected_currency == "ZAR":
-            final_factor = 1.0
-        else:
-            final_factor = 1.3 * 1.15
+        zar_to_selected = currency_factor(selected_currency)
 
         st.session_state["cc_monthly_total_callcentre_zar"] = monthly_total_callcentre_zar
         st.session_state["cc_once_off_costs_callcentre_zar"] = once_off_costs_callcentre_zar
-        st.session_state["cc_monthly_total_callcentre"] = (monthly_total_callcentre_zar / ex_rate) * final_factor
-        st.session_state["cc_once_off_costs_callcentre"] = (once_off_costs_callcentre_zar / ex_rate) * final_factor
+        st.session_state["cc_monthly_total_callcentre"] = monthly_total_callcentre_zar * zar_to_selected
+        st.session_state["cc_once_off_costs_callcentre"] = once_off_costs_callcentre_zar * zar_to_selected
 
         st.success("Comparison data calculated. Visit 'Main Dashboard' or 'Quotation' to see results.")
 
@@ -1479,50 +1749,33 @@ with tabs[3]:
     extra_minutes_used = cost_details["extra_minutes_used"]
 
     # Overages in chosen currency
-    ex_rate = exchange_rates.get(selected_currency, 1.0)
-    if selected_currency == "ZAR":
-        final_factor = 1.0
-    else:
-        final_factor = 1.3 * 1.15
-    extra_msg_cost_converted = (cost_details["extra_msg_cost_zar"] / ex_rate) * final_factor
-    extra_min_cost_converted = (cost_details["extra_min_cost_zar"] / ex_rate) * final_factor
+    zar_to_selected = currency_factor(selected_currency)
+    extra_msg_cost_converted = cost_details["extra_msg_cost_zar"] * zar_to_selected
+    extra_min_cost_converted = cost_details["extra_min_cost_zar"] * zar_to_selected
 
     # Round for display
-    disp_monthly_cost = math.ceil(total_monthly_cost_converted)
-    disp_setup_cost = math.ceil(total_setup_cost_converted)
-    plan_duration_total = math.ceil(total_monthly_cost_converted * plan_min_duration + total_setup_cost_converted)
-    disp_extra_msg_cost = math.ceil(extra_msg_cost_converted)
-    disp_extra_min_cost = math.ceil(extra_min_cost_converted)
-
-    col_a, col_b, col_c, col_d = st.columns(4)
-    with col_a:
-        st.markdown(f"""
-        <div class='card' style='height: 130px;'>
-            <h4>Plan</h4>
-            <p>{assigned_plan}</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col_b:
-        st.markdown(f"""
-        <div class='card' style='height: 130px;'>
-            <h4>Monthly Cost</h4>
-            <p>{symbol}{disp_monthly_cost:,}</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col_c:
-        st.markdown(f"""
-        <div class='card' style='height: 130px;'>
-            <h4>Setup Cost</h4>
-            <p>{symbol}{disp_setup_cost:,}</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col_d:
-        st.markdown(f"""
-        <div class='card' style='height: 130px;'>
-            <h4>Commit. Cost</h4>
-            <p>{symbol}{plan_duration_total:,} over {plan_min_duration} months</p>
-        </div>
-        """, unsafe_allow_html=True)
+    disp_monthly_cost = ceil_pos(total_monthly_cost_converted)
+    disp_setup_cost = ceil_pos(total_setup_cost_converted)
+    plan_duration_total = ceil_pos(total_monthly_cost_converted * plan_min_duration + total_setup_cost_converted)
+    disp_extra_msg_cost = ceil_pos(extra_msg_cost_converted)
+    disp_extra_min_cost = ceil_pos(extra_min_cost_converted)
+
+    # All four summary cards in one flex row / one markdown element
+    summary_cards = (
+        ("Plan", assigned_plan),
+        ("Monthly Cost", f"{symbol}{disp_monthly_cost:,}"),
+        ("Setup Cost", f"{symbol}{disp_setup_cost:,}"),
+        ("Commit. Cost", f"{symbol}{plan_duration_total:,} over {plan_min_duration} months"),
+    )
+    st.markdown(
+        "<div style='display: flex; gap: 1rem;'>"
+        + "".join(
+            f"<div class='card' style='height: 130px; flex: 1;'><h4>{title}</h4><p>{value}</p></div>"
+            for title, value in summary_cards
+        )
+        + "</div>",
+        unsafe_allow_html=True
+    )
 
     st.write(f"### Plan Duration: {plan_min_duration} months minimum")
     st.write(f"### Communication Type: {comm_type}")
@@ -1533,23 +1786,23 @@ with tabs[3]:
     st.subheader("Maintenance & Setup Breakdown")
 
     # Convert the maintenance & setup items to chosen currency
-    maintenance_cost_converted = (cost_details["maintenance_cost_zar"] / ex_rate) * final_factor
-    setup_fee_converted = (cost_details["setup_fee_zar"] / ex_rate) * final_factor
-    setup_hours_converted = (cost_details["setup_hours_cost_zar"] / ex_rate) * final_factor
-    setup_cost_assistants_converted = (cost_details["setup_cost_assistants_zar"] / ex_rate) * final_factor
+    maintenance_cost_converted = cost_details["maintenance_cost_zar"] * zar_to_selected
+    setup_fee_converted = cost_details["setup_fee_zar"] * zar_to_selected
+    setup_hours_converted = cost_details["setup_hours_cost_zar"] * zar_to_selected
+    setup_cost_assistants_converted = cost_details["setup_cost_assistants_zar"] * zar_to_selected
 
     df_data = [
         [
             "Maintenance Hours (Monthly)",
-            f"{cost_details['maintenance_hours']} hrs @ {symbol}{math.ceil((cost_details['maintenance_hourly_rate']/ex_rate)*final_factor):,}/hr"
+            f"{cost_details['maintenance_hours']} hrs @ {symbol}{ceil_pos(cost_details['maintenance_hourly_rate'] * zar_to_selected):,}/hr"
         ],
         [
             "Maintenance Cost (Monthly)",
-            f"{symbol}{math.ceil(maintenance_cost_converted):,}"
+            f"{symbol}{ceil_pos(maintenance_cost_converted):,}"
         ],
         [
             "Plan's Base Setup Fee (One-Time)",
-            f"{symbol}{math.ceil(setup_fee_converted):,}"
+            f"{symbol}{ceil_pos(setup_fee_converted):,}"
         ],
     ]
 
@@ -1557,17 +1810,19 @@ with tabs[3]:
     if cost_details.get("setup_hours", 0) > 0:
         df_data.append([
             "Setup Hours (One-Time)",
-            f"{symbol}{math.ceil(setup_hours_converted):,}"
+            f"{symbol}{ceil_pos(setup_hours_converted):,}"
         ])
     # If there's any extra assistant setup
     if cost_details["setup_cost_assistants_zar"] > 0:
         df_data.append([
             "Setup Cost for Assistants",
-            f"{symbol}{math.ceil(setup_cost_assistants_converted):,}"
+            f"{symbol}{ceil_pos(setup_cost_assistants_converted):,}"
         ])
 
-    df_breakdown = pd.DataFrame(df_data, columns=["Item", "Value"])
-    st.table(df_breakdown)
+    # Only a handful of rows, so render a Markdown table rather than a DataFrame
+    # ("$" is escaped so USD amounts aren't parsed as LaTeX)
+    table_rows = "\n".join(f"| {item} | {value} |" for item, value in df_data).replace("$", "\\$")
+    st.markdown("| Item | Value |\n|---|---|\n" + table_rows)
 
     # Overages
     if extra_messages_used > 0 or extra_minutes_used > 0:
@@ -1584,15 +1839,15 @@ with tabs[3]:
         st.subheader("Comparison with Existing Call Centre")
         monthly_total_callcentre_converted = st.session_state.get("cc_monthly_total_callcentre", 0)
         once_off_callcentre_converted = st.session_state.get("cc_once_off_costs_callcentre", 0)
-        disp_callcentre_cost = math.ceil(monthly_total_callcentre_converted)
-        disp_callcentre_onceoff = math.ceil(once_off_callcentre_converted)
+        disp_callcentre_cost = ceil_pos(monthly_total_callcentre_converted)
+        disp_callcentre_onceoff = ceil_pos(once_off_callcentre_converted)
 
         st.write(f"**Your Current Call Centre** ~ {symbol}{disp_callcentre_cost:,}/mo")
         st.write(f"One-Time Onboarding & Recruitment: {symbol}{disp_callcentre_onceoff:,}")
         st.write(f"**askAYYI**: {symbol}{disp_monthly_cost:,}/mo + {symbol}{disp_setup_cost:,} once-off")
 
         difference = monthly_total_callcentre_converted - total_monthly_cost_converted
-        diff_rounded = math.ceil(abs(difference))
+        diff_rounded = ceil_pos(abs(difference))
         if difference > 0:
             st.success(f"**Potential Monthly Savings**: ~{symbol}{diff_rounded:,}")
         else:
@@ -1606,18 +1861,23 @@ with tabs[3]:
 # PAGE: Quotation (Client-Facing)
 # ======================================
 with tabs[4]:
-    st.title("Quotation")
-
-    cost_details = st.session_state.get("client_cost_details", None)
+    # Read the session values this tab needs once, up front
+    ss = st.session_state
+    cost_details = ss.get("client_cost_details", None)
+    assigned_plan = ss.get("client_selected_plan", "Basic")
+    comm_type = ss.get("client_communication_type", "Both Messages & Voice")
+    selected_currency = ss.get("selected_currency", "ZAR")
+    num_agents = ss.get("client_desired_agents", 1)
+
+    # Bail out before rendering anything when there's nothing to quote yet
     if cost_details is None:
         st.warning("Use 'Plan Assignment' + 'Client Calculator' first for a quote.")
         show_footer()
         st.stop()
 
-    assigned_plan = st.session_state.get("client_selected_plan", "Basic")
+    st.title("Quotation")
+
     plan_min_duration = MIN_PLAN_DURATION.get(assigned_plan, 3)
-    comm_type = st.session_state.get("client_communication_type", "Both Messages & Voice")
-    selected_currency = st.session_state.get("selected_currency", "ZAR")
     symbol = CURRENCY_SYMBOLS.get(selected_currency, "R")
 
     # Unrounded in selected currency
@@ -1634,106 +1894,58 @@ with tabs[4]:
 
     extra_msgs_per_assistant = cost_details.get("extra_msgs_per_assistant", 0)
     extra_mins_per_assistant = cost_details.get("extra_mins_per_assistant", 0)
-    num_agents = st.session_state.get("client_desired_agents", 1)
     additional_agents = max(num_agents - 1, 0)
 
     # Additional agent cost (Enterprise)
     add_use_case_zar = cost_details.get("additional_use_case_cost_zar", 0)
-    ex_rate = exchange_rates.get(selected_currency, 1.0)
-    if selected_currency == "ZAR":
-        final_factor = 1.0
-    else:
-        final_factor = 1.3 * 1.15
-    add_use_case_conv = (add_use_case_zar / ex_rate) * final_factor
-    disp_add_use_case_conv = math.ceil(add_use_case_conv)
 
     # Overages
     extra_messages_used = cost_details["extra_messages_used"]
     extra_minutes_used = cost_details["extra_minutes_used"]
     extra_msg_cost_zar = cost_details["extra_msg_cost_zar"]
     extra_min_cost_zar = cost_details["extra_min_cost_zar"]
-    extra_msg_cost_conv = (extra_msg_cost_zar / ex_rate) * final_factor
-    extra_min_cost_conv = (extra_min_cost_zar / ex_rate) * final_factor
-    disp_extra_msg_cost = math.ceil(extra_msg_cost_conv)
-    disp_extra_min_cost = math.ceil(extra_min_cost_conv)
-
-    st.markdown(f"""
-    <div class="steve-jobs-style">
-    <p>Hello <span class="highlight">Client</span>,</p>
-    <p>We appreciate your interest in askAYYI. Below is a simple breakdown of your monthly and once-off costs.</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f"""
-    <div class="card">
-        <h4>Monthly Cost</h4>
-        <p style="font-size:1.2em;">
-            {symbol}{disp_monthly_cost:,}
-            <br/><span style="font-size:0.85em;">
-            (Includes messages, minutes, and {cost_details['maintenance_hours']} monthly maintenance hrs)
-            </span>
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f"""
-    <div class="card">
-        <h4>One-Time Setup</h4>
-        <p style="font-size:1.2em;">
-            {symbol}{disp_setup_cost:,}
-            <br/><span style="font-size:0.85em;">
-            (Covers necessary setup & on-boarding)
-            </span>
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+
+    # ZAR -> selected currency for all ZAR amounts at once, rounded up for display
+    zar_to_selected = currency_factor(selected_currency)
+    zar_amounts = np.array([add_use_case_zar, extra_msg_cost_zar, extra_min_cost_zar], dtype=np.float64)
+    disp_add_use_case_conv, disp_extra_msg_cost, disp_extra_min_cost = (
+        np.ceil(zar_amounts * zar_to_selected).astype(int).tolist()
+    )
+
+    # Build the whole quote as one HTML blob so it renders as a single element
+    html_parts = [
+        QUOTE_GREETING_HTML,
+        QUOTE_MONTHLY_TMPL(sym=symbol, cost=disp_monthly_cost, hours=cost_details['maintenance_hours']),
+        QUOTE_SETUP_TMPL(sym=symbol, cost=disp_setup_cost),
+    ]
 
     # Additional Assistants display (only if the user actually has more than 1)
     if additional_agents > 0:
-        st.markdown(f"""
-        <div class="card">
-            <h4>Additional Assistant(s)</h4>
-            <p style="font-size:1.2em;">
-                {additional_agents} total<br/>
-                +{extra_msgs_per_assistant * additional_agents} msgs & +{extra_mins_per_assistant * additional_agents} mins<br/>
-        """, unsafe_allow_html=True)
         # If the plan charges a monthly extra use-case fee:
+        fee_line = ""
         if disp_add_use_case_conv > 0:
-            st.markdown(f"""
-                <strong>Monthly Add-On: {symbol}{disp_add_use_case_conv:,}</strong>
-            """, unsafe_allow_html=True)
-        st.markdown("</p></div>", unsafe_allow_html=True)
+            fee_line = QUOTE_ADDON_FEE_TMPL(sym=symbol, cost=disp_add_use_case_conv)
+        html_parts.append(QUOTE_ADDON_TMPL(
+            agents=additional_agents,
+            msgs=extra_msgs_per_assistant * additional_agents,
+            mins=extra_mins_per_assistant * additional_agents,
+            fee_line=fee_line,
+        ))
 
     # Overages (show only if they exist)
     if extra_messages_used > 0 or extra_minutes_used > 0:
-        st.markdown(f"""
-        <div class="card">
-            <h4>Possible Overage Charges</h4>
-            <p style="font-size:1.1em;">
-        """, unsafe_allow_html=True)
+        overage_lines = []
         if extra_messages_used > 0:
-            st.markdown(f"- Extra Messages: {extra_messages_used:,} => {symbol}{disp_extra_msg_cost:,}<br/>", unsafe_allow_html=True)
+            overage_lines.append(QUOTE_EXTRA_MSGS_TMPL(used=extra_messages_used, sym=symbol, cost=disp_extra_msg_cost))
         if extra_minutes_used > 0:
-            st.markdown(f"- Extra Minutes: {extra_minutes_used:,} => {symbol}{disp_extra_min_cost:,}", unsafe_allow_html=True)
-        st.markdown("</p></div>", unsafe_allow_html=True)
+            overage_lines.append(QUOTE_EXTRA_MINS_TMPL(used=extra_minutes_used, sym=symbol, cost=disp_extra_min_cost))
+        html_parts.append(QUOTE_OVERAGES_TMPL(lines="\n".join(overage_lines)))
 
-    st.write("---")
-    st.markdown(f"""
-    <div class="card">
-        <h4>Total Commitment</h4>
-        <p style="font-size:1.2em;">
-            {symbol}{disp_plan_duration_cost:,} <br/>
-            Over {plan_min_duration} months + Setup
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f"""
-    <div class="steve-jobs-style">
-    <p>Each month, you'll have ~<span class="highlight">{included_msgs:,}</span> messages 
-    and <span class="highlight">{included_mins:,}</span> minutes included.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    html_parts.append("<hr/>")
+    html_parts.append(QUOTE_TOTAL_TMPL(sym=symbol, cost=disp_plan_duration_cost, months=plan_min_duration))
+    html_parts.append(QUOTE_INCLUDED_TMPL(msgs=included_msgs, mins=included_mins))
+
+    st.markdown("\n".join(html_parts), unsafe_allow_html=True)
 
     st.success("Quotation is ready! Thank you for choosing askAYYI.")
     show_footer()
@@ -1748,17 +1960,17 @@ with tabs[5]:
     st.title("Saved Client Configurations by Reference")
     st.write("Enter or select a reference to load previous settings.")
 
-    all_client_configs = load_client_configs()
+    all_client_configs, references = cached_client_configs()
     if not all_client_configs:
         st.info("No configurations saved yet.")
         show_footer()
         st.stop()
 
-    references = list(all_client_configs.keys())
     selected_ref = st.selectbox("Choose a reference to load", options=references)
 
     if st.button("Load Configuration"):
         config_data = all_client_configs[selected_ref]
+        st.session_state.pop("_last_calc_sig", None)
         st.session_state["client_assigned_plan"] = config_data.get("assigned_plan", "Basic")
         st.session_state["estimated_messages"] = config_data.get("estimated_messages", 0)
         st.session_state["estimated_minutes"] = config_data.get("estimated_minutes", 0)
@@ -1802,6 +2014,11 @@ with tabs[6]:
 
     st.title("Admin Dashboard")
     st.write("This section is **internal** and shows advanced configuration & profit details.")
+    if st.button("Log out"):
+        st.session_state.pop("_admin_ok", None)
+        st.session_state.pop("password_correct", None)
+        # Stop here so the rest of the admin page is not drawn after logout
+        st.rerun()
     st.markdown("---")
 
     # -- GLOBAL SETTINGS --
@@ -1876,162 +2093,178 @@ with tabs[6]:
     # EXCHANGE RATES
     st.subheader("Exchange Rates")
     with st.form("exchange_rates_form"):
-        exchange_rate_inputs = {}
-        for currency_ in SUPPORTED_CURRENCIES:
-            if currency_ == "ZAR":
-                continue
-            # Ensure existing is float
-            current_rate = float(exchange_rates.get(currency_, DEFAULT_EXCHANGE_RATES.get(currency_, 1.0)))
-            exchange_rate_inputs[currency_] = st.number_input(
-                f"1 {currency_} = X ZAR",
-                value=current_rate,
-                step=0.001
-            )
+        # One editable row per non-ZAR currency (ensure existing rates are float)
+        df_rates = pd.DataFrame({
+            "Currency": [c for c in SUPPORTED_CURRENCIES if c != "ZAR"],
+            "Rate (1 unit = X ZAR)": [
+                float(exchange_rates.get(c, DEFAULT_EXCHANGE_RATES.get(c, 1.0)))
+                for c in SUPPORTED_CURRENCIES if c != "ZAR"
+            ],
+        })
+        edited_rates = st.data_editor(
+            df_rates,
+            num_rows="fixed",
+            disabled=["Currency"],
+            hide_index=True,
+            column_config={
+                "Rate (1 unit = X ZAR)": st.column_config.NumberColumn(
+                    required=True, min_value=0.001, step=0.001, format="%.3f"
+                ),
+            },
+            key="rates_editor",
+        )
         save_exchange_rates_btn = st.form_submit_button("Save Exchange Rates")
         if save_exchange_rates_btn:
-            for ccy, rate in exchange_rate_inputs.items():
-                exchange_rates[ccy] = rate
-            save_config(EXCHANGE_RATES_FILE, exchange_rates)
-            st.success("Exchange rates updated.")
+            new_rates = {
+                ccy: float(rate)
+                for ccy, rate in zip(edited_rates["Currency"], edited_rates["Rate (1 unit = X ZAR)"])
+            }
+            # A cleared cell comes back as NaN; every conversion divides by the rate
+            bad = [ccy for ccy, rate in new_rates.items() if not (math.isfinite(rate) and rate > 0)]
+            if bad:
+                st.error(f"Enter a positive rate for: {', '.join(bad)}. Nothing was saved.")
+            else:
+                exchange_rates.update(new_rates)
+                save_config(EXCHANGE_RATES_FILE, exchange_rates)
+                currency_factor.clear()
+                st.success("Exchange rates updated.")
 
     st.markdown("---")
 
     # -- PLAN CONFIGURATIONS --
     st.header("Plan Configurations")
-    plan_options = list(pricing["plans"].keys())
-    selected_plan = st.selectbox("Select Plan to Edit", options=plan_options)
+    selected_plan = st.selectbox("Select Plan to Edit", options=plan_names)
 
     plan_details = pricing["plans"][selected_plan]
-
-    st.markdown(f"### {selected_plan} - Basic Parameters")
-    colp1, colp2, colp3 = st.columns(3)
-    with colp1:
-        new_setup_fee = st.number_input("Setup Fee (ZAR)", value=plan_details.get("setup_fee", 0), step=1000)
-        new_base_fee = st.number_input("Base Fee (ZAR)", value=plan_details.get("base_fee", 0), step=1000)
-    with colp2:
-        new_incl_msgs = st.number_input("Included Messages", value=plan_details.get("messages", 0), step=1000)
-        new_incl_mins = st.number_input("Included Minutes", value=plan_details.get("voice_minutes", 0), step=100)
-    with colp3:
-        new_maintenance_hours = st.number_input("Maintenance Hours (Mo.)", value=plan_details.get("maintenance_hours", 0), step=1)
-        new_maintenance_rate = st.number_input("Maintenance Rate (ZAR/hr)", value=plan_details.get("maintenance_hourly_rate", 0), step=50)
-
-    st.markdown("### Usage Cost Multipliers")
-    colp4, colp5, colp6 = st.columns(3)
-    with colp4:
-        new_base_msg_cost = st.number_input("Base Msg Cost (ZAR)", value=float(plan_details.get("base_msg_cost", 0.05)), step=0.01)
-        new_msg_markup = st.number_input("Msg Markup (x)", value=float(plan_details.get("msg_markup", 2.0)), step=0.1)
-    with colp5:
-        new_base_min_cost = st.number_input("Base Min Cost (ZAR)", value=float(plan_details.get("base_min_cost", 0.40)), step=0.01)
-        new_min_markup = st.number_input("Min Markup (x)", value=float(plan_details.get("min_markup", 2.0)), step=0.1)
-    with colp6:
-        new_contingency = st.number_input("Contingency (%)", value=float(plan_details.get("contingency_percent", 2.5)), step=0.1)
-        new_float_cost = st.number_input("Float Cost (ZAR)", value=plan_details.get("float_cost", 0), step=500)
-
-    st.markdown("### Setup & Technical Support")
-    colp7, colp8 = st.columns(2)
-    with colp7:
-        new_setup_hours = st.number_input("Setup Hours", value=plan_details.get("setup_hours", 0), step=1)
-        new_setup_hourly_rate = st.number_input("Setup Hourly Rate (ZAR)", value=plan_details.get("setup_hourly_rate", 0), step=50)
-    with colp8:
-        new_tech_support = st.number_input("Technical Support (ZAR)", value=plan_details.get("technical_support_cost", 0), step=500)
-        new_crm_access = st.checkbox("CRM Access?", value=plan_details.get("crm_access", False))
-
-    st.markdown("### Limitations & Platform")
-    colp9, colp10 = st.columns(2)
-    with colp9:
-        new_use_cases = plan_details.get("limitations", {}).get("use_cases", 1)
-        new_use_cases = st.number_input("Base # AI Agents", value=new_use_cases, step=1)
-    with colp10:
-        new_platforms = st.text_input("Supported Platforms", value=plan_details.get("platforms", "All Platforms"))
-
-    new_onboarding_hrs = st.number_input("Onboarding Hrs", value=plan_details.get("onboarding_support_hours", 0), step=1)
-
-    st.markdown("### Optional Add-Ons")
-    colp11, colp12 = st.columns(2)
-    with colp11:
-        white_labeling_cost = plan_details["optional_addons"].get("white_labeling", 0)
-        new_white_label = st.number_input("Whitelabel Fee (ZAR)", value=white_labeling_cost, step=1000)
-    with colp12:
-        cvoices_enabled = plan_details["optional_addons"].get("custom_voices", {}).get("enabled", False)
-        new_cvoices_enabled = st.checkbox("Enable Custom Voices?", value=cvoices_enabled)
-        cvoices_rate = plan_details["optional_addons"].get("custom_voices", {}).get("cost_per_voice", 0)
-        new_cvoices_rate = 0
-        if new_cvoices_enabled:
+    plan_floats = {k: float(plan_details.get(k, default)) for k, default in PLAN_FLOAT_DEFAULTS.items()}
+
+    with st.form("plan_config_form"):
+        st.markdown(f"### {selected_plan} - Basic Parameters")
+        colp1, colp2, colp3 = st.columns(3)
+        with colp1:
+            new_setup_fee = st.number_input("Setup Fee (ZAR)", value=plan_details.get("setup_fee", 0), step=1000)
+            new_base_fee = st.number_input("Base Fee (ZAR)", value=plan_details.get("base_fee", 0), step=1000)
+        with colp2:
+            new_incl_msgs = st.number_input("Included Messages", value=plan_details.get("messages", 0), step=1000)
+            new_incl_mins = st.number_input("Included Minutes", value=plan_details.get("voice_minutes", 0), step=100)
+        with colp3:
+            new_maintenance_hours = st.number_input("Maintenance Hours (Mo.)", value=plan_details.get("maintenance_hours", 0), step=1)
+            new_maintenance_rate = st.number_input("Maintenance Rate (ZAR/hr)", value=plan_details.get("maintenance_hourly_rate", 0), step=50)
+
+        st.markdown("### Usage Cost Multipliers")
+        colp4, colp5, colp6 = st.columns(3)
+        with colp4:
+            new_base_msg_cost = st.number_input("Base Msg Cost (ZAR)", value=plan_floats["base_msg_cost"], step=0.01)
+            new_msg_markup = st.number_input("Msg Markup (x)", value=plan_floats["msg_markup"], step=0.1)
+        with colp5:
+            new_base_min_cost = st.number_input("Base Min Cost (ZAR)", value=plan_floats["base_min_cost"], step=0.01)
+            new_min_markup = st.number_input("Min Markup (x)", value=plan_floats["min_markup"], step=0.1)
+        with colp6:
+            new_contingency = st.number_input("Contingency (%)", value=plan_floats["contingency_percent"], step=0.1)
+            new_float_cost = st.number_input("Float Cost (ZAR)", value=plan_details.get("float_cost", 0), step=500)
+
+        st.markdown("### Setup & Technical Support")
+        colp7, colp8 = st.columns(2)
+        with colp7:
+            new_setup_hours = st.number_input("Setup Hours", value=plan_details.get("setup_hours", 0), step=1)
+            new_setup_hourly_rate = st.number_input("Setup Hourly Rate (ZAR)", value=plan_details.get("setup_hourly_rate", 0), step=50)
+        with colp8:
+            new_tech_support = st.number_input("Technical Support (ZAR)", value=plan_details.get("technical_support_cost", 0), step=500)
+            new_crm_access = st.checkbox("CRM Access?", value=plan_details.get("crm_access", False))
+
+        st.markdown("### Limitations & Platform")
+        colp9, colp10 = st.columns(2)
+        with colp9:
+            new_use_cases = plan_details.get("limitations", {}).get("use_cases", 1)
+            new_use_cases = st.number_input("Base # AI Agents", value=new_use_cases, step=1)
+        with colp10:
+            new_platforms = st.text_input("Supported Platforms", value=plan_details.get("platforms", "All Platforms"))
+
+        new_onboarding_hrs = st.number_input("Onboarding Hrs", value=plan_details.get("onboarding_support_hours", 0), step=1)
+
+        st.markdown("### Optional Add-Ons")
+        colp11, colp12 = st.columns(2)
+        with colp11:
+            white_labeling_cost = plan_details["optional_addons"].get("white_labeling", 0)
+            new_white_label = st.number_input("Whitelabel Fee (ZAR)", value=white_labeling_cost, step=1000)
+        with colp12:
+            cvoices_enabled = plan_details["optional_addons"].get("custom_voices", {}).get("enabled", False)
+            new_cvoices_enabled = st.checkbox("Enable Custom Voices?", value=cvoices_enabled)
+            cvoices_rate = plan_details["optional_addons"].get("custom_voices", {}).get("cost_per_voice", 0)
+            # Always shown: the form only reruns on submit, so the checkbox can't reveal it
             new_cvoices_rate = st.number_input("Cost/Custom Voice (ZAR)", value=cvoices_rate, step=500)
 
-    al_enabled = plan_details["optional_addons"].get("additional_languages", {}).get("enabled", False)
-    new_al_enabled = st.checkbox("Enable Additional Languages?", value=al_enabled)
-    al_cost = plan_details["optional_addons"].get("additional_languages", {}).get("cost_per_language", 0)
-    new_al_cost = 0
-    if new_al_enabled:
+        al_enabled = plan_details["optional_addons"].get("additional_languages", {}).get("enabled", False)
+        new_al_enabled = st.checkbox("Enable Additional Languages?", value=al_enabled)
+        al_cost = plan_details["optional_addons"].get("additional_languages", {}).get("cost_per_language", 0)
         new_al_cost = st.number_input("Cost/Language (ZAR)", value=al_cost, step=500)
 
-    # Enterprise extras
-    if selected_plan == "Enterprise":
-        eopts = plan_details.get("additional_options", {})
-        cex1, cex2, cex3 = st.columns(3)
-        with cex1:
-            new_extra_msgs = st.number_input("Extra Msgs/Addl Agent", value=eopts.get("extra_messages_per_additional_assistant", 0), step=100)
-        with cex2:
-            new_extra_mins = st.number_input("Extra Mins/Addl Agent", value=eopts.get("extra_minutes_per_additional_assistant", 0), step=50)
-        with cex3:
-            new_use_case_fee = st.number_input("Cost/Additional AI Agent (Monthly)", value=eopts.get("add_use_case_fee", 0), step=1000)
-
-        new_setup_cost_per_assistant = st.number_input(
-            "Setup Cost/Assistant (ZAR)",
-            value=plan_details.get("setup_cost_per_assistant", 7800),
-            step=500
-        )
-    else:
-        new_extra_msgs = 0
-        new_extra_mins = 0
-        new_use_case_fee = 0
-        new_setup_cost_per_assistant = plan_details.get("setup_cost_per_assistant", 7800)
-
-    if st.button("Save Plan Configuration"):
-        p = pricing["plans"][selected_plan]
-        p["setup_fee"] = new_setup_fee
-        p["base_fee"] = new_base_fee
-        p["messages"] = new_incl_msgs
-        p["voice_minutes"] = new_incl_mins
-        p["maintenance_hours"] = new_maintenance_hours
-        p["maintenance_hourly_rate"] = new_maintenance_rate
-
-        p["base_msg_cost"] = new_base_msg_cost
-        p["msg_markup"] = new_msg_markup
-        p["base_min_cost"] = new_base_min_cost
-        p["min_markup"] = new_min_markup
-        p["contingency_percent"] = new_contingency
-        p["float_cost"] = new_float_cost
-
-        p["setup_hours"] = new_setup_hours
-        p["setup_hourly_rate"] = new_setup_hourly_rate
-        p["technical_support_cost"] = new_tech_support
-        p["crm_access"] = new_crm_access
-
-        p["platforms"] = new_platforms
-        p["onboarding_support_hours"] = new_onboarding_hrs
-        if "limitations" not in p:
-            p["limitations"] = {}
-        p["limitations"]["use_cases"] = new_use_cases
-        p["limitations"]["assistants"] = new_use_cases
-
-        p["optional_addons"]["white_labeling"] = new_white_label
-        p["optional_addons"]["custom_voices"]["enabled"] = new_cvoices_enabled
-        p["optional_addons"]["custom_voices"]["cost_per_voice"] = new_cvoices_rate
-        p["optional_addons"]["additional_languages"]["enabled"] = new_al_enabled
-        p["optional_addons"]["additional_languages"]["cost_per_language"] = new_al_cost
-
+        # Enterprise extras
         if selected_plan == "Enterprise":
-            if "additional_options" not in p:
-                p["additional_options"] = {}
-            p["additional_options"]["extra_messages_per_additional_assistant"] = new_extra_msgs
-            p["additional_options"]["extra_minutes_per_additional_assistant"] = new_extra_mins
-            p["additional_options"]["add_use_case_fee"] = new_use_case_fee
-            p["setup_cost_per_assistant"] = new_setup_cost_per_assistant
+            eopts = plan_details.get("additional_options", {})
+            cex1, cex2, cex3 = st.columns(3)
+            with cex1:
+                new_extra_msgs = st.number_input("Extra Msgs/Addl Agent", value=eopts.get("extra_messages_per_additional_assistant", 0), step=100)
+            with cex2:
+                new_extra_mins = st.number_input("Extra Mins/Addl Agent", value=eopts.get("extra_minutes_per_additional_assistant", 0), step=50)
+            with cex3:
+                new_use_case_fee = st.number_input("Cost/Additional AI Agent (Monthly)", value=eopts.get("add_use_case_fee", 0), step=1000)
+
+            new_setup_cost_per_assistant = st.number_input(
+                "Setup Cost/Assistant (ZAR)",
+                value=plan_details.get("setup_cost_per_assistant", 7800),
+                step=500
+            )
+        else:
+            new_extra_msgs = 0
+            new_extra_mins = 0
+            new_use_case_fee = 0
+            new_setup_cost_per_assistant = plan_details.get("setup_cost_per_assistant", 7800)
+
+        if st.form_submit_button("Save Plan Configuration"):
+            p = pricing["plans"][selected_plan]
+            p["setup_fee"] = new_setup_fee
+            p["base_fee"] = new_base_fee
+            p["messages"] = new_incl_msgs
+            p["voice_minutes"] = new_incl_mins
+            p["maintenance_hours"] = new_maintenance_hours
+            p["maintenance_hourly_rate"] = new_maintenance_rate
+
+            p["base_msg_cost"] = new_base_msg_cost
+            p["msg_markup"] = new_msg_markup
+            p["base_min_cost"] = new_base_min_cost
+            p["min_markup"] = new_min_markup
+            p["contingency_percent"] = new_contingency
+            p["float_cost"] = new_float_cost
+
+            p["setup_hours"] = new_setup_hours
+            p["setup_hourly_rate"] = new_setup_hourly_rate
+            p["technical_support_cost"] = new_tech_support
+            p["crm_access"] = new_crm_access
+
+            p["platforms"] = new_platforms
+            p["onboarding_support_hours"] = new_onboarding_hrs
+            if "limitations" not in p:
+                p["limitations"] = {}
+            p["limitations"]["use_cases"] = new_use_cases
+            p["limitations"]["assistants"] = new_use_cases
+
+            p["optional_addons"]["white_labeling"] = new_white_label
+            p["optional_addons"]["custom_voices"]["enabled"] = new_cvoices_enabled
+            p["optional_addons"]["custom_voices"]["cost_per_voice"] = new_cvoices_rate if new_cvoices_enabled else 0
+            p["optional_addons"]["additional_languages"]["enabled"] = new_al_enabled
+            p["optional_addons"]["additional_languages"]["cost_per_language"] = new_al_cost if new_al_enabled else 0
+
+            if selected_plan == "Enterprise":
+                if "additional_options" not in p:
+                    p["additional_options"] = {}
+                p["additional_options"]["extra_messages_per_additional_assistant"] = new_extra_msgs
+                p["additional_options"]["extra_minutes_per_additional_assistant"] = new_extra_mins
+                p["additional_options"]["add_use_case_fee"] = new_use_case_fee
+                p["setup_cost_per_assistant"] = new_setup_cost_per_assistant
 
-        save_config(PRICING_FILE, pricing)
-        st.success(f"Settings for {selected_plan} saved successfully!")
+            save_config(PRICING_FILE, pricing)
+            st.success(f"Settings for {selected_plan} saved successfully!")
 
     st.markdown("---")
 
@@ -2041,82 +2274,71 @@ with tabs[6]:
     st.subheader("LLM & Voice Cost Configuration (in USD)")
 
     # Ensure placeholders in session_state
-    st.session_state.setdefault("llm_cost_input_per_million", 0.0)
-    st.session_state.setdefault("llm_cost_output_per_million", 0.0)
-    st.session_state.setdefault("llm_avg_tokens_per_message", 750.0)
-    st.session_state.setdefault("llm_models_used", {
-        "perplexity": False,
-        "gpt4o-mini": False,
-        "gpt4o": False,
-        "llama": False,
-        "other": False
-    })
-    st.session_state.setdefault("voice_cost_twilio", 0.0)
-    st.session_state.setdefault("voice_cost_fixed", 0.0)
-    st.session_state.setdefault("voice_cost_transcriber", 0.0)
-    st.session_state.setdefault("voice_cost_model", 0.0)
-    st.session_state.setdefault("voice_cost_elevenlabs", 0.0)
-    st.session_state.setdefault("voice_cost_other", 0.0)
+    st.session_state.update({k: v for k, v in LLM_VOICE_DEFAULTS.items() if k not in st.session_state})
 
     # --- LLM Config ---
     with st.expander("Configure LLM Usage Cost", expanded=False):
-        st.write("**LLM Token Costs** (cost per 1M tokens)")
-        llm_cost_input = st.number_input(
-            "Cost per million input tokens ($)",
-            value=float(st.session_state["llm_cost_input_per_million"]),
-            step=0.001
-        )
-        llm_cost_output = st.number_input(
-            "Cost per million output tokens ($)",
-            value=float(st.session_state["llm_cost_output_per_million"]),
-            step=0.001
-        )
-        avg_tokens = st.number_input(
-            "Average tokens used per message",
-            value=float(st.session_state["llm_avg_tokens_per_message"]),
-            step=50.0
-        )
+        with st.form("llm_cost_form"):
+            st.write("**LLM Token Costs** (cost per 1M tokens)")
+            llm_cost_input = st.number_input(
+                "Cost per million input tokens ($)",
+                value=float(st.session_state["llm_cost_input_per_million"]),
+                step=0.001
+            )
+            llm_cost_output = st.number_input(
+                "Cost per million output tokens ($)",
+                value=float(st.session_state["llm_cost_output_per_million"]),
+                step=0.001
+            )
+            avg_tokens = st.number_input(
+                "Average tokens used per message",
+                value=float(st.session_state["llm_avg_tokens_per_message"]),
+                step=50.0
+            )
 
-        st.write("**Models** - Check all that apply:")
-        col_models_1, col_models_2 = st.columns([1,1])
-        with col_models_1:
-            perplexity_check = st.checkbox("Perplexity", value=st.session_state["llm_models_used"]["perplexity"])
-            gpt4o_mini_check = st.checkbox("gpt4o-mini", value=st.session_state["llm_models_used"]["gpt4o-mini"])
-            gpt4o_check = st.checkbox("gpt4o", value=st.session_state["llm_models_used"]["gpt4o"])
-        with col_models_2:
-            llama_check = st.checkbox("llama", value=st.session_state["llm_models_used"]["llama"])
-            other_check = st.checkbox("other LLM", value=st.session_state["llm_models_used"]["other"])
-
-        if st.button("Save LLM Costs"):
-            st.session_state["llm_cost_input_per_million"] = llm_cost_input
-            st.session_state["llm_cost_output_per_million"] = llm_cost_output
-            st.session_state["llm_avg_tokens_per_message"] = avg_tokens
-            st.session_state["llm_models_used"] = {
-                "perplexity": perplexity_check,
-                "gpt4o-mini": gpt4o_mini_check,
-                "gpt4o": gpt4o_check,
-                "llama": llama_check,
-                "other": other_check
-            }
-            st.success("LLM token cost configuration saved. All new calculations will include it automatically.")
+            st.write("**Models** - Check all that apply:")
+            models_used = st.session_state["llm_models_used"]
+            col_models_1, col_models_2 = st.columns([1,1])
+            with col_models_1:
+                perplexity_check = st.checkbox("Perplexity", value=models_used["perplexity"])
+                gpt4o_mini_check = st.checkbox("gpt4o-mini", value=models_used["gpt4o-mini"])
+                gpt4o_check = st.checkbox("gpt4o", value=models_used["gpt4o"])
+            with col_models_2:
+                llama_check = st.checkbox("llama", value=models_used["llama"])
+                other_check = st.checkbox("other LLM", value=models_used["other"])
+
+            if st.form_submit_button("Save LLM Costs"):
+                st.session_state.pop("_last_calc_sig", None)
+                st.session_state["llm_cost_input_per_million"] = llm_cost_input
+                st.session_state["llm_cost_output_per_million"] = llm_cost_output
+                st.session_state["llm_avg_tokens_per_message"] = avg_tokens
+                st.session_state["llm_models_used"] = {
+                    "perplexity": perplexity_check,
+                    "gpt4o-mini": gpt4o_mini_check,
+                    "gpt4o": gpt4o_check,
+                    "llama": llama_check,
+                    "other": other_check
+                }
+                st.success("LLM token cost configuration saved. All new calculations will include it automatically.")
 
     # --- Voice Config ---
     with st.expander("Configure Voice Minutes Cost", expanded=False):
-        voice_twilio = st.number_input("Twilio Cost ($/min)", value=float(st.session_state["voice_cost_twilio"]), step=0.001)
-        voice_fixed = st.number_input("Fixed Cost ($/min)", value=float(st.session_state["voice_cost_fixed"]), step=0.001)
-        voice_transcriber = st.number_input("Transcriber Cost ($/min)", value=float(st.session_state["voice_cost_transcriber"]), step=0.001)
-        voice_model = st.number_input("Model Cost ($/min)", value=float(st.session_state["voice_cost_model"]), step=0.001)
-        voice_elevenlabs = st.number_input("ElevenLabs Cost ($/min)", value=float(st.session_state["voice_cost_elevenlabs"]), step=0.001)
-        voice_other = st.number_input("Other Voice Cost ($/min)", value=float(st.session_state["voice_cost_other"]), step=0.001)
-
-        if st.button("Save Voice Costs"):
-            st.session_state["voice_cost_twilio"] = voice_twilio
-            st.session_state["voice_cost_fixed"] = voice_fixed
-            st.session_state["voice_cost_transcriber"] = voice_transcriber
-            st.session_state["voice_cost_model"] = voice_model
-            st.session_state["voice_cost_elevenlabs"] = voice_elevenlabs
-            st.session_state["voice_cost_other"] = voice_other
-            st.success("Voice minute cost configuration saved. You can integrate it into your plan cost as needed.")
+        with st.form("voice_cost_form"):
+            voice_twilio = st.number_input("Twilio Cost ($/min)", value=float(st.session_state["voice_cost_twilio"]), step=0.001)
+            voice_fixed = st.number_input("Fixed Cost ($/min)", value=float(st.session_state["voice_cost_fixed"]), step=0.001)
+            voice_transcriber = st.number_input("Transcriber Cost ($/min)", value=float(st.session_state["voice_cost_transcriber"]), step=0.001)
+            voice_model = st.number_input("Model Cost ($/min)", value=float(st.session_state["voice_cost_model"]), step=0.001)
+            voice_elevenlabs = st.number_input("ElevenLabs Cost ($/min)", value=float(st.session_state["voice_cost_elevenlabs"]), step=0.001)
+            voice_other = st.number_input("Other Voice Cost ($/min)", value=float(st.session_state["voice_cost_other"]), step=0.001)
+
+            if st.form_submit_button("Save Voice Costs"):
+                st.session_state["voice_cost_twilio"] = voice_twilio
+                st.session_state["voice_cost_fixed"] = voice_fixed
+                st.session_state["voice_cost_transcriber"] = voice_transcriber
+                st.session_state["voice_cost_model"] = voice_model
+                st.session_state["voice_cost_elevenlabs"] = voice_elevenlabs
+                st.session_state["voice_cost_other"] = voice_other
+                st.success("Voice minute cost configuration saved. You can integrate it into your plan cost as needed.")
 
     st.info(
         """
@@ -2133,63 +2355,83 @@ with tabs[6]:
     st.subheader("Profit & Cost Dashboard (Internal Only)")
     st.write("This margin breakdown is based on the last usage scenario from 'Client Calculator'.")
 
-    cost_details = st.session_state.get("client_cost_details", None)
+    ss = st.session_state
+    cost_details = ss.get("client_cost_details", None)
+    plan_name = ss.get("client_selected_plan", "Basic")
     if cost_details is None:
         st.warning("No recent client cost details. Please run 'Client Calculator' first.")
         show_footer()
         st.stop()
 
-    # Turn the cost_details into a DataFrame and remove underscores in column names
-    items_list = list(cost_details.items())
-    df_cost_details = pd.DataFrame(items_list, columns=["Parameter", "Amount"])
-    # Example transformation: "extra_minutes_used" -> "Extra Minutes Used"
-    df_cost_details["Parameter"] = df_cost_details["Parameter"].apply(
-        lambda x: x.replace("_", " ").title()
-    )
-    st.dataframe(df_cost_details, height=400)
-
-    # Approx profit analysis
-    final_monthly_cost_with_discount_zar = cost_details["final_monthly_cost_zar"]
-    discount_percentage = 0
-    if pricing.get("discounts_enabled", True):
-        discount_percentage = pricing.get("global_discount_rate", 0)
-    if discount_percentage > 0:
-        final_monthly_cost_with_discount_zar *= (1 - discount_percentage / 100)
-
-    revenue_zar = final_monthly_cost_with_discount_zar
+    # Expanders render their body even when collapsed; a toggle skips building
+    # and sending the table until it is asked for
+    if st.toggle("Show cost detail table", key="show_cost_details_table"):
+        # Turn the cost_details into a DataFrame, title-casing the keys on the way in
+        # e.g. "extra_minutes_used" -> "Extra Minutes Used"
+        df_cost_details = pd.DataFrame({
+            "Parameter": [k.replace("_", " ").title() for k in cost_details],
+            "Amount": list(cost_details.values()),
+        })
+        st.dataframe(df_cost_details, height=400)
+
+    # Recompute only after a config save or a new Client Calculator result
+    profit_cache = ss.get("_profit_cache")
+    if (
+        ss.get("_profit_dirty", True)
+        or profit_cache is None
+        or profit_cache["cost_details"] is not cost_details
+    ):
+        # Approx profit analysis
+        final_monthly_cost_with_discount_zar = cost_details["final_monthly_cost_zar"]
+        discount_percentage = 0
+        if pricing.get("discounts_enabled", True):
+            discount_percentage = pricing.get("global_discount_rate", 0)
+        if discount_percentage > 0:
+            final_monthly_cost_with_discount_zar *= (1 - discount_percentage / 100)
 
-    plan_name = st.session_state.get("client_selected_plan", "Basic")
-    try:
-        plan_config = pricing["plans"][plan_name]
-    except KeyError:
-        st.error(f"Plan '{plan_name}' not found.")
-        show_footer()
-        st.stop()
+        revenue_zar = final_monthly_cost_with_discount_zar
 
-    included_msgs = cost_details["included_msgs_after_conversion"]
-    included_mins = cost_details["included_mins_after_conversion"]
+        try:
+            plan_config = pricing["plans"][plan_name]
+        except KeyError:
+            st.error(f"Plan '{plan_name}' not found.")
+            show_footer()
+            st.stop()
 
-    # Our direct cost approximation:
-    base_msg_cost_zar = plan_config.get("base_msg_cost", 0.05)
-    base_min_cost_zar = plan_config.get("base_min_cost", 0.40)
-    tech_support_zar = plan_config.get("technical_support_cost", 0)
-    float_cost_zar = plan_config.get("float_cost", 0)
-
-    # Minimal approximation ignoring the LLM overhead here 
-    # (You can replicate the LLM overhead logic if you want to see "our cost" with LLM.)
-    our_estimated_direct_cost_zar = (
-        (base_msg_cost_zar * included_msgs)
-        + (base_min_cost_zar * included_mins)
-        + tech_support_zar
-        + float_cost_zar
-    )
+        included_msgs = cost_details["included_msgs_after_conversion"]
+        included_mins = cost_details["included_mins_after_conversion"]
+
+        # Our direct cost approximation:
+        base_msg_cost_zar = plan_config.get("base_msg_cost", 0.05)
+        base_min_cost_zar = plan_config.get("base_min_cost", 0.40)
+        tech_support_zar = plan_config.get("technical_support_cost", 0)
+        float_cost_zar = plan_config.get("float_cost", 0)
+
+        # Minimal approximation ignoring the LLM overhead here 
+        # (You can replicate the LLM overhead logic if you want to see "our cost" with LLM.)
+        our_estimated_direct_cost_zar = (
+            (base_msg_cost_zar * included_msgs)
+            + (base_min_cost_zar * included_mins)
+            + tech_support_zar
+            + float_cost_zar
+        )
 
-    profit_zar = revenue_zar - our_estimated_direct_cost_zar
-    profit_margin_pct = (profit_zar / revenue_zar * 100) if revenue_zar > 0 else 0
+        profit_zar = revenue_zar - our_estimated_direct_cost_zar
+        profit_margin_pct = (profit_zar / revenue_zar * 100) if revenue_zar > 0 else 0
+
+        profit_cache = {
+            "cost_details": cost_details,
+            "rows": (
+                ("**(Internal)** Revenue (ZAR after discount):", f"{revenue_zar:,.2f}"),
+                ("**(Internal)** Direct Cost (ZAR):", f"{our_estimated_direct_cost_zar:,.2f}"),
+                ("**(Internal)** Profit (ZAR):", f"{profit_zar:,.2f}"),
+                ("**(Internal)** Profit Margin:", f"{profit_margin_pct:,.2f}%"),
+            ),
+        }
+        ss["_profit_cache"] = profit_cache
+        ss["_profit_dirty"] = False
 
-    st.write("**(Internal)** Revenue (ZAR after discount):", f"{revenue_zar:,.2f}")
-    st.write("**(Internal)** Direct Cost (ZAR):", f"{our_estimated_direct_cost_zar:,.2f}")
-    st.write("**(Internal)** Profit (ZAR):", f"{profit_zar:,.2f}")
-    st.write("**(Internal)** Profit Margin:", f"{profit_margin_pct:,.2f}%")
+    for label, value in profit_cache["rows"]:
+        st.write(label, value)
 
     show_footer()
@@ -1,13 +1,28 @@
 import streamlit as st
-from streamlit.runtime.scriptrunner import RerunException, RerunData
+from streamlit.runtime.scriptrunner import RerunException, RerunData, get_script_run_ctx
 import json
 import os
+import sys
+import tempfile
+import copy
+import functools
+from operator import itemgetter
+import hashlib
+import hmac
+from dataclasses import dataclass, asdict, fields
 import pandas as pd
+import numpy as np
 import math
 from datetime import datetime
 import random
 from io import BytesIO
 import matplotlib.pyplot as plt
+from jsonschema import Draft7Validator
+
+try:
+    import orjson  # optional: much faster config parse/serialize
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # CONFIGURATION PATHS
@@ -16,12 +31,12 @@ CONFIG_DIR = 'config'
 PRICING_FILE = os.path.join(CONFIG_DIR, 'pricing.json')
 USAGE_LIMITS_FILE = os.path.join(CONFIG_DIR, 'usage_limits.json')
 EXCHANGE_RATES_FILE = os.path.join(CONFIG_DIR, 'exchange_rates.json')
-CLIENT_CONFIGS_FILE = os.path.join(CONFIG_DIR, 'client_configurations.json')
+CLIENT_CONFIGS_FILE = os.path.join(CONFIG_DIR, 'client_configurations.json')  # shared with the other dashboards
 
 # =============================================================================
 # DEFAULT DATA
 # =============================================================================
-DEFAULT_PRICING = {
+DEFAULT_PRICING_MUTABLE_TEMPLATE = {
     "plans": {
         "Basic": {
             "setup_hours": 12,
@@ -181,12 +196,94 @@ CURRENCY_SYMBOLS = {
     "AED": "د.إ"
 }
 
-SUPPORTED_CURRENCIES = ["ZAR", "EUR", "USD", "AED"]
+# Interned so the selectbox values stored in session_state compare by identity
+SUPPORTED_CURRENCIES = tuple(sys.intern(c) for c in ("ZAR", "EUR", "USD", "AED"))
 MIN_PLAN_DURATION = {"Basic": 3, "Advanced": 3, "Enterprise": 3}
+# =============================================================================
+# CONFIG SCHEMAS
+# =============================================================================
+# Only the shape and the fields the cost maths reads are checked; missing keys
+# are filled from the defaults by deep_merge, so nothing is "required".
+_NUMBER = {"type": "number"}
+_PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        key: _NUMBER for key in (
+            "base_fee", "base_msg_cost", "msg_markup", "base_min_cost", "min_markup",
+            "float_cost", "contingency_percent", "technical_support_hours",
+            "technical_support_hourly_rate", "setup_hours", "setup_hourly_rate",
+            "setup_cost_per_assistant", "assistant_monthly_fee", "messages",
+            "voice_minutes", "top_up_msg_multiplier", "top_up_min_multiplier",
+        )
+    } | {
+        "optional_addons": {"type": "object"},
+        "additional_options": {"type": "object"},
+    },
+}
+_PRICING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "plans": {"type": "object", "additionalProperties": _PLAN_SCHEMA},
+        "discounts_enabled": {"type": "boolean"},
+        "international_mode": {"type": "boolean"},
+        "whitelabel_waved": {"type": "boolean"},
+        "global_discount_rate": _NUMBER,
+        "fees_waived": {"type": "object"},
+        "international_markups": {"type": "object", "additionalProperties": _NUMBER},
+        "custom_payment_plans": {"type": "object"},
+    },
+}
+_USAGE_LIMITS_SCHEMA = {
+    "type": "object",
+    "additionalProperties": {
+        "type": "object",
+        "additionalProperties": _NUMBER,
+    },
+}
+_EXCHANGE_RATES_SCHEMA = {"type": "object", "additionalProperties": _NUMBER}
+
+_PRICING_VALIDATOR = Draft7Validator(_PRICING_SCHEMA)
+_USAGE_LIMITS_VALIDATOR = Draft7Validator(_USAGE_LIMITS_SCHEMA)
+_EXCHANGE_RATES_VALIDATOR = Draft7Validator(_EXCHANGE_RATES_SCHEMA)
+
+# Applied to every non-ZAR conversion (1.3 margin x 1.15 VAT)
+NON_ZAR_FINAL_FACTOR = 1.3 * 1.15
+
+def _patch_defaults():
+    # Per-assistant fees default to 0 except Enterprise's setup cost
+    plans = DEFAULT_PRICING_MUTABLE_TEMPLATE["plans"]
+    for plan_name in ("Basic", "Advanced"):
+        plans[plan_name]["setup_cost_per_assistant"] = 0
+        plans[plan_name]["assistant_monthly_fee"] = 0
+    plans["Enterprise"]["assistant_monthly_fee"] = 0
+
+_patch_defaults()
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+def json_loads(text):
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Strict JSON only; let the stdlib parser accept what it always
+            # has (NaN / Infinity tokens written by json.dump)
+            pass
+    return json.loads(text)
+
+def json_dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=4)
+
+def json_dumps_bytes(data):
+    # For files opened in binary mode: skips orjson's bytes -> str round trip
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode()
+
 def safe_int(value, default=0):
     try:
         return int(value)
@@ -199,120 +296,115 @@ def safe_float(value, default=0.0):
     except (TypeError, ValueError):
         return default
 
+# Fill keys missing from dst with src's values, recursing into nested dicts.
+# Returns (dst, changed); an already-complete config short-circuits on ==.
+def deep_merge(dst, src):
+    if dst == src:
+        return dst, False
+    changed = False
+    for k, v in src.items():
+        if k not in dst:
+            dst[k] = copy.deepcopy(v)
+            changed = True
+        elif isinstance(v, dict) and isinstance(dst[k], dict):
+            _, sub_changed = deep_merge(dst[k], v)
+            changed = changed or sub_changed
+    return dst, changed
+
+# Names of the regular files in CONFIG_DIR from one scandir, instead of an
+# isfile() stat per probe. Cleared whenever this module writes a config file.
+@functools.lru_cache(maxsize=1)
+def existing_config_files():
+    if not os.path.isdir(CONFIG_DIR):
+        return frozenset()
+    with os.scandir(CONFIG_DIR) as entries:
+        return frozenset(e.name for e in entries if e.is_file())
+
+def config_file_exists(file_path):
+    return os.path.basename(file_path) in existing_config_files()
+
 def initialize_configs():
     if not os.path.exists(CONFIG_DIR):
         os.makedirs(CONFIG_DIR)
+    existing_config_files.cache_clear()
 
     # Pricing file
-    if not os.path.isfile(PRICING_FILE):
+    if not config_file_exists(PRICING_FILE):
         with open(PRICING_FILE, 'w') as f:
-            DEFAULT_PRICING["plans"]["Basic"]["setup_cost_per_assistant"] = 0
-            DEFAULT_PRICING["plans"]["Basic"]["assistant_monthly_fee"] = 0
-            DEFAULT_PRICING["plans"]["Advanced"]["setup_cost_per_assistant"] = 0
-            DEFAULT_PRICING["plans"]["Advanced"]["assistant_monthly_fee"] = 0
-            DEFAULT_PRICING["plans"]["Enterprise"]["assistant_monthly_fee"] = 0
-            json.dump(DEFAULT_PRICING, f, indent=4)
+            f.write(json_dumps(DEFAULT_PRICING_MUTABLE_TEMPLATE))
     else:
         try:
             with open(PRICING_FILE, 'r') as f:
-                pricing = json.load(f)
+                pricing = json_loads(f.read())
         except json.JSONDecodeError:
             st.error("Pricing config invalid JSON. Re-creating with defaults.")
-            DEFAULT_PRICING["plans"]["Basic"]["setup_cost_per_assistant"] = 0
-            DEFAULT_PRICING["plans"]["Basic"]["assistant_monthly_fee"] = 0
-            DEFAULT_PRICING["plans"]["Advanced"]["setup_cost_per_assistant"] = 0
-            DEFAULT_PRICING["plans"]["Advanced"]["assistant_monthly_fee"] = 0
-            DEFAULT_PRICING["plans"]["Enterprise"]["assistant_monthly_fee"] = 0
-            pricing = DEFAULT_PRICING
-
-        if not isinstance(pricing, dict):
-            st.error("Pricing config is malformed. Replacing with defaults.")
-            DEFAULT_PRICING["plans"]["Basic"]["setup_cost_per_assistant"] = 0
-            DEFAULT_PRICING["plans"]["Basic"]["assistant_monthly_fee"] = 0
-            DEFAULT_PRICING["plans"]["Advanced"]["setup_cost_per_assistant"] = 0
-            DEFAULT_PRICING["plans"]["Advanced"]["assistant_monthly_fee"] = 0
-            DEFAULT_PRICING["plans"]["Enterprise"]["assistant_monthly_fee"] = 0
-            pricing = DEFAULT_PRICING
-
-        updated = False
-        if "plans" not in pricing:
-            pricing["plans"] = {}
+            pricing = copy.deepcopy(DEFAULT_PRICING_MUTABLE_TEMPLATE)
             updated = True
-        for plan_name, defaults in DEFAULT_PRICING["plans"].items():
-            if plan_name not in pricing["plans"]:
-                pricing["plans"][plan_name] = defaults
-                updated = True
+        else:
+            # A file that parsed is never overwritten because of a schema
+            # failure; _LazyConfigs falls back to the defaults in memory instead
+            if _PRICING_VALIDATOR.is_valid(pricing):
+                pricing, updated = deep_merge(pricing, DEFAULT_PRICING_MUTABLE_TEMPLATE)
             else:
-                for k, v in defaults.items():
-                    if k not in pricing["plans"][plan_name]:
-                        pricing["plans"][plan_name][k] = v
-                        updated = True
-                    elif isinstance(v, dict):
-                        for subk, subv in v.items():
-                            if subk not in pricing["plans"][plan_name][k]:
-                                pricing["plans"][plan_name][k][subk] = subv
-                                updated = True
-
-        for k in ["discounts_enabled", "international_mode", "whitelabel_waved", "global_discount_rate", "fees_waived"]:
-            if k not in pricing:
-                pricing[k] = DEFAULT_PRICING[k]
-                updated = True
-
-        if "international_markups" not in pricing:
-            pricing["international_markups"] = {}
+                updated = False
 
-        for p in ["Basic", "Advanced", "Enterprise"]:
-            if p in pricing["plans"]:
-                if "setup_cost_per_assistant" not in pricing["plans"][p]:
-                    pricing["plans"][p]["setup_cost_per_assistant"] = 0
-                if "assistant_monthly_fee" not in pricing["plans"][p]:
-                    pricing["plans"][p]["assistant_monthly_fee"] = 0
+        if isinstance(pricing, dict) and "international_markups" not in pricing:
+            pricing["international_markups"] = {}
 
         if updated:
             try:
                 with open(PRICING_FILE, 'w') as f:
-                    json.dump(pricing, f, indent=4)
+                    f.write(json_dumps(pricing))
             except IOError as e:
                 st.error(f"Unable to update pricing config: {e}")
 
     # Usage Limits
-    if not os.path.isfile(USAGE_LIMITS_FILE):
+    if not config_file_exists(USAGE_LIMITS_FILE):
         with open(USAGE_LIMITS_FILE, 'w') as f:
-            json.dump(DEFAULT_USAGE_LIMITS, f, indent=4)
+            f.write(json_dumps(DEFAULT_USAGE_LIMITS))
     else:
         try:
             with open(USAGE_LIMITS_FILE, 'r') as f:
-                json.load(f)
+                json_loads(f.read())
         except json.JSONDecodeError:
             st.error("Usage limits config invalid JSON. Re-creating with defaults.")
             with open(USAGE_LIMITS_FILE, 'w') as f:
-                json.dump(DEFAULT_USAGE_LIMITS, f, indent=4)
+                f.write(json_dumps(DEFAULT_USAGE_LIMITS))
 
     # Exchange Rates
-    if not os.path.isfile(EXCHANGE_RATES_FILE):
+    if not config_file_exists(EXCHANGE_RATES_FILE):
         with open(EXCHANGE_RATES_FILE, 'w') as f:
-            json.dump(DEFAULT_EXCHANGE_RATES, f, indent=4)
+            f.write(json_dumps(DEFAULT_EXCHANGE_RATES))
     else:
         try:
             with open(EXCHANGE_RATES_FILE, 'r') as f:
-                json.load(f)
+                json_loads(f.read())
         except json.JSONDecodeError:
             st.error("Exchange rates config invalid JSON. Re-creating with defaults.")
             with open(EXCHANGE_RATES_FILE, 'w') as f:
-                json.dump(DEFAULT_EXCHANGE_RATES, f, indent=4)
+                f.write(json_dumps(DEFAULT_EXCHANGE_RATES))
 
     # Client Configs
-    if not os.path.isfile(CLIENT_CONFIGS_FILE):
-        with open(CLIENT_CONFIGS_FILE, 'w') as f:
-            json.dump({}, f, indent=4)
+    if not config_file_exists(CLIENT_CONFIGS_FILE):
+        write_json_atomic(CLIENT_CONFIGS_FILE, {})
+
+# Parsed JSON keyed by (path, mtime), shared by the whole server process:
+# unchanged files are parsed once, not once per rerun. Callers get a deep copy
+# because pricing/exchange rates are edited in place.
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _load_json_cached(file_path, mtime):
+    with open(file_path, 'rb') as f:
+        return json_loads(f.read())
+
+def load_json(file_path):
+    return copy.deepcopy(_load_json_cached(file_path, os.path.getmtime(file_path)))
 
 def load_config(file_path):
-    if not os.path.isfile(file_path):
+    if not config_file_exists(file_path):
         st.error(f"Config file not found: {file_path}")
         return None
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return load_json(file_path)
     except json.JSONDecodeError:
         st.error(f"Invalid JSON in {file_path}.")
         return None
@@ -320,35 +412,76 @@ def load_config(file_path):
         st.error(f"Error reading {file_path}: {e}")
         return None
 
-def load_client_configs():
+# Write to a temp file and rename it over the target, so an interrupted
+# rerun never leaves a half-written config behind. The temp name is unique per
+# write: concurrent sessions saving the same file must not share one
+def write_json_atomic(file_path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json_dumps_bytes(data))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    existing_config_files.cache_clear()
+
+def _client_configs_mtime():
+    try:
+        return os.stat(CLIENT_CONFIGS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def _parsed_client_configs():
+    # Shared parse of CLIENT_CONFIGS_FILE (one file for all the dashboards);
+    # callers must copy before changing anything
     if not os.path.isfile(CLIENT_CONFIGS_FILE):
         return {}
-    with open(CLIENT_CONFIGS_FILE, 'r') as f:
-        return json.load(f)
+    try:
+        return _load_json_cached(CLIENT_CONFIGS_FILE, os.path.getmtime(CLIENT_CONFIGS_FILE))
+    except json.JSONDecodeError:
+        st.error("Client configurations file invalid JSON.")
+        return {}
+
+# Keyed on the file's mtime, so steady-state reruns reuse the same tuple
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _client_config_refs(mtime_ns):
+    return tuple(_parsed_client_configs())
+
+def list_client_config_refs():
+    return _client_config_refs(_client_configs_mtime())
+
+def load_client_config(ref_id):
+    # Copy of one reference's config (None if it is gone)
+    config_data = _parsed_client_configs().get(ref_id)
+    return copy.deepcopy(config_data) if config_data is not None else None
 
 def save_client_config(ref_id, config_data):
-    all_configs = load_client_configs()
+    all_configs = dict(_parsed_client_configs())
     all_configs[ref_id] = config_data
     try:
-        with open(CLIENT_CONFIGS_FILE, 'w') as f:
-            json.dump(all_configs, f, indent=4)
+        write_json_atomic(CLIENT_CONFIGS_FILE, all_configs)
     except IOError as e:
         st.error(f"Error saving client config: {e}")
 
 def custom_rerun():
-    raise RerunException(RerunData(query_string=""))
+    # st.rerun() exists from Streamlit 1.27; older versions need the raw exception
+    if hasattr(st, "rerun"):
+        st.rerun()
+    else:
+        raise RerunException(RerunData(query_string=""))
 
 def save_config(file_path, data):
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        write_json_atomic(file_path, data)
     except IOError as e:
         st.error(f"Error saving config to {file_path}: {e}")
     custom_rerun()
 
-def apply_custom_css():
-    st.markdown(
-        """
+_CUSTOM_CSS = """
         <style>
         .stApp {
             background-color: #FAFAFA;
@@ -470,15 +603,38 @@ def apply_custom_css():
             font-weight: bold;
             margin-bottom: 5px;
         }
+        /* "Compare All Plans" cards side by side in one markdown block */
+        .plan-compare {
+            display: flex;
+            gap: 1rem;
+        }
+        .plan-compare .card {
+            flex: 1;
+        }
+        /* Plan Assignment inputs at 3/4 width instead of a [3, 1] column split each
+           (scoped by a marker element: st.container has no key on streamlit 1.41) */
+        div[data-testid="stVerticalBlock"]:has(.plan-assignment-scope) div[data-testid="stNumberInput"],
+        div[data-testid="stVerticalBlock"]:has(.plan-assignment-scope) div[data-testid="stRadio"],
+        div[data-testid="stVerticalBlock"]:has(.plan-assignment-scope) div[data-testid="stCheckbox"],
+        div[data-testid="stVerticalBlock"]:has(.plan-assignment-scope) div[data-testid="stSelectbox"] {
+            max-width: 75%;
+        }
         </style>
-        """,
-        unsafe_allow_html=True
-    )
+        """
+
+def apply_custom_css():
+    # Re-sent on every run: Streamlit removes elements a rerun does not emit,
+    # so skipping the markdown call would drop the styles from the page
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+# SHA-256 of the admin password; compared in constant time
+_ADMIN_HASH = bytes.fromhex("02339627505ca926690a3be76db04e42d10b179199f4cd3273428b931fd7e4c4")
 
 def authenticate_admin():
     def check_password():
         def password_entered():
-            if st.session_state.get("password", "") == "RCS_18112@":
+            entered = st.session_state.get("password", "")
+            if hmac.compare_digest(_ADMIN_HASH, hashlib.sha256(entered.encode()).digest()):
                 st.session_state["password_correct"] = True
                 del st.session_state["password"]
             else:
@@ -506,20 +662,21 @@ def authenticate_admin():
 
     return check_password()
 
+# (wants_own_crm, msgs_bucket, mins_bucket) -> plan. Buckets count how many of
+# the Advanced (5000 msgs / 300 mins) and Enterprise (10000 / 500) thresholds
+# are exceeded; wanting your own CRM means at least Advanced.
+_PLAN_TIERS = ("Basic", "Advanced", "Enterprise")
+_PLAN_LUT = {
+    (wants_crm, msgs_bucket, mins_bucket): _PLAN_TIERS[max(msgs_bucket, mins_bucket, int(wants_crm))]
+    for wants_crm in (False, True)
+    for msgs_bucket in range(3)
+    for mins_bucket in range(3)
+}
+
 def assign_plan_based_on_inputs(messages_needed, minutes_needed, wants_own_crm, number_of_agents):
-    if wants_own_crm:
-        if messages_needed > 10000 or minutes_needed > 500:
-            return "Enterprise"
-        else:
-            return "Advanced"
-    else:
-        if messages_needed > 5000 or minutes_needed > 300:
-            if messages_needed > 10000 or minutes_needed > 500:
-                return "Enterprise"
-            else:
-                return "Advanced"
-        else:
-            return "Basic"
+    msgs_bucket = (messages_needed > 5000) + (messages_needed > 10000)
+    mins_bucket = (minutes_needed > 300) + (minutes_needed > 500)
+    return _PLAN_LUT[(bool(wants_own_crm), msgs_bucket, mins_bucket)]
 
 def show_footer():
     currency = st.session_state.get("selected_currency", "ZAR")
@@ -537,78 +694,242 @@ def show_footer():
 def usage_exceeds_threshold(used_m, used_min, plan_m, plan_min):
     return (used_m >= 0.9 * plan_m) or (used_min >= 0.9 * plan_min)
 
+_CEIL = math.ceil
+
 def round_up_to_even_10(value):
-    return math.ceil(value / 20.0) * 20
+    return _CEIL(value / 20.0) * 20
+
+def currency_factors(exchange_rates, currency):
+    # (exchange rate, markup) for showing ZAR amounts in the chosen currency
+    if currency == "ZAR":
+        return exchange_rates.get(currency, 1.0), 1.0
+    return exchange_rates.get(currency, 1.0), NON_ZAR_FINAL_FACTOR
+
+def zar_to_rounded_display(zar_amount, ex_rate, final_factor):
+    # round_up_to_even_10 inlined: called for every displayed amount
+    return _CEIL((zar_amount / ex_rate) * final_factor / 20.0) * 20
+
+# Per-plan values that only change when the pricing config changes
+@dataclass(frozen=True, slots=True)
+class PlanComputed:
+    base_fee_zar: float
+    float_cost_zar: float
+    contingency_percent: float
+    technical_support_hours: float
+    tech_rate_zar: float
+    technical_support_cost_zar: float
+    final_msg_cost_zar: float
+    final_min_cost_zar: float
+    total_base_setup_fee_zar: float
+    setup_cost_per_assistant_zar: float
+    assistant_monthly_fee_zar: float
+    included_msgs: int
+    included_mins: int
+    extra_msgs_per_assistant: int
+    extra_mins_per_assistant: int
+    top_up_msg_multiplier: float
+    top_up_min_multiplier: float
+    white_label_setup_zar: float
+
+# Result of calculate_plan_cost for one plan. Saved client configs store it as
+# a plain dict (asdict) and are turned back into one with from_dict.
+@dataclass(frozen=True, slots=True)
+class PlanCostResult:
+    final_monthly_cost_zar: float
+    total_monthly_cost_zar: float
+    total_setup_cost_zar: float
+    overall_total_cost_zar: float
+    total_monthly_cost: float
+    total_setup_cost: float
+    overall_total_cost: float
+    included_msgs_after_conversion: int
+    included_mins_after_conversion: int
+    extra_messages_used: int
+    extra_minutes_used: int
+    extra_msg_cost_zar: float
+    extra_min_cost_zar: float
+    whitelabel_fee_zar: float
+    custom_voices_cost_zar: float
+    additional_languages_cost_zar: float
+    setup_fee_zar: float
+    setup_cost_assistants_zar: float
+    assistant_monthly_cost_zar: float
+    technical_support_hours: float
+    technical_support_hourly_rate: float
+    technical_support_cost_zar: float
+    base_fee_zar: float
+    final_msg_cost_zar: float
+    final_min_cost_zar: float
+    cost_of_included_messages_zar: float
+    cost_of_included_minutes_zar: float
+    absorbed_msgs_for_assistants: int
+    absorbed_mins_for_assistants: int
+
+    @classmethod
+    def from_dict(cls, data):
+        # Older saves may lack newer fields
+        return cls(**{f.name: data.get(f.name, 0) for f in fields(cls)})
+
+@st.cache_resource(show_spinner=False)
+def get_compiled_plans():
+    # {(plan_name, pricing_hash): PlanComputed}, shared across reruns; also
+    # holds the per-currency international factors for each pricing hash
+    return {}
+
+# Fallbacks for plan keys a (possibly older) pricing config may lack, in the
+# order compile_plan unpacks them
+_PLAN_DEFAULTS = {
+    "base_fee": 0,
+    "base_msg_cost": 0.05,
+    "msg_markup": 2.0,
+    "base_min_cost": 0.40,
+    "min_markup": 2.0,
+    "float_cost": 0,
+    "contingency_percent": 2.5,
+    "technical_support_hours": 0,
+    "technical_support_hourly_rate": 0,
+    "setup_hours": 0,
+    "setup_hourly_rate": 850,
+    "setup_cost_per_assistant": 0,
+    "assistant_monthly_fee": 0,
+    "messages": 0,
+    "voice_minutes": 0,
+    "top_up_msg_multiplier": 1.0,
+    "top_up_min_multiplier": 1.0,
+}
+_PLAN_FIELDS = itemgetter(*_PLAN_DEFAULTS)
+
+def compile_plan(plan_name, pricing, pricing_hash):
+    compiled_plans = get_compiled_plans()
+    key = (plan_name, pricing_hash)
+    pc = compiled_plans.get(key)
+    if pc is not None:
+        return pc
 
-def calculate_plan_cost(
-    plan_name, 
-    num_agents,
-    usage, 
-    addons, 
-    exchange_rates, 
-    selected_currency, 
-    pricing,
-    usage_limits,
-    communication_type
-):
     plan_config = pricing["plans"][plan_name]
     fees_waived = pricing.get("fees_waived", {})
-    setup_fee_waived = fees_waived.get("setup_fee", False)
-    technical_support_fee_waived = fees_waived.get("technical_support_fee", False)
-
-    base_fee_zar = plan_config.get("base_fee", 0)
-    base_msg_cost_zar = plan_config.get("base_msg_cost", 0.05)
-    msg_markup = plan_config.get("msg_markup", 2.0)
-    base_min_cost_zar = plan_config.get("base_min_cost", 0.40)
-    min_markup = plan_config.get("min_markup", 2.0)
-    float_cost_zar = plan_config.get("float_cost", 0)
-    contingency_percent = plan_config.get("contingency_percent", 2.5) / 100.0
-    technical_support_hours = plan_config.get("technical_support_hours", 0)
-    tech_rate_zar = plan_config.get("technical_support_hourly_rate", 0)
-
-    final_msg_cost_zar = base_msg_cost_zar * msg_markup
-    final_min_cost_zar = base_min_cost_zar * min_markup
-
-    if technical_support_fee_waived:
+
+    (
+        base_fee, base_msg_cost, msg_markup, base_min_cost, min_markup,
+        float_cost, contingency_percent, technical_support_hours,
+        tech_rate_zar, setup_hours, setup_hourly_rate,
+        setup_cost_per_assistant, assistant_monthly_fee, messages,
+        voice_minutes, top_up_msg_multiplier, top_up_min_multiplier,
+    ) = _PLAN_FIELDS({**_PLAN_DEFAULTS, **plan_config})
+
+    if fees_waived.get("technical_support_fee", False):
         technical_support_cost_zar = 0
     else:
         technical_support_cost_zar = technical_support_hours * tech_rate_zar
 
-    total_base_setup_fee_zar = plan_config.get("setup_hours", 0) * plan_config.get("setup_hourly_rate", 850)
-    if setup_fee_waived:
+    if fees_waived.get("setup_fee", False):
         total_base_setup_fee_zar = 0
+    else:
+        total_base_setup_fee_zar = setup_hours * setup_hourly_rate
+
+    # Only Enterprise grants extra included usage per additional assistant
+    extra_opts = plan_config.get("additional_options", {}) if plan_name == "Enterprise" else {}
+
+    pc = PlanComputed(
+        base_fee_zar=base_fee,
+        float_cost_zar=float_cost,
+        contingency_percent=contingency_percent / 100.0,
+        technical_support_hours=technical_support_hours,
+        tech_rate_zar=tech_rate_zar,
+        technical_support_cost_zar=technical_support_cost_zar,
+        final_msg_cost_zar=base_msg_cost * msg_markup,
+        final_min_cost_zar=base_min_cost * min_markup,
+        total_base_setup_fee_zar=total_base_setup_fee_zar,
+        setup_cost_per_assistant_zar=setup_cost_per_assistant,
+        assistant_monthly_fee_zar=assistant_monthly_fee,
+        included_msgs=messages,
+        included_mins=voice_minutes,
+        extra_msgs_per_assistant=extra_opts.get("extra_messages_per_additional_assistant", 0),
+        extra_mins_per_assistant=extra_opts.get("extra_minutes_per_additional_assistant", 0),
+        top_up_msg_multiplier=top_up_msg_multiplier,
+        top_up_min_multiplier=top_up_min_multiplier,
+        white_label_setup_zar=plan_config.get("optional_addons", {}).get("white_label_setup", 0),
+    )
+    compiled_plans[key] = pc
+    return pc
+
+def get_international_factors(pricing, pricing_hash):
+    # {currency: 1 + markup%}; unlisted currencies fall back to the 30% default
+    compiled_plans = get_compiled_plans()
+    key = ("__international_factors__", pricing_hash)
+    factors = compiled_plans.get(key)
+    if factors is None:
+        factors = {
+            ccy: 1 + markup / 100.0
+            for ccy, markup in pricing.get("international_markups", {}).items()
+        }
+        compiled_plans[key] = factors
+    return factors
 
-    setup_cost_per_assistant_zar = plan_config.get("setup_cost_per_assistant", 0)
-    assistant_monthly_fee_zar = plan_config.get("assistant_monthly_fee", 0)
-
-    included_msgs = plan_config.get("messages", 0)
-    included_mins = plan_config.get("voice_minutes", 0)
-
-    if plan_name == "Enterprise":
-        extra_opts = plan_config.get("additional_options", {})
-        extra_msgs = extra_opts.get("extra_messages_per_additional_assistant", 0)
-        extra_mins = extra_opts.get("extra_minutes_per_additional_assistant", 0)
-        included_msgs = included_msgs + extra_msgs * num_agents
-        included_mins = included_mins + extra_mins * num_agents
+def calculate_plan_costs_batch(
+    plan_names,
+    num_agents,
+    usage,
+    addons,
+    exchange_rates,
+    selected_currency,
+    pricing,
+    usage_limits,
+    communication_type,
+    pricing_hash=None
+):
+    # Same arithmetic as calculate_plan_cost, but over every plan in plan_names
+    # at once: each per-plan value is a NumPy array indexed like plan_names.
+    plan_names = list(plan_names)
+    if pricing_hash is None:
+        pricing_hash = hash(json_dumps(pricing))
+    compiled = [compile_plan(p, pricing, pricing_hash) for p in plan_names]
+    plan_limits = [usage_limits[p] for p in plan_names]
+
+    def plan_col(field):
+        return np.array([getattr(pc, field) for pc in compiled])
+
+    def limit_col(key):
+        return np.array([l[key] for l in plan_limits])
+
+    base_fee_zar = plan_col("base_fee_zar")
+    float_cost_zar = plan_col("float_cost_zar")
+    contingency_percent = plan_col("contingency_percent")
+    technical_support_hours = plan_col("technical_support_hours")
+    tech_rate_zar = plan_col("tech_rate_zar")
+    final_msg_cost_zar = plan_col("final_msg_cost_zar")
+    final_min_cost_zar = plan_col("final_min_cost_zar")
+    technical_support_cost_zar = plan_col("technical_support_cost_zar")
+    total_base_setup_fee_zar = plan_col("total_base_setup_fee_zar")
+    setup_cost_per_assistant_zar = plan_col("setup_cost_per_assistant_zar")
+    assistant_monthly_fee_zar = plan_col("assistant_monthly_fee_zar")
+
+    included_msgs = plan_col("included_msgs") + plan_col("extra_msgs_per_assistant") * num_agents
+    included_mins = plan_col("included_mins") + plan_col("extra_mins_per_assistant") * num_agents
 
     additional_agents_needed = num_agents
     setup_cost_assistants_zar = additional_agents_needed * setup_cost_per_assistant_zar
     assistant_monthly_cost_zar = additional_agents_needed * assistant_monthly_fee_zar
 
-    if communication_type == "Just Messages":
-        cost_of_included_mins_zar = included_mins * final_min_cost_zar
-        extra_msgs_from_mins = 0
-        if final_msg_cost_zar != 0:
-            extra_msgs_from_mins = int(cost_of_included_mins_zar / final_msg_cost_zar)
-        included_msgs += extra_msgs_from_mins
-        included_mins = 0
-    elif communication_type == "Just Minutes":
-        cost_of_included_msgs_zar = included_msgs * final_msg_cost_zar
-        extra_mins_from_msgs = 0
-        if final_min_cost_zar != 0:
-            extra_mins_from_msgs = int(cost_of_included_msgs_zar / final_min_cost_zar)
-        included_mins += extra_mins_from_msgs
-        included_msgs = 0
+    match communication_type:
+        case "Just Messages":
+            cost_of_included_mins_zar = included_mins * final_min_cost_zar
+            extra_msgs_from_mins = np.divide(
+                cost_of_included_mins_zar, final_msg_cost_zar,
+                out=np.zeros(len(plan_names)), where=final_msg_cost_zar != 0
+            )
+            included_msgs = included_msgs + np.trunc(extra_msgs_from_mins).astype(int)
+            included_mins = np.zeros(len(plan_names), dtype=int)
+        case "Just Minutes":
+            cost_of_included_msgs_zar = included_msgs * final_msg_cost_zar
+            extra_mins_from_msgs = np.divide(
+                cost_of_included_msgs_zar, final_min_cost_zar,
+                out=np.zeros(len(plan_names)), where=final_min_cost_zar != 0
+            )
+            included_mins = included_mins + np.trunc(extra_mins_from_msgs).astype(int)
+            included_msgs = np.zeros(len(plan_names), dtype=int)
+        case _:
+            pass
 
     cost_of_msgs_zar = included_msgs * final_msg_cost_zar
     cost_of_mins_zar = included_mins * final_min_cost_zar
@@ -622,49 +943,56 @@ def calculate_plan_cost(
         + assistant_monthly_cost_zar
     )
 
-    base_included_messages = usage_limits[plan_name]["base_messages"]
-    base_included_minutes = usage_limits[plan_name]["base_minutes"]
-    top_up_msg_multiplier = plan_config.get("top_up_msg_multiplier", 1.0)
-    top_up_min_multiplier = plan_config.get("top_up_min_multiplier", 1.0)
-    cost_per_extra_message = usage_limits[plan_name]["cost_per_additional_message"] * top_up_msg_multiplier
-    cost_per_extra_minute = usage_limits[plan_name]["cost_per_additional_minute"] * top_up_min_multiplier
+    base_included_messages = limit_col("base_messages")
+    base_included_minutes = limit_col("base_minutes")
+    top_up_msg_multiplier = plan_col("top_up_msg_multiplier")
+    top_up_min_multiplier = plan_col("top_up_min_multiplier")
+    cost_per_extra_message = limit_col("cost_per_additional_message") * top_up_msg_multiplier
+    cost_per_extra_minute = limit_col("cost_per_additional_minute") * top_up_min_multiplier
 
-    extra_messages_used = max(0, usage["used_messages"] - base_included_messages)
-    extra_minutes_used = max(0, usage["used_minutes"] - base_included_minutes)
+    extra_messages_used = np.maximum(0, usage["used_messages"] - base_included_messages)
+    extra_minutes_used = np.maximum(0, usage["used_minutes"] - base_included_minutes)
     extra_msg_cost_zar = extra_messages_used * cost_per_extra_message
     extra_min_cost_zar = extra_minutes_used * cost_per_extra_minute
-    monthly_cost_zar += (extra_msg_cost_zar + extra_min_cost_zar)
+    monthly_cost_zar = monthly_cost_zar + (extra_msg_cost_zar + extra_min_cost_zar)
 
-    monthly_cost_zar *= (1 + contingency_percent)
+    monthly_cost_zar = monthly_cost_zar * (1 + contingency_percent)
 
     total_setup_cost_zar = total_base_setup_fee_zar + setup_cost_assistants_zar
 
     if pricing.get("international_mode", False):
-        int_markup_dict = pricing.get("international_markups", {})
-        int_markup = int_markup_dict.get(selected_currency, 30)
-        factor = 1 + int_markup / 100.0
-        monthly_cost_zar *= factor
-        extra_msg_cost_zar *= factor
-        extra_min_cost_zar *= factor
-        total_base_setup_fee_zar *= factor
-        technical_support_cost_zar *= factor
-        setup_cost_assistants_zar *= factor
-        assistant_monthly_cost_zar *= factor
+        factor = get_international_factors(pricing, pricing_hash).get(selected_currency, 1.3)
+        # One (7, n_plans) multiply instead of seven separate ones
+        (
+            monthly_cost_zar,
+            extra_msg_cost_zar,
+            extra_min_cost_zar,
+            total_base_setup_fee_zar,
+            technical_support_cost_zar,
+            setup_cost_assistants_zar,
+            assistant_monthly_cost_zar,
+        ) = np.array([
+            monthly_cost_zar,
+            extra_msg_cost_zar,
+            extra_min_cost_zar,
+            total_base_setup_fee_zar,
+            technical_support_cost_zar,
+            setup_cost_assistants_zar,
+            assistant_monthly_cost_zar,
+        ], dtype=np.float64) * factor
         total_setup_cost_zar = total_base_setup_fee_zar + setup_cost_assistants_zar
 
-    exchange_rate = exchange_rates.get(selected_currency, 1.0)
-    if selected_currency == "ZAR":
-        final_factor = 1.0
-    else:
-        final_factor = 1.3 * 1.15
+    exchange_rate, final_factor = currency_factors(exchange_rates, selected_currency)
 
     monthly_cost_converted = (monthly_cost_zar / exchange_rate) * final_factor
     setup_cost_converted = (total_setup_cost_zar / exchange_rate) * final_factor
 
-    whitelabel_fee_zar = plan_config["optional_addons"].get("white_label_setup", 0) if addons.get("white_labeling") else 0
-    if pricing.get("whitelabel_waved", False) and whitelabel_fee_zar > 0:
-        whitelabel_fee_zar = 0
+    if addons.get("white_labeling") and not pricing.get("whitelabel_waved", False):
+        whitelabel_fee_zar = plan_col("white_label_setup_zar")
+    else:
+        whitelabel_fee_zar = np.zeros(len(plan_names), dtype=int)
 
+    # Add-on costs do not depend on the plan, so they broadcast as scalars
     custom_voices_cost_zar = 0
     if addons.get("custom_voices", {}).get("enabled"):
         q = addons["custom_voices"]["quantity"]
@@ -678,18 +1006,23 @@ def calculate_plan_cost(
         additional_languages_cost_zar = q * cost_per_lang
 
     if pricing.get("international_mode", False):
-        whitelabel_fee_zar *= factor
-        custom_voices_cost_zar *= factor
-        additional_languages_cost_zar *= factor
+        whitelabel_fee_zar, custom_voices_cost_zar, additional_languages_cost_zar = np.array([
+            whitelabel_fee_zar,
+            np.broadcast_to(custom_voices_cost_zar, whitelabel_fee_zar.shape),
+            np.broadcast_to(additional_languages_cost_zar, whitelabel_fee_zar.shape),
+        ], dtype=np.float64) * factor
 
     total_monthly_addons_zar = custom_voices_cost_zar + additional_languages_cost_zar
     final_monthly_cost_zar = monthly_cost_zar + total_monthly_addons_zar
     final_monthly_cost_converted = (final_monthly_cost_zar / exchange_rate) * final_factor
 
-    total_setup_cost_zar += whitelabel_fee_zar
+    total_setup_cost_zar = total_setup_cost_zar + whitelabel_fee_zar
     overall_total_cost_zar = (final_monthly_cost_zar * 12) + total_setup_cost_zar
     overall_total_cost_converted = (overall_total_cost_zar / exchange_rate) * final_factor
 
+    def per_plan(value):
+        return np.broadcast_to(value, (len(plan_names),))
+
     return {
         "final_monthly_cost_zar": monthly_cost_zar,
         "total_monthly_cost_zar": final_monthly_cost_zar,
@@ -705,8 +1038,8 @@ def calculate_plan_cost(
         "extra_msg_cost_zar": extra_msg_cost_zar,
         "extra_min_cost_zar": extra_min_cost_zar,
         "whitelabel_fee_zar": whitelabel_fee_zar,
-        "custom_voices_cost_zar": custom_voices_cost_zar,
-        "additional_languages_cost_zar": additional_languages_cost_zar,
+        "custom_voices_cost_zar": per_plan(custom_voices_cost_zar),
+        "additional_languages_cost_zar": per_plan(additional_languages_cost_zar),
         "setup_fee_zar": total_base_setup_fee_zar,
         "setup_cost_assistants_zar": setup_cost_assistants_zar,
         "assistant_monthly_cost_zar": assistant_monthly_cost_zar,
@@ -718,17 +1051,71 @@ def calculate_plan_cost(
         "final_min_cost_zar": final_min_cost_zar,
         "cost_of_included_messages_zar": cost_of_msgs_zar,
         "cost_of_included_minutes_zar": cost_of_mins_zar,
-        "absorbed_msgs_for_assistants": 0,
-        "absorbed_mins_for_assistants": 0
+        "absorbed_msgs_for_assistants": per_plan(0),
+        "absorbed_mins_for_assistants": per_plan(0)
     }
 
+# Memoized on all arguments: reruns with unchanged inputs skip the cost maths
+@st.cache_data(show_spinner=False, max_entries=128)
+def calculate_plan_cost(
+    plan_name, 
+    num_agents,
+    usage, 
+    addons, 
+    exchange_rates, 
+    selected_currency, 
+    pricing,
+    usage_limits,
+    communication_type,
+    pricing_hash=None
+):
+    # Single-plan wrapper: unpack row 0 back into plain Python numbers so the
+    # result can still be formatted and saved to JSON as before
+    batch = calculate_plan_costs_batch(
+        [plan_name], num_agents, usage, addons, exchange_rates,
+        selected_currency, pricing, usage_limits, communication_type, pricing_hash
+    )
+    return PlanCostResult(**{k: v[0].item() for k, v in batch.items()})
+
+@st.cache_resource(show_spinner=False)
+def ensure_config_files():
+    # Create/repair the JSON config files once per server process, not every rerun
+    initialize_configs()
+
+class _LazyConfigs:
+    # pricing / usage_limits / exchange_rates are loaded on first attribute
+    # access and then kept on the instance for the rest of the run
+    _SOURCES = {
+        "pricing": (PRICING_FILE, DEFAULT_PRICING_MUTABLE_TEMPLATE, _PRICING_VALIDATOR),
+        "usage_limits": (USAGE_LIMITS_FILE, DEFAULT_USAGE_LIMITS, _USAGE_LIMITS_VALIDATOR),
+        "exchange_rates": (EXCHANGE_RATES_FILE, DEFAULT_EXCHANGE_RATES, _EXCHANGE_RATES_VALIDATOR),
+    }
+
+    def __getattr__(self, name):
+        if name == "pricing_hash":
+            # Key for compile_plan(); computed once per run
+            value = hash(json_dumps(self.pricing))
+            setattr(self, name, value)
+            return value
+        try:
+            file_path, default, validator = self._SOURCES[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = load_config(file_path)
+        if value and not validator.is_valid(value):
+            # Malformed but parseable: leave the file alone, use defaults for now
+            st.warning(f"{file_path} does not match the expected format. Using defaults until it is fixed.")
+            value = None
+        # Never hand out the defaults themselves; callers edit configs in place
+        value = value or copy.deepcopy(default)
+        setattr(self, name, value)
+        return value
+
 # =============================================================================
 # RUN INITIAL CONFIG LOAD
 # =============================================================================
-initialize_configs()
-pricing = load_config(PRICING_FILE) or DEFAULT_PRICING
-usage_limits = load_config(USAGE_LIMITS_FILE) or DEFAULT_USAGE_LIMITS
-exchange_rates = load_config(EXCHANGE_RATES_FILE) or DEFAULT_EXCHANGE_RATES
+ensure_config_files()
+configs = _LazyConfigs()
 
 st.set_page_config(page_title="askAYYI Cost Calculator", layout="wide")
 apply_custom_css()
@@ -736,7 +1123,7 @@ apply_custom_css()
 # =============================================================================
 # CREATE APP TABS
 # =============================================================================
-tabs = st.tabs([
+TAB_LABELS = (
     "Plan Assignment",
     "Main Dashboard",
     "Quotation",
@@ -744,41 +1131,18 @@ tabs = st.tabs([
     "Admin Dashboard",
     "Your Current Costs",
     "Cost & Sales Breakdown",
-])
+)
+# A radio instead of st.tabs: st.tabs runs every tab body on every rerun,
+# here only the selected view's body executes
+active_tab = st.radio(
+    "View", TAB_LABELS, horizontal=True, key="_active_tab", label_visibility="collapsed"
+)
 
 # =============================================================================
 # TAB 0: Plan Assignment
 # =============================================================================
-with tabs[0]:
-    st.title("Plan Assignment")
-    st.write("""
-        Determine which plan (Basic, Advanced, or Enterprise) 
-        might best fit your needs. 
-        Hover over the “?” icons to see more details and examples.
-    """)
-
-    selected_currency = st.session_state.get("selected_currency", "ZAR")
-
-    # ---------------------------------------------------
-    # ESTIMATE YOUR MONTHLY USAGE
-    # ---------------------------------------------------
-    with st.expander("Estimate Your Monthly Usage", expanded=True):
-        st.write("Enter your monthly expected usage of messages and calls. Hover over the '?' for extra guidance.")
-
-        if "estimated_messages" not in st.session_state:
-            st.session_state["estimated_messages"] = 3000
-        if "estimated_minutes" not in st.session_state:
-            st.session_state["estimated_minutes"] = 200
-
-        st.markdown("#### Messages")
-        colA, _ = st.columns([3, 1])
-        with colA:
-            msg_conversations_per_month = st.number_input(
-                "Monthly Messaging Conversations",
-                min_value=0,
-                value=3000,
-                step=500,
-                help="""
+# Tooltip text for the Plan Assignment widgets
+_HELP_CONVERSATIONS = """
 **What does this mean?**  
 How many conversation threads you expect each month.  
 
@@ -790,17 +1154,9 @@ How many conversation threads you expect each month.
 **Tips:**  
 - If you're unsure, you can estimate to the nearest thousand. 
 - Remember this can vary by season, but we're looking for a good monthly average.
-                """
-            )
+"""
 
-        colA, _ = st.columns([3, 1])
-        with colA:
-            avg_msgs_per_convo = st.number_input(
-                "Average Messages per Conversation",
-                min_value=1,
-                value=5,
-                step=1,
-                help="""
+_HELP_AVG_MSGS = """
 **What does this mean?**  
 Roughly how many messages get exchanged in one conversation?
 
@@ -813,18 +1169,9 @@ Roughly how many messages get exchanged in one conversation?
 **Tips:**  
 - You can include both user and agent messages. 
 - Keep it simple; just use an average you usually see in your business.
-                """
-            )
+"""
 
-        st.markdown("#### Minutes")
-        colA, _ = st.columns([3, 1])
-        with colA:
-            calls_per_month = st.number_input(
-                "Number of Calls per Month",
-                min_value=0,
-                value=500,
-                step=100,
-                help="""
+_HELP_CALLS = """
 **What does this mean?**  
 How many voice calls you expect in total every month.
 
@@ -837,17 +1184,9 @@ How many voice calls you expect in total every month.
 - If you have both inbound (from the customer to you) 
   and outbound (from you to the customer), 
   add them together for a total.
-                """
-            )
+"""
 
-        colA, _ = st.columns([3, 1])
-        with colA:
-            avg_call_duration = st.number_input(
-                "Average Call Duration (minutes)",
-                min_value=0.0,
-                value=3.0,
-                step=0.5,
-                help="""
+_HELP_DURATION = """
 **What does this mean?**  
 How many minutes, on average, does each call last?
 
@@ -859,28 +1198,9 @@ How many minutes, on average, does each call last?
 **Tips:**  
 - Include talk time only. 
 - Rounding up or down by half a minute is okay.
-                """
-            )
-
-        total_minutes_needed = calls_per_month * avg_call_duration
-        total_messages_needed = msg_conversations_per_month * avg_msgs_per_convo
-        st.session_state["estimated_minutes"] = total_minutes_needed
-        st.session_state["estimated_messages"] = total_messages_needed
+"""
 
-    # ---------------------------------------------------
-    # CONFIGURE AGENTS
-    # ---------------------------------------------------
-    with st.expander("Configure Assistants", expanded=False):
-        st.write("How many extra AI assistants do you want, besides the main one included in some plans?")
-
-        colA, _ = st.columns([3, 1])
-        with colA:
-            desired_agents = st.number_input(
-                "Number of Additional Assistants",
-                min_value=0,
-                value=0,
-                step=1,
-                help="""
+_HELP_AGENTS = """
 **What does this mean?**  
 If you need more than the default number of AI-driven assistants, 
 enter how many additional ones.
@@ -892,21 +1212,9 @@ enter how many additional ones.
 **Tips:**  
 - Some plans (Basic or Advanced) may not allow multiple additional assistants. 
 - Enterprise often suits large teams or multiple specialized bots.
-                """
-            )
-        st.session_state["client_desired_agents"] = desired_agents
+"""
 
-    # ---------------------------------------------------
-    # CRM PREFERENCE
-    # ---------------------------------------------------
-    with st.expander("CRM Preference", expanded=False):
-        st.write("Choose whether you want to use the built-in askAYYI CRM or your own existing CRM system.")
-        colA, _ = st.columns([3, 1])
-        with colA:
-            crm_choice = st.radio(
-                "CRM Preference",
-                ["askAYYI CRM", "Your Own CRM"],
-                help="""
+_HELP_CRM = """
 **askAYYI CRM**  
 - Our ready-to-use CRM solution with minimal setup required.
 
@@ -917,22 +1225,9 @@ enter how many additional ones.
 **Example:**  
 - If you have no CRM right now, "askAYYI CRM" might be simpler.  
 - If you already use a robust CRM, choose "Your Own CRM."
-                """
-            )
-        st.session_state["client_crm_choice"] = crm_choice
+"""
 
-    # ---------------------------------------------------
-    # COMMUNICATION TYPE
-    # ---------------------------------------------------
-    with st.expander("Communication Type", expanded=False):
-        st.write("Do you plan to use both messaging and voice calls, or focus on only one type of interaction?")
-        colA, _ = st.columns([3, 1])
-        with colA:
-            communication_type = st.radio(
-                "Communication Type",
-                ["Both Messages & Voice", "Just Messages", "Just Minutes"],
-                index=0,
-                help="""
+_HELP_COMM = """
 **What does this mean?**  
 - "Both Messages & Voice": If your business handles text chats and phone calls.  
 - "Just Messages": If you only need texting/chat functionalities.  
@@ -942,126 +1237,52 @@ enter how many additional ones.
 **Example:**  
 - If your support is mostly chat-based, pick "Just Messages."  
 - If your main focus is voice calls, pick "Just Minutes."
-                """
-            )
-        st.session_state["client_communication_type"] = communication_type
+"""
 
-    # ---------------------------------------------------
-    # OPTIONAL ADD-ONS
-    # ---------------------------------------------------
-    with st.expander("Optional Add-Ons", expanded=False):
-        st.write("Customize your plan with White Labeling, Custom Voices, or Additional Languages.")
-        if "temp_addons_whitelabel" not in st.session_state:
-            st.session_state["temp_addons_whitelabel"] = False
-        if "temp_addons_cv_enabled" not in st.session_state:
-            st.session_state["temp_addons_cv_enabled"] = False
-        if "temp_addons_cv_qty" not in st.session_state:
-            st.session_state["temp_addons_cv_qty"] = 0
-        if "temp_addons_lang_enabled" not in st.session_state:
-            st.session_state["temp_addons_lang_enabled"] = False
-        if "temp_addons_lang_qty" not in st.session_state:
-            st.session_state["temp_addons_lang_qty"] = 0
-
-        wl_col, _ = st.columns([3,1])
-        with wl_col:
-            white_labeling = st.checkbox(
-                "White Labeling?", 
-                value=st.session_state["temp_addons_whitelabel"],
-                help="""
+_HELP_WL = """
 **What is White Labeling?**  
 Remove the askAYYI branding and replace it with your own company logos and text.
 
 **Example:**  
 - If you want full brand control, check this. 
 - If you don't mind seeing "askAYYI" as part of the interface, leave it unchecked.
-                """
-            )
+"""
 
-        cv_col, _ = st.columns([3,1])
-        with cv_col:
-            custom_voices = st.checkbox(
-                "Custom Voices?", 
-                value=st.session_state["temp_addons_cv_enabled"],
-                help="""
+_HELP_CV = """
 **What are Custom Voices?**  
 Create specialized voices tailored to your brand or department.
 
 **Example:**  
 - If you want your chatbot to speak like a specific character or brand persona, check this. 
 - If standard voice options are enough, you can leave it unchecked.
-                """
-            )
-        num_custom_voices = 0
-        if custom_voices:
-            cv2_col, _ = st.columns([3,1])
-            with cv2_col:
-                num_custom_voices = st.number_input(
-                    "Quantity of Custom Voices",
-                    min_value=0,
-                    value=st.session_state["temp_addons_cv_qty"],
-                    step=1,
-                    help="""
+"""
+
+_HELP_CV_QTY = """
 **How many unique voices do you need?**  
 - Enter the exact number of different custom voices you plan to have.
 
 **Example:**  
 - If you want two distinct voices (one for sales, one for support), type "2".
-                    """
-                )
+"""
 
-        al_col, _ = st.columns([3,1])
-        with al_col:
-            additional_languages = st.checkbox(
-                "Additional Languages?",
-                value=st.session_state["temp_addons_lang_enabled"],
-                help="""
+_HELP_LANG = """
 **What are Additional Languages?**  
 Offer support and interactions in more languages than the default plan includes.
 
 **Example:**  
 - If you already have English but also need Spanish and French, 
   check this box to add those languages.
-                """
-            )
-        num_additional_languages = 0
-        if additional_languages:
-            al2_col, _ = st.columns([3,1])
-            with al2_col:
-                num_additional_languages = st.number_input(
-                    "Quantity of Additional Languages",
-                    min_value=0,
-                    value=st.session_state["temp_addons_lang_qty"],
-                    step=1,
-                    help="""
+"""
+
+_HELP_LANG_QTY = """
 **How many extra languages do you want?**  
 - Enter the total number of new languages you need, beyond what's included.
 
 **Example:**  
 - If you're adding Spanish and French, that is two languages.
-                    """
-                )
+"""
 
-        st.session_state["temp_addons_whitelabel"] = white_labeling
-        st.session_state["temp_addons_cv_enabled"] = custom_voices
-        st.session_state["temp_addons_cv_qty"] = num_custom_voices
-        st.session_state["temp_addons_lang_enabled"] = additional_languages
-        st.session_state["temp_addons_lang_qty"] = num_additional_languages
-
-    # ---------------------------------------------------
-    # PAYMENT PREFERENCE & PLAN ASSIGNMENT
-    # ---------------------------------------------------
-    with st.expander("Payment & Plan Assignment", expanded=False):
-        st.write("Select a payment schedule and see which plan we recommend.")
-        discount_enabled = pricing.get("discounts_enabled", True)
-        global_discount_rate = pricing.get("global_discount_rate", 10)
-        plan_options_label = ["3 Months (Monthly)", "12 Months Upfront"]
-
-        pay_col, _ = st.columns([3,1])
-        with pay_col:
-            payment_option = st.radio(
-                "Select Payment Period",
-                plan_options_label,
-                help="""
+_HELP_PAY = """
 **What does this mean?**  
 - "3 Months (Monthly)": A shorter-term commitment; you pay monthly with a three-month minimum.  
 - "12 Months Upfront": Pay for a full year in one go, usually at a discounted rate.
@@ -1069,9 +1290,250 @@ Offer support and interactions in more languages than the default plan includes.
 **Example:**  
 - If you prefer flexibility, choose "3 Months (Monthly)".  
 - If you want to save costs overall and don't mind paying upfront, choose "12 Months Upfront."
-                """
+"""
+
+_HELP_CURRENCY = """
+**What does this mean?**  
+Pick the currency you want your amounts to be shown in.  
+
+**Example:**  
+- If you operate in the United States, choose "USD". 
+- If you work in Europe, choose "EUR".
+"""
+
+# Session keys the Plan Assignment tab expects before its widgets render
+# (all but the two estimates are the widget keys themselves)
+PLAN_ASSIGNMENT_DEFAULTS = {
+    "estimated_messages": 3000,
+    "estimated_minutes": 200,
+    "pa_msg_conversations": 3000,
+    "pa_avg_msgs_per_convo": 5,
+    "pa_calls_per_month": 500,
+    "pa_avg_call_duration": 3.0,
+    "client_desired_agents": 0,
+    "client_crm_choice": "askAYYI CRM",
+    "client_communication_type": "Both Messages & Voice",
+    "client_payment_option": "3 Months (Monthly)",
+    "temp_addons_whitelabel": False,
+    "temp_addons_cv_enabled": False,
+    "temp_addons_cv_qty": 0,
+    "temp_addons_lang_enabled": False,
+    "temp_addons_lang_qty": 0,
+}
+
+# Streamlit drops a keyed widget's state on any run that does not render it
+# (another view selected); re-assigning each key every full run keeps it
+for _key, _default in PLAN_ASSIGNMENT_DEFAULTS.items():
+    st.session_state[_key] = st.session_state.get(_key, _default)
+
+# Rebuilt only when one of the displayed amounts (or the currency) changes.
+# A few static rows, so plain HTML (styled by .dataframe) instead of st.table
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_breakdown_html(monthly_cost, assistant_monthly_cost, one_time_main_setup,
+                          one_time_assistants_setup, addons_total, overage_total,
+                          agents, symbol, ex_rate, final_factor):
+    def value(zar_amount):
+        return f"{symbol}{zar_to_rounded_display(zar_amount, ex_rate, final_factor):,}"
+
+    items = ["Monthly Plan Cost"]
+    expls = ["Includes base plan, messages, and minutes"]
+    vals = [value(monthly_cost)]
+    if assistant_monthly_cost > 0:
+        items.append("Monthly Additional Assistants")
+        expls.append(f"Cost for {agents} extra assistants each month.")
+        vals.append(value(assistant_monthly_cost))
+    if one_time_main_setup > 0:
+        items.append("One-Time Setup (Main Assistant)")
+        expls.append("Setup fee for the primary assistant.")
+        vals.append(value(one_time_main_setup))
+    if one_time_assistants_setup > 0:
+        items.append("One-Time Setup (Additional Assistants)")
+        expls.append(f"Setup cost for {agents} extra assistants.")
+        vals.append(value(one_time_assistants_setup))
+    if addons_total > 0:
+        items.append("Add-Ons")
+        expls.append("White Labeling, Custom Voices, Additional Languages")
+        vals.append(value(addons_total))
+    if overage_total > 0:
+        items.append("Overage")
+        expls.append("Charged if usage exceeds included plan amounts.")
+        vals.append(value(overage_total))
+
+    rows = "".join(
+        f"<tr><td>{i}</td><td>{e}</td><td>{v}</td></tr>"
+        for i, e, v in zip(items, expls, vals)
+    )
+    return (
+        "<table class='dataframe'><thead><tr><th>Item</th><th>Explanation</th>"
+        f"<th>Value</th></tr></thead><tbody>{rows}</tbody></table>"
+    )
+
+# One reference (and one saved config) per browser session, even if the
+# session_state entry is lost; _config_data is not part of the cache key
+@st.cache_resource(show_spinner=False, max_entries=1024)
+def _issue_reference(session_id, _config_data):
+    reference_id = "REF" + str(random.randint(100000, 999999))
+    save_client_config(reference_id, _config_data)
+    return reference_id
+
+# Runs as a fragment: widget changes in this tab rerun only this function.
+# Results other tabs need (plan, usage, cost_details) go through session_state.
+@st.fragment
+def _plan_assignment_fragment():
+    st.title("Plan Assignment")
+    st.write("""
+        Determine which plan (Basic, Advanced, or Enterprise) 
+        might best fit your needs. 
+        Hover over the “?” icons to see more details and examples.
+    """)
+
+    selected_currency = st.session_state.get("selected_currency", "ZAR")
+
+    # ---------------------------------------------------
+    # ESTIMATE YOUR MONTHLY USAGE
+    # ---------------------------------------------------
+    with st.expander("Estimate Your Monthly Usage", expanded=True):
+        st.write("Enter your monthly expected usage of messages and calls. Hover over the '?' for extra guidance.")
+
+        st.markdown("#### Messages")
+        msg_conversations_per_month = st.number_input(
+            "Monthly Messaging Conversations",
+            min_value=0,
+            step=500,
+            key="pa_msg_conversations",
+            help=_HELP_CONVERSATIONS
+        )
+
+        avg_msgs_per_convo = st.number_input(
+            "Average Messages per Conversation",
+            min_value=1,
+            step=1,
+            key="pa_avg_msgs_per_convo",
+            help=_HELP_AVG_MSGS
+        )
+
+        st.markdown("#### Minutes")
+        calls_per_month = st.number_input(
+            "Number of Calls per Month",
+            min_value=0,
+            step=100,
+            key="pa_calls_per_month",
+            help=_HELP_CALLS
+        )
+
+        avg_call_duration = st.number_input(
+            "Average Call Duration (minutes)",
+            min_value=0.0,
+            step=0.5,
+            key="pa_avg_call_duration",
+            help=_HELP_DURATION
+        )
+
+        total_minutes_needed = calls_per_month * avg_call_duration
+        total_messages_needed = msg_conversations_per_month * avg_msgs_per_convo
+        st.session_state.update({
+            "estimated_minutes": total_minutes_needed,
+            "estimated_messages": total_messages_needed,
+        })
+
+    # ---------------------------------------------------
+    # CONFIGURE AGENTS
+    # ---------------------------------------------------
+    with st.expander("Configure Assistants", expanded=False):
+        st.write("How many extra AI assistants do you want, besides the main one included in some plans?")
+
+        st.number_input(
+            "Number of Additional Assistants",
+            min_value=0,
+            step=1,
+            key="client_desired_agents",
+            help=_HELP_AGENTS
+        )
+
+    # ---------------------------------------------------
+    # CRM PREFERENCE
+    # ---------------------------------------------------
+    with st.expander("CRM Preference", expanded=False):
+        st.write("Choose whether you want to use the built-in askAYYI CRM or your own existing CRM system.")
+        crm_options = ["askAYYI CRM", "Your Own CRM"]
+        st.radio(
+            "CRM Preference",
+            crm_options,
+            key="client_crm_choice",
+            help=_HELP_CRM
+        )
+
+    # ---------------------------------------------------
+    # COMMUNICATION TYPE
+    # ---------------------------------------------------
+    with st.expander("Communication Type", expanded=False):
+        st.write("Do you plan to use both messaging and voice calls, or focus on only one type of interaction?")
+        comm_options = ["Both Messages & Voice", "Just Messages", "Just Minutes"]
+        st.radio(
+            "Communication Type",
+            comm_options,
+            key="client_communication_type",
+            help=_HELP_COMM
+        )
+
+    # ---------------------------------------------------
+    # OPTIONAL ADD-ONS
+    # ---------------------------------------------------
+    with st.expander("Optional Add-Ons", expanded=False):
+        st.write("Customize your plan with White Labeling, Custom Voices, or Additional Languages.")
+        white_labeling = st.checkbox(
+            "White Labeling?", 
+            key="temp_addons_whitelabel",
+            help=_HELP_WL
+        )
+
+        # A quantity only counts while its add-on is ticked; the keyed value is
+        # kept so re-ticking restores it
+        custom_voices = st.checkbox(
+            "Custom Voices?", 
+            key="temp_addons_cv_enabled",
+            help=_HELP_CV
+        )
+        num_custom_voices = 0
+        if custom_voices:
+            num_custom_voices = st.number_input(
+                "Quantity of Custom Voices",
+                min_value=0,
+                step=1,
+                key="temp_addons_cv_qty",
+                help=_HELP_CV_QTY
             )
-        st.session_state["client_payment_option"] = payment_option
+
+        additional_languages = st.checkbox(
+            "Additional Languages?",
+            key="temp_addons_lang_enabled",
+            help=_HELP_LANG
+        )
+        num_additional_languages = 0
+        if additional_languages:
+            num_additional_languages = st.number_input(
+                "Quantity of Additional Languages",
+                min_value=0,
+                step=1,
+                key="temp_addons_lang_qty",
+                help=_HELP_LANG_QTY
+            )
+
+    # ---------------------------------------------------
+    # PAYMENT PREFERENCE & PLAN ASSIGNMENT
+    # ---------------------------------------------------
+    with st.expander("Payment & Plan Assignment", expanded=False):
+        st.write("Select a payment schedule and see which plan we recommend.")
+        discount_enabled = configs.pricing.get("discounts_enabled", True)
+        global_discount_rate = configs.pricing.get("global_discount_rate", 10)
+        plan_options_label = ["3 Months (Monthly)", "12 Months Upfront"]
+
+        payment_option = st.radio(
+            "Select Payment Period",
+            plan_options_label,
+            key="client_payment_option",
+            help=_HELP_PAY
+        )
 
         wants_own_crm = (st.session_state["client_crm_choice"] == "Your Own CRM")
         assigned_plan = assign_plan_based_on_inputs(
@@ -1090,68 +1552,77 @@ Offer support and interactions in more languages than the default plan includes.
         if assigned_plan == "Basic" and wants_own_crm:
             st.warning("Basic plan cannot accommodate Your Own CRM. (Needs an upgrade.)")
 
-        if not pricing.get("international_mode", False):
+        if not configs.pricing.get("international_mode", False):
             st.session_state["selected_currency"] = "ZAR"
         else:
-            currency_options = SUPPORTED_CURRENCIES.copy()
-            if "selected_currency" not in st.session_state:
-                st.session_state["selected_currency"] = "USD"
-            sc_col, _ = st.columns([3,1])
-            with sc_col:
-                selected_currency_box = st.selectbox(
-                    "Choose Currency (for reference)",
-                    options=currency_options,
-                    index=currency_options.index(st.session_state["selected_currency"])
-                       if st.session_state["selected_currency"] in currency_options else 0,
-                    help="""
-**What does this mean?**  
-Pick the currency you want your amounts to be shown in.  
-
-**Example:**  
-- If you operate in the United States, choose "USD". 
-- If you work in Europe, choose "EUR".
-                    """
-                )
+            currency_options = SUPPORTED_CURRENCIES
+            st.session_state.setdefault("selected_currency", "USD")
+            selected_currency_box = st.selectbox(
+                "Choose Currency (for reference)",
+                options=currency_options,
+                index=currency_options.index(st.session_state["selected_currency"])
+                   if st.session_state["selected_currency"] in currency_options else 0,
+                help=_HELP_CURRENCY
+            )
             st.session_state["selected_currency"] = selected_currency_box
 
-        plan_data = pricing["plans"].get(assigned_plan, {})
+        plan_data = configs.pricing["plans"].get(assigned_plan, {})
         usage = {
             "used_messages": st.session_state["estimated_messages"],
             "used_minutes": st.session_state["estimated_minutes"]
         }
+        opt = plan_data.get("optional_addons", {})
+        cv_cfg = opt.get("custom_voices", {})
+        lang_cfg = opt.get("additional_languages", {})
         addons = {
-            "white_labeling": st.session_state["temp_addons_whitelabel"],
+            "white_labeling": white_labeling,
             "custom_voices": {
-                "enabled": st.session_state["temp_addons_cv_enabled"],
-                "quantity": st.session_state["temp_addons_cv_qty"],
-                "cost_per_voice": plan_data.get("optional_addons", {})
-                                     .get("custom_voices", {})
-                                     .get("cost_per_voice", 0)
+                "enabled": custom_voices,
+                "quantity": num_custom_voices,
+                "cost_per_voice": cv_cfg.get("cost_per_voice", 0)
             },
             "additional_languages": {
-                "enabled": st.session_state["temp_addons_lang_enabled"],
-                "quantity": st.session_state["temp_addons_lang_qty"],
-                "cost_per_language": plan_data.get("optional_addons", {})
-                                           .get("additional_languages", {})
-                                           .get("cost_per_language", 0)
+                "enabled": additional_languages,
+                "quantity": num_additional_languages,
+                "cost_per_language": lang_cfg.get("cost_per_language", 0)
             }
         }
-        cost_details = calculate_plan_cost(
-            plan_name=assigned_plan,
-            num_agents=st.session_state["client_desired_agents"],
-            usage=usage,
-            addons=addons,
-            exchange_rates=exchange_rates,
-            selected_currency=st.session_state["selected_currency"],
-            pricing=pricing,
-            usage_limits=usage_limits,
-            communication_type=st.session_state["client_communication_type"]
-        )
-        st.session_state["client_cost_details"] = cost_details
+        # Cheap fingerprint of every cost input; when it matches the last run,
+        # reuse the stored result instead of hashing the config dicts again
+        inputs_fp = hash((
+            assigned_plan,
+            st.session_state["client_desired_agents"],
+            usage["used_messages"],
+            usage["used_minutes"],
+            json_dumps(addons),
+            st.session_state["selected_currency"],
+            configs.exchange_rates.get(st.session_state["selected_currency"], 1.0),
+            st.session_state["client_communication_type"],
+            configs.pricing_hash,
+            json_dumps(configs.usage_limits.get(assigned_plan, {}))
+        ))
+        if (st.session_state.get("_last_inputs_fp") != inputs_fp
+                or st.session_state.get("client_cost_details") is None):
+            st.session_state.update({
+                "client_cost_details": calculate_plan_cost(
+                    plan_name=assigned_plan,
+                    num_agents=st.session_state["client_desired_agents"],
+                    usage=usage,
+                    addons=addons,
+                    exchange_rates=configs.exchange_rates,
+                    selected_currency=st.session_state["selected_currency"],
+                    pricing=configs.pricing,
+                    usage_limits=configs.usage_limits,
+                    communication_type=st.session_state["client_communication_type"],
+                    pricing_hash=configs.pricing_hash
+                ),
+                "_last_inputs_fp": inputs_fp,
+            })
+        cost_details = st.session_state["client_cost_details"]
 
         symbol = CURRENCY_SYMBOLS.get(st.session_state["selected_currency"], "R")
-        monthly_cost = cost_details["total_monthly_cost"]
-        setup_cost = cost_details["total_setup_cost"]
+        monthly_cost = cost_details.total_monthly_cost
+        setup_cost = cost_details.total_setup_cost
 
         if payment_option == "12 Months Upfront" and discount_enabled:
             discount_factor = 1 - (global_discount_rate / 100.0)
@@ -1199,66 +1670,36 @@ Pick the currency you want your amounts to be shown in.
 
         st.write("---")
         st.markdown("### Cost Breakdown")
-        ex_rate = exchange_rates.get(st.session_state["selected_currency"], 1.0)
-        if st.session_state["selected_currency"] == "ZAR":
-            final_factor = 1.0
-        else:
-            final_factor = 1.3 * 1.15
-
-        def conv_zar_to_rounded_display(zar_amount):
-            unrounded = (zar_amount / ex_rate) * final_factor
-            return round_up_to_even_10(unrounded)
+        ex_rate, final_factor = currency_factors(
+            configs.exchange_rates, st.session_state["selected_currency"]
+        )
+        # Quotation reuses these instead of redoing the discount/rounding
+        st.session_state["_rendered_costs"] = {
+            "monthly_rounded": monthly_cost_rounded,
+            "setup_rounded": setup_cost_rounded,
+            "discount_factor": discount_factor,
+            "ex_rate": ex_rate,
+            "final_factor": final_factor,
+        }
 
-        final_monthly_without_cont = cost_details["final_monthly_cost_zar"] / (1 + plan_data.get('contingency_percent', 2.5)/100)
-        assistant_monthly_cost = cost_details["assistant_monthly_cost_zar"]
-        one_time_main_setup = cost_details["setup_fee_zar"]
-        one_time_assistants_setup = cost_details["setup_cost_assistants_zar"]
+        final_monthly_without_cont = cost_details.final_monthly_cost_zar / (1 + plan_data.get('contingency_percent', 2.5)/100)
+        assistant_monthly_cost = cost_details.assistant_monthly_cost_zar
+        one_time_main_setup = cost_details.setup_fee_zar
+        one_time_assistants_setup = cost_details.setup_cost_assistants_zar
         addons_total = (
-            cost_details["whitelabel_fee_zar"] +
-            cost_details["custom_voices_cost_zar"] +
-            cost_details["additional_languages_cost_zar"]
+            cost_details.whitelabel_fee_zar +
+            cost_details.custom_voices_cost_zar +
+            cost_details.additional_languages_cost_zar
         )
-        overage_total = cost_details["extra_msg_cost_zar"] + cost_details["extra_min_cost_zar"]
-
-        line_items = [{
-            "Item": "Monthly Plan Cost", 
-            "Explanation": "Includes base plan, messages, and minutes", 
-            "Value": f"{symbol}{conv_zar_to_rounded_display(cost_details['final_monthly_cost_zar']):,}"
-        }]
-
-        if assistant_monthly_cost > 0:
-            line_items.append({
-                "Item": "Monthly Additional Assistants",
-                "Explanation": f"Cost for {st.session_state['client_desired_agents']} extra assistants each month.",
-                "Value": f"{symbol}{conv_zar_to_rounded_display(assistant_monthly_cost):,}"
-            })
-        if one_time_main_setup > 0:
-            line_items.append({
-                "Item": "One-Time Setup (Main Assistant)",
-                "Explanation": "Setup fee for the primary assistant.",
-                "Value": f"{symbol}{conv_zar_to_rounded_display(one_time_main_setup):,}"
-            })
-        if one_time_assistants_setup > 0:
-            line_items.append({
-                "Item": "One-Time Setup (Additional Assistants)",
-                "Explanation": f"Setup cost for {st.session_state['client_desired_agents']} extra assistants.",
-                "Value": f"{symbol}{conv_zar_to_rounded_display(one_time_assistants_setup):,}"
-            })
-        if addons_total > 0:
-            line_items.append({
-                "Item": "Add-Ons",
-                "Explanation": "White Labeling, Custom Voices, Additional Languages",
-                "Value": f"{symbol}{conv_zar_to_rounded_display(addons_total):,}"
-            })
-        if overage_total > 0:
-            line_items.append({
-                "Item": "Overage",
-                "Explanation": "Charged if usage exceeds included plan amounts.",
-                "Value": f"{symbol}{conv_zar_to_rounded_display(overage_total):,}"
-            })
+        overage_total = cost_details.extra_msg_cost_zar + cost_details.extra_min_cost_zar
 
-        df_line_items = pd.DataFrame(line_items)
-        st.table(df_line_items[["Item", "Explanation", "Value"]])
+        breakdown_html = _build_breakdown_html(
+            cost_details.final_monthly_cost_zar, assistant_monthly_cost,
+            one_time_main_setup, one_time_assistants_setup, addons_total,
+            overage_total, st.session_state["client_desired_agents"],
+            symbol, ex_rate, final_factor
+        )
+        st.markdown(breakdown_html, unsafe_allow_html=True)
 
         st.markdown(f"""
             <div class="card chosen-plan">
@@ -1268,26 +1709,18 @@ Pick the currency you want your amounts to be shown in.
         """, unsafe_allow_html=True)
 
         st.markdown("**Compare All Plans:**")
-        plan_names = list(pricing["plans"].keys())
-        colA, colB, colC = st.columns(3)
-        for i, pn in enumerate(plan_names):
-            if i > 2:
-                break
-            col = [colA, colB, colC][i]
-            plan_class = "card chosen-plan" if pn == assigned_plan else "card"
-            p_data = pricing["plans"][pn]
-            with col:
-                st.markdown(f"<div class='{plan_class}'><h4>{pn} Plan</h4>", unsafe_allow_html=True)
-                st.markdown(
-                    f"<strong>Included Messages:</strong> {p_data.get('messages', 0):,}<br/>"
-                    f"<strong>Included Minutes:</strong> {p_data.get('voice_minutes', 0):,}",
-                    unsafe_allow_html=True
-                )
-                st.markdown("</div>", unsafe_allow_html=True)
+        plans = configs.pricing["plans"]
+        cards = "".join(
+            f"<div class='{'card chosen-plan' if pn == assigned_plan else 'card'}'>"
+            f"<h4>{pn} Plan</h4>"
+            f"<strong>Included Messages:</strong> {plans[pn].get('messages', 0):,}<br/>"
+            f"<strong>Included Minutes:</strong> {plans[pn].get('voice_minutes', 0):,}"
+            "</div>"
+            for pn in list(plans)[:3]
+        )
+        st.markdown(f"<div class='plan-compare'>{cards}</div>", unsafe_allow_html=True)
 
         if "client_reference_id" not in st.session_state:
-            reference_id = "REF" + str(random.randint(100000, 999999))
-            st.session_state["client_reference_id"] = reference_id
             config_data = {
                 "assigned_plan": assigned_plan,
                 "estimated_messages": st.session_state["estimated_messages"],
@@ -1296,15 +1729,22 @@ Pick the currency you want your amounts to be shown in.
                 "crm_choice": st.session_state["client_crm_choice"],
                 "communication_type": st.session_state["client_communication_type"]
             }
-            save_client_config(reference_id, config_data)
+            st.session_state["client_reference_id"] = _issue_reference(
+                get_script_run_ctx().session_id, config_data
+            )
 
         st.info(f"Your Quote reference: **{st.session_state['client_reference_id']}**")
         show_footer()
 
+if active_tab == TAB_LABELS[0]:
+    # Marker for the Plan Assignment CSS; only the selected view is rendered
+    st.markdown("<div class='plan-assignment-scope'></div>", unsafe_allow_html=True)
+    _plan_assignment_fragment()
+
 # =============================================================================
 # TAB 1: Main Dashboard
 # =============================================================================
-with tabs[1]:
+if active_tab == TAB_LABELS[1]:
     st.title("Main Dashboard")
     st.write("A quick overview of your current selections and usage details.")
     st.write("---")
@@ -1315,22 +1755,26 @@ with tabs[1]:
     currency_used = st.session_state.get("selected_currency", "ZAR")
     reference_id = st.session_state.get("client_reference_id", "N/A")
 
-    st.markdown(f"**Reference ID**: {reference_id}")
-    st.markdown(f"**Assigned Plan**: {assigned_plan}")
-    st.markdown(f"**Estimated Monthly Messages**: {usage_msgs:,}")
-    st.markdown(f"**Estimated Monthly Minutes**: {usage_mins:,}")
-    st.markdown(f"**Currency**: {currency_used}")
+    # One element; the trailing double spaces are markdown line breaks
+    st.markdown(
+        f"**Reference ID**: {reference_id}  \n"
+        f"**Assigned Plan**: {assigned_plan}  \n"
+        f"**Estimated Monthly Messages**: {usage_msgs:,}  \n"
+        f"**Estimated Monthly Minutes**: {usage_mins:,}  \n"
+        f"**Currency**: {currency_used}"
+    )
 
     show_footer()
 
 # =============================================================================
 # TAB 2: Quotation
 # =============================================================================
-with tabs[2]:
+if active_tab == TAB_LABELS[2]:
     st.title("Quotation")
 
     cost_details = st.session_state.get("client_cost_details", None)
-    if cost_details is None:
+    rendered = st.session_state.get("_rendered_costs")
+    if cost_details is None or rendered is None:
         st.warning("Use 'Plan Assignment' first for a quote.")
         show_footer()
         st.stop()
@@ -1346,52 +1790,37 @@ with tabs[2]:
     selected_currency = st.session_state.get("selected_currency", "ZAR")
     symbol = CURRENCY_SYMBOLS.get(selected_currency, "R")
 
-    monthly_cost_conv = cost_details["total_monthly_cost"]
-    setup_cost_conv = cost_details["total_setup_cost"]
+    monthly_cost_conv = cost_details.total_monthly_cost
+    setup_cost_conv = cost_details.total_setup_cost
     plan_duration_total_conv = (monthly_cost_conv * plan_min_duration) + setup_cost_conv
-    included_msgs = cost_details["included_msgs_after_conversion"]
-    included_mins = cost_details["included_mins_after_conversion"]
-
-    discount_enabled = pricing.get("discounts_enabled", True)
-    global_discount_rate = pricing.get("global_discount_rate", 10)
-    if payment_option == "12 Months Upfront" and discount_enabled:
-        discount_factor = 1 - (global_discount_rate / 100.0)
-    else:
-        discount_factor = 1.0
+    included_msgs = cost_details.included_msgs_after_conversion
+    included_mins = cost_details.included_mins_after_conversion
 
-    def round_up_to_even_10_local(val):
-        return math.ceil(val / 20.0) * 20
+    discount_factor = rendered["discount_factor"]
+    monthly_cost_rounded = rendered["monthly_rounded"]
+    setup_cost_rounded = rendered["setup_rounded"]
+    total_plan_duration_rounded = round_up_to_even_10(plan_duration_total_conv * discount_factor)
 
-    monthly_cost_rounded = round_up_to_even_10_local(monthly_cost_conv * discount_factor)
-    setup_cost_rounded = round_up_to_even_10_local(setup_cost_conv)
-    total_plan_duration_rounded = round_up_to_even_10_local(plan_duration_total_conv * discount_factor)
+    extra_messages_used = cost_details.extra_messages_used
+    extra_minutes_used = cost_details.extra_minutes_used
+    extra_msg_cost_zar = cost_details.extra_msg_cost_zar
+    extra_min_cost_zar = cost_details.extra_min_cost_zar
 
-    extra_messages_used = cost_details["extra_messages_used"]
-    extra_minutes_used = cost_details["extra_minutes_used"]
-    extra_msg_cost_zar = cost_details["extra_msg_cost_zar"]
-    extra_min_cost_zar = cost_details["extra_min_cost_zar"]
-
-    ex_rate = exchange_rates.get(selected_currency, 1.0)
-    if selected_currency == "ZAR":
-        final_factor = 1.0
-    else:
-        final_factor = 1.3 * 1.15
-
-    extra_msg_cost_conv = (extra_msg_cost_zar / ex_rate) * final_factor
-    extra_min_cost_conv = (extra_min_cost_zar / ex_rate) * final_factor
-    disp_extra_msg_cost = round_up_to_even_10_local(extra_msg_cost_conv)
-    disp_extra_min_cost = round_up_to_even_10_local(extra_min_cost_conv)
+    ex_rate = rendered["ex_rate"]
+    final_factor = rendered["final_factor"]
+    disp_extra_msg_cost = zar_to_rounded_display(extra_msg_cost_zar, ex_rate, final_factor)
+    disp_extra_min_cost = zar_to_rounded_display(extra_min_cost_zar, ex_rate, final_factor)
 
     num_agents = st.session_state.get("client_desired_agents", 0)
 
-    st.markdown(f"""
+    # Every card goes out in one markdown element; parts are stripped so no
+    # blank line splits the HTML block
+    parts = [f"""
     <div class="steve-jobs-style">
         <p>Hello <span class="highlight">Client</span>,</p>
         <p>We appreciate your interest in askAYYI. Below is your quotation.</p>
     </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f"""
+    """, f"""
     <div class="card">
         <h4>Monthly Cost</h4>
         <p style="font-size:1.2em;">
@@ -1399,9 +1828,7 @@ with tabs[2]:
             <br/><span style="font-size:0.85em;">(Messages, minutes, and tech support hours)</span>
         </p>
     </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f"""
+    """, f"""
     <div class="card">
         <h4>One-Time Setup</h4>
         <p style="font-size:1.2em;">
@@ -1409,15 +1836,15 @@ with tabs[2]:
             <br/><span style="font-size:0.85em;">(Covers necessary setup)</span>
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """]
 
     # Additional Assistants info
-    plan_config = pricing["plans"].get(assigned_plan, {})
+    plan_config = configs.pricing["plans"].get(assigned_plan, {})
     if num_agents > 0 and assigned_plan == "Enterprise":
         additional_opts = plan_config.get("additional_options", {})
         extra_per_agent_msg = additional_opts.get("extra_messages_per_additional_assistant", 0) * num_agents
         extra_per_agent_min = additional_opts.get("extra_minutes_per_additional_assistant", 0) * num_agents
-        st.markdown(f"""
+        parts.append(f"""
         <div class="card">
             <h4>Additional Assistant(s)</h4>
             <p style="font-size:1.2em;">
@@ -1425,23 +1852,24 @@ with tabs[2]:
                 +{extra_per_agent_msg} messages & +{extra_per_agent_min} minutes<br/>
             </p>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
     # Overage
     if extra_messages_used > 0 or extra_minutes_used > 0:
-        st.markdown(f"""
-        <div class="card">
-            <h4>Possible Overage Charges</h4>
-            <p style="font-size:1.1em;">
-        """, unsafe_allow_html=True)
+        overage_lines = []
         if extra_messages_used > 0:
-            st.markdown(f"- Extra Messages: {extra_messages_used:,} => {symbol}{disp_extra_msg_cost:,}<br/>", unsafe_allow_html=True)
+            overage_lines.append(f"- Extra Messages: {extra_messages_used:,} => {symbol}{disp_extra_msg_cost:,}")
         if extra_minutes_used > 0:
-            st.markdown(f"- Extra Minutes: {extra_minutes_used:,} => {symbol}{disp_extra_min_cost:,}", unsafe_allow_html=True)
-        st.markdown("</p></div>", unsafe_allow_html=True)
+            overage_lines.append(f"- Extra Minutes: {extra_minutes_used:,} => {symbol}{disp_extra_min_cost:,}")
+        parts.append(f"""
+        <div class="card">
+            <h4>Possible Overage Charges</h4>
+            <p style="font-size:1.1em;">{'<br/>'.join(overage_lines)}</p>
+        </div>
+        """)
 
-    st.write("---")
-    st.markdown(f"""
+    parts.append(f"""
+    <hr/>
     <div class="card">
         <h4>Total Commitment</h4>
         <p style="font-size:1.2em;">
@@ -1449,14 +1877,16 @@ with tabs[2]:
             Over {plan_min_duration} months + Setup
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
-    st.markdown(f"""
+    parts.append(f"""
     <div class="steve-jobs-style">
         <p>You have ~<span class="highlight">{included_msgs:,}</span> messages 
            and <span class="highlight">{included_mins:,}</span> minutes included each month.</p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
+
+    st.markdown("\n".join(part.strip() for part in parts), unsafe_allow_html=True)
 
     st.success("Quotation is ready! Thank you for choosing askAYYI.")
     show_footer()
@@ -1464,31 +1894,63 @@ with tabs[2]:
 # =============================================================================
 # TAB 3: Saved Configurations
 # =============================================================================
-with tabs[3]:
+# (session_state key, saved config key, default) applied on "Load Configuration"
+_LOAD_MAP = (
+    ("client_assigned_plan", "assigned_plan", "Basic"),
+    ("estimated_messages", "estimated_messages", 0),
+    ("estimated_minutes", "estimated_minutes", 0),
+    ("client_desired_agents", "desired_agents", 0),
+    ("client_crm_choice", "crm_choice", "askAYYI CRM"),
+    ("client_communication_type", "communication_type", "Both Messages & Voice"),
+)
+
+# (saved config key, session_state key, default) written by "Save Current Config";
+# cost_details is added separately because it needs asdict()
+_SAVE_FIELDS = (
+    ("assigned_plan", "client_assigned_plan", ""),
+    ("estimated_messages", "estimated_messages", 0),
+    ("estimated_minutes", "estimated_minutes", 0),
+    ("desired_agents", "client_desired_agents", 0),
+    ("crm_choice", "client_crm_choice", "askAYYI CRM"),
+    ("communication_type", "client_communication_type", "Both Messages & Voice"),
+)
+
+if active_tab == TAB_LABELS[3]:
     st.title("Saved Client Configurations by Reference")
     st.write("Load previously saved configs here.")
 
-    all_client_configs = load_client_configs()
-    if not all_client_configs:
+    references = list_client_config_refs()
+    if not references:
         st.info("No configurations saved yet.")
         show_footer()
         st.stop()
 
-    references = list(all_client_configs.keys())
-    selected_ref = st.selectbox("Choose a reference to load", options=references)
+    # The choice is kept in a plain session key: widget state is dropped while
+    # another view is selected. Nothing is read until "Load Configuration".
+    prev_ref = st.session_state.get("_prev_ref")
+    selected_ref = st.selectbox(
+        "Choose a reference to load",
+        options=references,
+        index=references.index(prev_ref) if prev_ref in references else 0
+    )
+    st.session_state["_prev_ref"] = selected_ref
 
     if st.button("Load Configuration"):
-        config_data = all_client_configs[selected_ref]
-        st.session_state["client_assigned_plan"] = config_data.get("assigned_plan", "Basic")
-        st.session_state["estimated_messages"] = config_data.get("estimated_messages", 0)
-        st.session_state["estimated_minutes"] = config_data.get("estimated_minutes", 0)
-        st.session_state["client_desired_agents"] = config_data.get("desired_agents", 0)
-        st.session_state["client_crm_choice"] = config_data.get("crm_choice", "askAYYI CRM")
-        st.session_state["client_communication_type"] = config_data.get("communication_type", "Both Messages & Voice")
-        if "cost_details" in config_data:
-            st.session_state["client_cost_details"] = config_data["cost_details"]
-            st.session_state["client_selected_plan"] = config_data.get("assigned_plan")
-        st.success(f"Configuration for reference {selected_ref} loaded. Go to Main Dashboard / Quotation to view details.")
+        config_data = load_client_config(selected_ref)
+        if config_data is None:
+            st.error(f"Configuration for reference {selected_ref} could not be found.")
+        else:
+            st.session_state.update({
+                key: config_data.get(src, default) for key, src, default in _LOAD_MAP
+            })
+            if (saved_details := config_data.get("cost_details")) is not None:
+                st.session_state["client_cost_details"] = PlanCostResult.from_dict(saved_details) if saved_details else None
+                st.session_state["client_selected_plan"] = config_data.get("assigned_plan")
+                # Saved figures replace the live ones; make Plan Assignment recompute
+                # (and Quotation wait for it, since only the selected view runs)
+                st.session_state.pop("_last_inputs_fp", None)
+                st.session_state.pop("_rendered_costs", None)
+            st.success(f"Configuration for reference {selected_ref} loaded. Open Plan Assignment to recalculate the costs; the Quotation uses its figures.")
 
     st.write("---")
     st.subheader("Save Current Session with a New Reference")
@@ -1497,15 +1959,16 @@ with tabs[3]:
         save_btn = st.form_submit_button("Save Current Config")
     if save_btn and new_ref_to_save:
         config_data = {
-            "assigned_plan": st.session_state.get("client_assigned_plan", ""),
-            "estimated_messages": st.session_state.get("estimated_messages", 0),
-            "estimated_minutes": st.session_state.get("estimated_minutes", 0),
-            "desired_agents": st.session_state.get("client_desired_agents", 0),
-            "crm_choice": st.session_state.get("client_crm_choice", "askAYYI CRM"),
-            "communication_type": st.session_state.get("client_communication_type", "Both Messages & Voice"),
-            "cost_details": st.session_state.get("client_cost_details", {})
+            dst: st.session_state.get(src, default) for dst, src, default in _SAVE_FIELDS
         }
-        save_client_config(new_ref_to_save, config_data)
+        cost_details = st.session_state.get("client_cost_details")
+        config_data["cost_details"] = asdict(cost_details) if cost_details else {}
+        # A re-submit of the same reference with unchanged content skips the write
+        save_hash = hash((new_ref_to_save, json_dumps_bytes(config_data)))
+        if (st.session_state.get("_last_saved_hash") != save_hash
+                or new_ref_to_save not in list_client_config_refs()):
+            save_client_config(new_ref_to_save, config_data)
+            st.session_state["_last_saved_hash"] = save_hash
         st.success(f"Configuration saved under reference {new_ref_to_save}!")
 
     show_footer()
@@ -1513,7 +1976,7 @@ with tabs[3]:
 # =============================================================================
 # TAB 4: Admin Dashboard
 # =============================================================================
-with tabs[4]:
+if active_tab == TAB_LABELS[4]:
     if not authenticate_admin():
         st.stop()
 
@@ -1525,32 +1988,32 @@ with tabs[4]:
         col_int1, col_int2 = st.columns([1,1])
         with col_int1:
             st.write("**International Mode**")
-            if pricing.get("international_mode", False):
+            if configs.pricing.get("international_mode", False):
                 st.success("International Mode: **ON**")
                 if st.button("Disable International Mode"):
-                    pricing["international_mode"] = False
-                    save_config(PRICING_FILE, pricing)
+                    configs.pricing["international_mode"] = False
+                    save_config(PRICING_FILE, configs.pricing)
             else:
                 st.warning("International Mode: OFF")
                 if st.button("Enable International Mode"):
-                    pricing["international_mode"] = True
-                    save_config(PRICING_FILE, pricing)
+                    configs.pricing["international_mode"] = True
+                    save_config(PRICING_FILE, configs.pricing)
 
         with col_int2:
             st.write("**Whitelabel Fee Waiver**")
-            if pricing.get("whitelabel_waved", False):
+            if configs.pricing.get("whitelabel_waved", False):
                 st.success("Whitelabel is currently WAIVED.")
                 if st.button("Stop Waiving Whitelabel"):
-                    pricing["whitelabel_waved"] = False
-                    save_config(PRICING_FILE, pricing)
+                    configs.pricing["whitelabel_waved"] = False
+                    save_config(PRICING_FILE, configs.pricing)
             else:
                 st.warning("Whitelabel is NOT waived.")
                 if st.button("Waive Whitelabel Fee"):
-                    pricing["whitelabel_waved"] = True
-                    save_config(PRICING_FILE, pricing)
+                    configs.pricing["whitelabel_waved"] = True
+                    save_config(PRICING_FILE, configs.pricing)
 
     with st.expander("Fee Waivers (Individual)", expanded=False):
-        fees_waived = pricing.get("fees_waived", {})
+        fees_waived = configs.pricing.get("fees_waived", {})
         cfee1, cfee2 = st.columns(2)
         with cfee1:
             setup_fee_waived_chk = st.checkbox("Waive Setup Fee?", value=fees_waived.get("setup_fee", False))
@@ -1560,44 +2023,44 @@ with tabs[4]:
         if st.button("Save Individual Fee Waivers"):
             fees_waived["setup_fee"] = setup_fee_waived_chk
             fees_waived["technical_support_fee"] = tech_support_fee_waived_chk
-            pricing["fees_waived"] = fees_waived
-            save_config(PRICING_FILE, pricing)
+            configs.pricing["fees_waived"] = fees_waived
+            save_config(PRICING_FILE, configs.pricing)
 
     with st.expander("Discounts Configuration", expanded=False):
         cdisc1, cdisc2 = st.columns([2,2])
         with cdisc1:
-            if pricing.get("discounts_enabled", True):
+            if configs.pricing.get("discounts_enabled", True):
                 st.success("Discounts: ENABLED")
                 if st.button("Disable Discounts"):
-                    pricing["discounts_enabled"] = False
-                    save_config(PRICING_FILE, pricing)
+                    configs.pricing["discounts_enabled"] = False
+                    save_config(PRICING_FILE, configs.pricing)
             else:
                 st.warning("Discounts: DISABLED")
                 if st.button("Enable Discounts"):
-                    pricing["discounts_enabled"] = True
-                    save_config(PRICING_FILE, pricing)
+                    configs.pricing["discounts_enabled"] = True
+                    save_config(PRICING_FILE, configs.pricing)
 
         with cdisc2:
-            current_global_discount = pricing.get("global_discount_rate", 0)
+            current_global_discount = configs.pricing.get("global_discount_rate", 0)
             new_global_discount = st.number_input("Global discount for upfront (%)",
                                                   value=float(current_global_discount),
                                                   min_value=0.0, max_value=100.0, step=1.0)
             if st.button("Update Global Discount"):
-                pricing["global_discount_rate"] = new_global_discount
-                save_config(PRICING_FILE, pricing)
+                configs.pricing["global_discount_rate"] = new_global_discount
+                save_config(PRICING_FILE, configs.pricing)
                 st.success(f"Global discount is now {new_global_discount}%")
 
     with st.expander("Exchange Rates", expanded=False):
         with st.form("exchange_rates_form"):
             exchange_rate_inputs = {}
             for currency_ in SUPPORTED_CURRENCIES:
-                current_rate = float(exchange_rates.get(currency_, DEFAULT_EXCHANGE_RATES.get(currency_, 1.0))) if currency_ != "ZAR" else 1.0
+                current_rate = float(configs.exchange_rates.get(currency_, DEFAULT_EXCHANGE_RATES.get(currency_, 1.0))) if currency_ != "ZAR" else 1.0
                 exchange_rate_inputs[currency_] = st.number_input(f"1 {currency_} = X ZAR", value=current_rate, step=0.001)
             save_exchange_rates_btn = st.form_submit_button("Save Exchange Rates")
             if save_exchange_rates_btn:
                 for ccy, rate in exchange_rate_inputs.items():
-                    exchange_rates[ccy] = rate
-                save_config(EXCHANGE_RATES_FILE, exchange_rates)
+                    configs.exchange_rates[ccy] = rate
+                save_config(EXCHANGE_RATES_FILE, configs.exchange_rates)
                 st.success("Exchange rates updated.")
 
     with st.expander("International Markups", expanded=False):
@@ -1607,25 +2070,25 @@ with tabs[4]:
             for currency_ in SUPPORTED_CURRENCIES:
                 if currency_ == "ZAR":
                     continue
-                current_markup = pricing.get("international_markups", {}).get(currency_, 30)
+                current_markup = configs.pricing.get("international_markups", {}).get(currency_, 30)
                 new_markups[currency_] = st.number_input(
                     f"Markup for {currency_} (%)",
                     value=float(current_markup), min_value=0.0, max_value=1000.0, step=1.0
                 )
             save_intl_markups_btn = st.form_submit_button("Save International Markups")
             if save_intl_markups_btn:
-                if "international_markups" not in pricing:
-                    pricing["international_markups"] = {}
+                if "international_markups" not in configs.pricing:
+                    configs.pricing["international_markups"] = {}
                 for ccy, val in new_markups.items():
-                    pricing["international_markups"][ccy] = val
-                save_config(PRICING_FILE, pricing)
+                    configs.pricing["international_markups"][ccy] = val
+                save_config(PRICING_FILE, configs.pricing)
                 st.success("International markups updated successfully.")
 
     with st.expander("Plans Configuration", expanded=False):
         st.header("Plan Configurations")
-        plan_options = list(pricing["plans"].keys())
+        plan_options = list(configs.pricing["plans"].keys())
         selected_plan = st.selectbox("Select Plan to Edit", options=plan_options)
-        plan_details = pricing["plans"][selected_plan]
+        plan_details = configs.pricing["plans"][selected_plan]
 
         st.markdown(f"### {selected_plan} - Basic Parameters")
         colp1, colp2, colp3 = st.columns(3)
@@ -1714,7 +2177,7 @@ with tabs[4]:
             new_top_up_min_multiplier = st.number_input("Top Up Min Multiplier", value=float(plan_details.get("top_up_min_multiplier", 1.0)), step=0.1)
 
         if st.button("Save Plan Configuration"):
-            p = pricing["plans"][selected_plan]
+            p = configs.pricing["plans"][selected_plan]
             p["base_fee"] = new_base_fee
             p["messages"] = new_incl_msgs
             p["voice_minutes"] = new_incl_mins
@@ -1755,15 +2218,15 @@ with tabs[4]:
             p["top_up_msg_multiplier"] = new_top_up_msg_multiplier
             p["top_up_min_multiplier"] = new_top_up_min_multiplier
 
-            save_config(PRICING_FILE, pricing)
+            save_config(PRICING_FILE, configs.pricing)
             st.success(f"Settings for {selected_plan} saved successfully!")
 
     with st.expander("Custom Payment Plans", expanded=False):
         st.write("Define custom payment plans (e.g., 6-month) with special discounts.")
-        if "custom_payment_plans" not in pricing:
-            pricing["custom_payment_plans"] = {}
+        if "custom_payment_plans" not in configs.pricing:
+            configs.pricing["custom_payment_plans"] = {}
 
-        existing_plans = pricing["custom_payment_plans"]
+        existing_plans = configs.pricing["custom_payment_plans"]
         if existing_plans:
             st.write("**Existing Custom Plans:**")
             for plan_name, plan_info in existing_plans.items():
@@ -1775,11 +2238,11 @@ with tabs[4]:
         custom_months = st.number_input("Number of Months", min_value=1, value=6)
         custom_discount = st.number_input("Discount (%)", min_value=0.0, max_value=100.0, value=5.0, step=0.5)
         if st.button("Save Custom Plan"):
-            pricing["custom_payment_plans"][custom_name] = {
+            configs.pricing["custom_payment_plans"][custom_name] = {
                 "months": custom_months,
                 "discount": custom_discount
             }
-            save_config(PRICING_FILE, pricing)
+            save_config(PRICING_FILE, configs.pricing)
             st.success(f"Custom plan '{custom_name}' saved/updated!")
 
     st.markdown("---")
@@ -1793,10 +2256,10 @@ with tabs[4]:
         st.stop()
 
     discount_percentage = 0
-    if pricing.get("discounts_enabled", True):
-        discount_percentage = pricing.get("global_discount_rate", 0)
+    if configs.pricing.get("discounts_enabled", True):
+        discount_percentage = configs.pricing.get("global_discount_rate", 0)
 
-    final_monthly_cost_with_discount_zar = cost_details["final_monthly_cost_zar"]
+    final_monthly_cost_with_discount_zar = cost_details.final_monthly_cost_zar
     discount_saved_zar = 0
     if discount_percentage > 0:
         original_revenue_zar = final_monthly_cost_with_discount_zar
@@ -1807,14 +2270,14 @@ with tabs[4]:
     plan_name = st.session_state.get("client_selected_plan", None) or st.session_state.get("client_assigned_plan", "Basic")
 
     try:
-        plan_conf = pricing["plans"][plan_name]
+        plan_conf = configs.pricing["plans"][plan_name]
     except KeyError:
         st.error(f"Plan '{plan_name}' not found.")
         show_footer()
         st.stop()
 
-    included_msgs = cost_details["included_msgs_after_conversion"]
-    included_mins = cost_details["included_mins_after_conversion"]
+    included_msgs = cost_details.included_msgs_after_conversion
+    included_mins = cost_details.included_mins_after_conversion
     base_msg_cost_zar = plan_conf.get("base_msg_cost", 0.05)
     base_min_cost_zar = plan_conf.get("base_min_cost", 0.40)
     float_cost_zar = plan_conf.get("float_cost", 0)
@@ -1831,8 +2294,8 @@ with tabs[4]:
     profit_zar = revenue_zar - our_estimated_direct_cost_zar if revenue_zar else 0
     profit_margin_pct = (profit_zar / revenue_zar * 100) if revenue_zar > 0 else 0
 
-    if cost_details["final_monthly_cost_zar"] > 0:
-        discount_ratio = (discount_saved_zar / cost_details["final_monthly_cost_zar"]) * 100
+    if cost_details.final_monthly_cost_zar > 0:
+        discount_ratio = (discount_saved_zar / cost_details.final_monthly_cost_zar) * 100
     else:
         discount_ratio = 0
 
@@ -1857,57 +2320,57 @@ with tabs[4]:
         # Setup costs
         st.markdown("**Setup Costs (One-Time)**")
         setup_items = []
-        setup_items.append(f"- **Setup Fee**: {red_zar(cost_details['setup_fee_zar'])}")
-        if cost_details["setup_cost_assistants_zar"] > 0:
-            setup_items.append(f"- **Setup for Additional Assistants**: {red_zar(cost_details['setup_cost_assistants_zar'])}")
-        if cost_details["whitelabel_fee_zar"] > 0:
-            setup_items.append(f"- **Whitelabel Setup**: {red_zar(cost_details['whitelabel_fee_zar'])}")
-        setup_items.append(f"- **Total Setup Cost**: {red_zar(cost_details['total_setup_cost_zar'])}")
+        setup_items.append(f"- **Setup Fee**: {red_zar(cost_details.setup_fee_zar)}")
+        if cost_details.setup_cost_assistants_zar > 0:
+            setup_items.append(f"- **Setup for Additional Assistants**: {red_zar(cost_details.setup_cost_assistants_zar)}")
+        if cost_details.whitelabel_fee_zar > 0:
+            setup_items.append(f"- **Whitelabel Setup**: {red_zar(cost_details.whitelabel_fee_zar)}")
+        setup_items.append(f"- **Total Setup Cost**: {red_zar(cost_details.total_setup_cost_zar)}")
         for item in setup_items:
             st.markdown(item, unsafe_allow_html=True)
 
         st.markdown("---")
         st.markdown("**Monthly Costs**")
         monthly_items = []
-        monthly_items.append(f"- **Base Fee**: {red_zar(cost_details['base_fee_zar'])}")
+        monthly_items.append(f"- **Base Fee**: {red_zar(cost_details.base_fee_zar)}")
         monthly_items.append(
-            f"- **Included Messages** ({cost_details['included_msgs_after_conversion']:,} msgs): "
-            f"{red_zar(cost_details['cost_of_included_messages_zar'])} (@ R{cost_details['final_msg_cost_zar']:.2f}/msg)"
+            f"- **Included Messages** ({cost_details.included_msgs_after_conversion:,} msgs): "
+            f"{red_zar(cost_details.cost_of_included_messages_zar)} (@ R{cost_details.final_msg_cost_zar:.2f}/msg)"
         )
         monthly_items.append(
-            f"- **Included Minutes** ({cost_details['included_mins_after_conversion']:,} mins): "
-            f"{red_zar(cost_details['cost_of_included_minutes_zar'])} (@ R{cost_details['final_min_cost_zar']:.2f}/min)"
+            f"- **Included Minutes** ({cost_details.included_mins_after_conversion:,} mins): "
+            f"{red_zar(cost_details.cost_of_included_minutes_zar)} (@ R{cost_details.final_min_cost_zar:.2f}/min)"
         )
-        if cost_details["extra_msg_cost_zar"] > 0:
-            monthly_items.append(f"- **Top Up - Extra Messages**: {red_zar(cost_details['extra_msg_cost_zar'])}")
-        if cost_details["extra_min_cost_zar"] > 0:
-            monthly_items.append(f"- **Top Up - Extra Minutes**: {red_zar(cost_details['extra_min_cost_zar'])}")
-        if cost_details["technical_support_cost_zar"] > 0:
+        if cost_details.extra_msg_cost_zar > 0:
+            monthly_items.append(f"- **Top Up - Extra Messages**: {red_zar(cost_details.extra_msg_cost_zar)}")
+        if cost_details.extra_min_cost_zar > 0:
+            monthly_items.append(f"- **Top Up - Extra Minutes**: {red_zar(cost_details.extra_min_cost_zar)}")
+        if cost_details.technical_support_cost_zar > 0:
             monthly_items.append(
-                f"- **Technical Support**: {red_zar(cost_details['technical_support_cost_zar'])} "
-                f"({cost_details['technical_support_hours']} hrs @ R{cost_details['technical_support_hourly_rate']:,}/hr)"
+                f"- **Technical Support**: {red_zar(cost_details.technical_support_cost_zar)} "
+                f"({cost_details.technical_support_hours} hrs @ R{cost_details.technical_support_hourly_rate:,}/hr)"
             )
         if plan_conf.get("float_cost", 0) > 0:
             monthly_items.append(f"- **Float Cost**: {red_zar(plan_conf['float_cost'])}")
-        if cost_details["custom_voices_cost_zar"] > 0:
-            monthly_items.append(f"- **Custom Voices**: {red_zar(cost_details['custom_voices_cost_zar'])}")
-        if cost_details["additional_languages_cost_zar"] > 0:
-            monthly_items.append(f"- **Additional Languages**: {red_zar(cost_details['additional_languages_cost_zar'])}")
-        if cost_details["assistant_monthly_cost_zar"] > 0:
-            monthly_items.append(f"- **Monthly Additional Assistants**: {red_zar(cost_details['assistant_monthly_cost_zar'])}")
-
-        contingency_base = cost_details["final_monthly_cost_zar"] / (1 + plan_conf.get('contingency_percent', 2.5)/100)
+        if cost_details.custom_voices_cost_zar > 0:
+            monthly_items.append(f"- **Custom Voices**: {red_zar(cost_details.custom_voices_cost_zar)}")
+        if cost_details.additional_languages_cost_zar > 0:
+            monthly_items.append(f"- **Additional Languages**: {red_zar(cost_details.additional_languages_cost_zar)}")
+        if cost_details.assistant_monthly_cost_zar > 0:
+            monthly_items.append(f"- **Monthly Additional Assistants**: {red_zar(cost_details.assistant_monthly_cost_zar)}")
+
+        contingency_base = cost_details.final_monthly_cost_zar / (1 + plan_conf.get('contingency_percent', 2.5)/100)
         monthly_items.append(f"- **Subtotal (Before Contingency)**: {red_zar(contingency_base)}")
         monthly_items.append(f"- **Contingency** ({plan_conf.get('contingency_percent', 2.5)}%): included")
-        monthly_items.append(f"- **Final Monthly Cost**: {red_zar(cost_details['final_monthly_cost_zar'])}")
-        monthly_items.append(f"- **Monthly + Add-Ons**: {red_zar(cost_details['total_monthly_cost_zar'])}")
+        monthly_items.append(f"- **Final Monthly Cost**: {red_zar(cost_details.final_monthly_cost_zar)}")
+        monthly_items.append(f"- **Monthly + Add-Ons**: {red_zar(cost_details.total_monthly_cost_zar)}")
 
         for mitem in monthly_items:
             st.markdown(mitem, unsafe_allow_html=True)
 
         st.markdown("---")
         st.markdown(
-            f"**Total Setup + 1 Month**: {red_zar(cost_details['total_setup_cost_zar'] + cost_details['total_monthly_cost_zar'])}",
+            f"**Total Setup + 1 Month**: {red_zar(cost_details.total_setup_cost_zar + cost_details.total_monthly_cost_zar)}",
             unsafe_allow_html=True
         )
 
@@ -1916,14 +2379,18 @@ with tabs[4]:
 ###############################################################################
 # TAB 5: Your Current Costs (exactly as you provided)
 ###############################################################################
-with tabs[5]:
+if active_tab == TAB_LABELS[5]:
+    # Internal views: with st.tabs these only rendered past the admin login
+    if not st.session_state.get("password_correct"):
+        st.info("Log in on the Admin Dashboard first.")
+        st.stop()
     # ---------------------------
     # Title: "Your Current Costs"
     # ---------------------------
     st.title("Your Current Costs")
 
     # Grab the current setting from your pricing config:
-    international_mode = pricing.get("international_mode", False)
+    international_mode = configs.pricing.get("international_mode", False)
 
     # -------------------------------------------------------------------------
     # (A) Decide which currencies to show (if any), and set st.session_state
@@ -2335,11 +2802,11 @@ with tabs[5]:
         monthly_total_current_zar = monthly_personnel + monthly_technology + monthly_facility + monthly_misc
 
         # Conversion factor
-        ex_rate = exchange_rates.get(selected_currency, 1.0)
+        ex_rate = configs.exchange_rates.get(selected_currency, 1.0)
         if not international_mode:
             final_factor = 1.0
         else:
-            final_factor = 1.3 * 1.15
+            final_factor = NON_ZAR_FINAL_FACTOR
 
         monthly_total_current_converted = (monthly_total_current_zar / ex_rate) * final_factor
         once_off_current_converted = (once_off_current_zar / ex_rate) * final_factor
@@ -2419,8 +2886,8 @@ with tabs[5]:
         if not askAYYI_details:
             st.warning("No askAYYI plan info found. Go to 'Plan Assignment' first.")
         else:
-            included_msgs_ask = askAYYI_details.get("included_msgs_after_conversion", 0)
-            included_mins_ask = askAYYI_details.get("included_mins_after_conversion", 0)
+            included_msgs_ask = askAYYI_details.included_msgs_after_conversion
+            included_mins_ask = askAYYI_details.included_mins_after_conversion
 
             st.markdown("---")
             st.subheader("Comparison with askAYYI")
@@ -2440,8 +2907,8 @@ with tabs[5]:
                 </div>
             """, unsafe_allow_html=True)
 
-            askAYYI_monthly = askAYYI_details.get("total_monthly_cost", 0)
-            askAYYI_setup = askAYYI_details.get("total_setup_cost", 0)
+            askAYYI_monthly = askAYYI_details.total_monthly_cost
+            askAYYI_setup = askAYYI_details.total_setup_cost
             disp_askAYYI_monthly = round_up_custom(askAYYI_monthly)
             disp_askAYYI_setup = round_up_custom(askAYYI_setup)
 
@@ -2491,7 +2958,10 @@ with tabs[5]:
 ###############################################################################
 # TAB 6: Cost & Sales Breakdown (extremely comprehensive)
 ###############################################################################
-with tabs[6]:
+if active_tab == TAB_LABELS[6]:
+    if not st.session_state.get("password_correct"):
+        st.info("Log in on the Admin Dashboard first.")
+        st.stop()
     st.title("Cost & Sales Breakdown (Comprehensive)")
 
     # 1. Grab your usage from session
@@ -2519,8 +2989,8 @@ with tabs[6]:
     st.write("---")
 
     # 5. Show the final monthly & setup from askAYYI (the assigned plan)
-    askAYYI_monthly_cost = cost_details.get("total_monthly_cost", 0)
-    askAYYI_setup_cost = cost_details.get("total_setup_cost", 0)
+    askAYYI_monthly_cost = cost_details.total_monthly_cost
+    askAYYI_setup_cost = cost_details.total_setup_cost
 
     # Round them for display
     from math import ceil
@@ -2538,8 +3008,8 @@ with tabs[6]:
         st.metric("Setup (approx)", f"{symbol}{disp_ask_setup:,}")
 
     # 6. Compare to your "Current Costs" if available
-    final_factor = 1.3 * 1.15 if pricing.get("international_mode", False) else 1.0
-    ex_rate = exchange_rates.get(selected_currency, 1.0)
+    final_factor = NON_ZAR_FINAL_FACTOR if configs.pricing.get("international_mode", False) else 1.0
+    ex_rate = configs.exchange_rates.get(selected_currency, 1.0)
     cc_monthly_converted = (cc_monthly_zar / ex_rate) * final_factor
     cc_onceoff_converted = (cc_onceoff_zar / ex_rate) * final_factor
     disp_cc_monthly = round_up_10(cc_monthly_converted)
@@ -2563,34 +3033,30 @@ with tabs[6]:
                     "custom_voices": {"enabled": False, "quantity": 0, "cost_per_voice": 0},
                     "additional_languages": {"enabled": False, "quantity": 0, "cost_per_language": 0}}
 
-    def plan_cost_short(plan_name):
-        # Re-use your existing `calculate_plan_cost` function (assume we have it in scope)
-        # Or replicate minimal logic here. We'll assume you have the function imported.
-        result = calculate_plan_cost(
-            plan_name=plan_name,
-            num_agents=0,  # for quick comparison
-            usage={"used_messages": usage_msgs, "used_minutes": usage_mins},
-            addons=dummy_addons,
-            exchange_rates=exchange_rates,
-            selected_currency=selected_currency,
-            pricing=pricing,
-            usage_limits=usage_limits,
-            communication_type="Both Messages & Voice"
-        )
-        mcost = result["total_monthly_cost"]
-        scost = result["total_setup_cost"]
-        return (mcost, scost, result["included_msgs_after_conversion"], result["included_mins_after_conversion"])
+    # One vectorized pass over every plan instead of one call per plan
+    plan_names_all = list(configs.pricing["plans"].keys())
+    batch = calculate_plan_costs_batch(
+        plan_names=plan_names_all,
+        num_agents=0,  # for quick comparison
+        usage={"used_messages": usage_msgs, "used_minutes": usage_mins},
+        addons=dummy_addons,
+        exchange_rates=configs.exchange_rates,
+        selected_currency=selected_currency,
+        pricing=configs.pricing,
+        usage_limits=configs.usage_limits,
+        communication_type="Both Messages & Voice",
+        pricing_hash=configs.pricing_hash
+    )
 
     # Build a table-like display
     plan_rows = []
-    for pnm in pricing["plans"].keys():
-        mcost, scost, incl_msgs, incl_mins = plan_cost_short(pnm)
+    for i, pnm in enumerate(plan_names_all):
         plan_rows.append({
             "Plan": pnm,
-            "Included Msgs": incl_msgs,
-            "Included Mins": incl_mins,
-            "Monthly": round_up_10(mcost),
-            "Setup": round_up_10(scost)
+            "Included Msgs": batch["included_msgs_after_conversion"][i].item(),
+            "Included Mins": batch["included_mins_after_conversion"][i].item(),
+            "Monthly": round_up_10(batch["total_monthly_cost"][i]),
+            "Setup": round_up_10(batch["total_setup_cost"][i])
         })
 
     df_plans = pd.DataFrame(plan_rows)